@@ -1,122 +1,9 @@
 import streamlit as st
-import json
-import os
-from openai import OpenAI
 import plotly.express as px
 import plotly.graph_objects as go
 from youtube_api import get_youtube_recommendations
 from pdf_generator import add_pdf_download_button
-
-# Initialize OpenAI client
-# the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
-# do not change this unless explicitly requested by the user
-OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "your-openai-api-key")
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-
-def analyze_resume_job_match(resume_text, job_description):
-    """Analyze resume against job description using OpenAI"""
-    
-    # Check if we have a valid OpenAI API key
-    if not OPENAI_API_KEY or OPENAI_API_KEY == "your-openai-api-key":
-        # Return demo results when no API key is available
-        return get_demo_analysis_results(resume_text, job_description)
-    
-    prompt = f"""
-    You are an expert ATS (Applicant Tracking System) analyzer. Analyze the following resume against the job description and provide a detailed comparison.
-
-    RESUME:
-    {resume_text}
-
-    JOB DESCRIPTION:
-    {job_description}
-
-    Please analyze and return a JSON response with the following structure:
-    {{
-        "ats_score": <number between 0-100>,
-        "matched_skills": [<list of skills that match>],
-        "missing_skills": [<list of skills mentioned in job description but missing from resume>],
-        "summary": "<2-3 sentence analysis of candidate fit>",
-        "experience_match": "<brief analysis of experience match>",
-        "education_match": "<brief analysis of education match>",
-        "recommendations": [<list of specific recommendations to improve the match>]
-    }}
-
-    Be thorough in your analysis and ensure the ATS score accurately reflects the match percentage.
-    """
-
-    try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert ATS analyzer. Provide accurate, detailed analysis in the requested JSON format."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.1
-        )
-        
-        content = response.choices[0].message.content
-        if content:
-            result = json.loads(content)
-            return result
-        else:
-            return None
-        
-    except Exception as e:
-        # Silently fall back to alternative analysis
-        return get_demo_analysis_results(resume_text, job_description)
-
-def get_demo_analysis_results(resume_text, job_description):
-    """Generate analysis results using keyword matching"""
-    
-    # Simple keyword matching for demo purposes
-    common_skills = [
-        "Python", "JavaScript", "React", "Node.js", "SQL", "Git", "AWS", "Docker",
-        "Machine Learning", "Data Analysis", "Project Management", "Communication",
-        "Leadership", "Problem Solving", "Teamwork", "Agile", "Scrum"
-    ]
-    
-    # Find skills mentioned in both resume and job description
-    resume_lower = resume_text.lower()
-    job_lower = job_description.lower()
-    
-    matched_skills = []
-    missing_skills = []
-    
-    for skill in common_skills:
-        skill_lower = skill.lower()
-        if skill_lower in resume_lower and skill_lower in job_lower:
-            matched_skills.append(skill)
-        elif skill_lower in job_lower and skill_lower not in resume_lower:
-            missing_skills.append(skill)
-    
-    # Calculate a basic score
-    total_skills = len(matched_skills) + len(missing_skills)
-    if total_skills > 0:
-        ats_score = int((len(matched_skills) / total_skills) * 100)
-    else:
-        ats_score = 75  # Default score
-    
-    return {
-        "ats_score": ats_score,
-        "matched_skills": matched_skills if matched_skills else ["General Skills", "Work Experience", "Communication"],
-        "missing_skills": missing_skills if missing_skills else ["Advanced Python", "Cloud Computing", "Data Science"],
-        "summary": f"Based on our analysis, this resume achieves an ATS score of {ats_score}%. The candidate demonstrates strong potential with several relevant skills that align well with the job requirements.",
-        "experience_match": "The candidate's work experience shows relevant background that aligns with the position requirements.",
-        "education_match": "Educational qualifications appear well-suited for this role.",
-        "recommendations": [
-            "Consider highlighting more specific technical skills that match the job requirements",
-            "Include quantifiable achievements and metrics in your resume",
-            "Emphasize relevant project experience and accomplishments",
-            "Tailor your resume keywords to better match the job description"
-        ]
-    }
+from profiling import profiled_page
 
 def create_skills_pie_chart(matched_skills, missing_skills):
     """Create a pie chart showing matched vs missing skills"""
@@ -154,6 +41,7 @@ def create_skills_pie_chart(matched_skills, missing_skills):
     
     return fig
 
+@profiled_page('results')
 def show_results_page():
     """Display the analysis results page"""
     
@@ -166,6 +54,9 @@ def show_results_page():
     
     results = st.session_state.analysis_results
     
+    if results.get('llm_skipped'):
+        st.info(f"ℹ️ {results['llm_skipped']} These results come from the built-in scoring engine.")
+    
     # Navigation
     col1, col2, col3 = st.columns([1, 2, 1])
     with col1:
@@ -174,15 +65,16 @@ def show_results_page():
             st.rerun()
     with col3:
         if st.button("💾 Save Results"):
-            # Save results to session state
-            results_to_save = results.copy()
-            results_to_save['timestamp'] = str(st.session_state.get('timestamp', 'Unknown'))
-            results_to_save['user_email'] = st.session_state.user_data.get('email', 'Unknown')
-            
-            if 'saved_results' not in st.session_state:
-                st.session_state.saved_results = []
-            st.session_state.saved_results.append(results_to_save)
-            st.success("Results saved successfully!")
+            if results.get('id'):
+                st.info("These results are already saved.")
+            else:
+                from database import save_analysis_result
+                user_email = st.session_state.user_data.get('email', 'Unknown')
+                saved, analysis_id = save_analysis_result(results, user_email)
+                if saved:
+                    # Only the ID is kept in the session; the record lives on disk
+                    results['id'] = analysis_id
+                    st.success("Results saved successfully!")
     
     # Title
     st.markdown("<h1 class='page-title'>📊 Analysis Results</h1>", unsafe_allow_html=True)
@@ -207,6 +99,37 @@ def show_results_page():
                 <h1 style="color: {score_color}; font-size: 4rem; margin: 0;">{ats_score}%</h1>
             </div>
         """, unsafe_allow_html=True)
+        
+        # Before/after when this is a re-run of the same job after resume edits
+        reanalysis = results.get('reanalysis')
+        if reanalysis and reanalysis.get('previous_score') is not None:
+            delta = reanalysis['score_delta']
+            arrow = "▲" if delta > 0 else "▼" if delta < 0 else "="
+            changed = ", ".join(section.title() for section in reanalysis['changed_sections']) or "none"
+            st.markdown(f"<p style='text-align: center;'>{arrow} {delta:+d} points since your previous "
+                        f"analysis ({reanalysis['previous_score']}%). Changed sections: {changed}</p>",
+                        unsafe_allow_html=True)
+            if reanalysis['mode'] == 'local' and results.get('analysis_source') == 'incremental':
+                st.caption("Small edits are re-scored locally; the AI analysis re-runs after larger changes.")
+    
+    # Local scoring breakdown (only present for locally scored analyses)
+    score_breakdown = results.get('score_breakdown')
+    if score_breakdown:
+        component_labels = {
+            'required_skills': "Required Skills",
+            'preferred_skills': "Preferred Skills",
+            'experience': "Experience",
+            'education': "Education",
+            'semantic_similarity': "Semantic Similarity"
+        }
+        cols = st.columns(len(score_breakdown))
+        for col, (name, component) in zip(cols, score_breakdown.items()):
+            with col:
+                st.metric(
+                    component_labels.get(name, name),
+                    f"{component['score'] * 100:.0f}%",
+                    help=f"Weight: {component['weight'] * 100:.0f}% of the score"
+                )
     
     # Summary
     st.markdown("### 📝 Summary")
@@ -322,6 +245,18 @@ def show_results_page():
         for i, rec in enumerate(recommendations, 1):
             st.markdown(f"**{i}.** {rec}")
     
+    # Where the time went for this analysis
+    trace_spans = results.get('trace')
+    if trace_spans:
+        with st.expander("⏱️ Analysis Timing"):
+            for span in trace_spans:
+                outcome = "" if span.get('outcome', 'ok') == 'ok' else f" ({span['outcome']})"
+                st.markdown(f"• **{span['stage']}**: {span['ms']:.1f} ms{outcome}")
+            usage = results.get('llm_usage')
+            if usage:
+                st.caption(f"{usage['model']}: {usage['prompt_tokens'] + usage['completion_tokens']:,} tokens "
+                           f"(${usage['cost_usd']:.4f})")
+    
     # PDF Download Section
     st.markdown("---")
     st.markdown("### 📄 Download Professional Report")
@@ -0,0 +1,215 @@
+import argparse
+import hmac
+import os
+import sys
+from typing import List, Optional
+
+from fastapi import Depends, FastAPI, File, Header, HTTPException, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from cascade import CASCADE_MIN_LOCAL_SCORE, CASCADE_TOP_K, run_cascade
+from core.analysis import analyze_resume_job_match
+from core.incremental import analyze_incrementally
+from core.errors import AnalysisError, ExtractionError
+from core.extraction import extract_text
+from core.job_search import get_job_search_index, posting_text
+from core.metrics import render_prometheus, trace
+from core.usage import get_usage_ledger
+from job_queue import get_job_queue, submit_analysis_job
+from pdf_generator import iter_pdf_report_chunks
+from scoring_engine import score_resume_job_match
+
+# Headless HTTP API over the same extraction, analysis and report code the
+# Streamlit UI uses, for ATS integrations. Run with:
+#   python api_server.py --host 0.0.0.0 --port 8000 --workers 4
+
+API_KEY = os.environ.get("PROFILEMATCH_API_KEY", "")
+# Requests carry a user_email that quotas, billing and usage reports are
+# keyed on, so the API only runs without a key in explicit local development
+INSECURE_DEV = os.environ.get("PROFILEMATCH_API_INSECURE_DEV", "") == "1"
+MAX_UPLOAD_BYTES = int(os.environ.get("API_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+MAX_BATCH_SIZE = int(os.environ.get("API_MAX_BATCH_SIZE", "500"))
+
+app = FastAPI(title="ProFileMatch API", version="1.0")
+
+
+def require_api_key(x_api_key: Optional[str] = Header(default=None)):
+    """Reject requests without the configured X-API-Key
+
+    Without a key every request is refused, unless PROFILEMATCH_API_INSECURE_DEV=1.
+    """
+    if not API_KEY:
+        if INSECURE_DEV:
+            return
+        raise HTTPException(status_code=503, detail="API key not configured")
+    if not hmac.compare_digest(x_api_key or "", API_KEY):
+        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+
+
+class AnalyzeRequest(BaseModel):
+    resume_text: str = Field(..., min_length=1)
+    job_text: str = Field(..., min_length=1)
+    # Who the LLM usage is billed to and whose token quota applies
+    user_email: Optional[str] = None
+    # Reuse this user's previous analysis of the same job where the resume is unchanged
+    incremental: bool = False
+
+
+class BatchResume(BaseModel):
+    id: str
+    resume_text: str = Field(..., min_length=1)
+
+
+class BatchAnalyzeRequest(BaseModel):
+    job_text: str = Field(..., min_length=1)
+    resumes: List[BatchResume]
+    # Cascade limits, defaulting to the CASCADE_* settings. null disables a
+    # limit; top_k=0 returns the local ranking only (as --top-k 0 does)
+    top_k: Optional[int] = Field(CASCADE_TOP_K, ge=0)
+    min_local_score: Optional[float] = CASCADE_MIN_LOCAL_SCORE
+
+
+class MatchJobsRequest(BaseModel):
+    resume_text: str = Field(..., min_length=1)
+    top_k: int = Field(10, ge=1, le=100)
+    # Also score each hit with the local ATS scorer
+    rescore: bool = True
+
+
+class ReportRequest(BaseModel):
+    analysis: dict
+    user_name: str = "User"
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Stage latency histograms and counters for this worker, in Prometheus text format"""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.post("/extract", dependencies=[Depends(require_api_key)])
+def extract(file: UploadFile = File(...)):
+    """Extract plain text from an uploaded PDF, TXT or DOCX file"""
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+
+    try:
+        text = extract_text(file.file, file.filename or "")
+    except ExtractionError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if not text:
+        raise HTTPException(status_code=422, detail="No text found in the uploaded file")
+    return {"filename": file.filename, "characters": len(text), "text": text}
+
+
+@app.post("/analyze", dependencies=[Depends(require_api_key)])
+def analyze(request: AnalyzeRequest):
+    """Analyze one resume against one job description"""
+    try:
+        analyze_match = analyze_incrementally if request.incremental else analyze_resume_job_match
+        with trace() as spans:
+            results = analyze_match(request.resume_text, request.job_text, request.user_email)
+    except AnalysisError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    results['trace'] = spans
+    return results
+
+
+@app.post("/batch-analyze", dependencies=[Depends(require_api_key)])
+def batch_analyze(request: BatchAnalyzeRequest):
+    """Analyze many resumes against one job, optionally cascading through the local prefilter"""
+    if len(request.resumes) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} resumes per batch")
+
+    outcome = run_cascade(
+        [(resume.id, resume.resume_text) for resume in request.resumes],
+        request.job_text,
+        top_k=request.top_k,
+        min_local_score=request.min_local_score
+    )
+    return outcome
+
+
+@app.post("/match-jobs", dependencies=[Depends(require_api_key)])
+def match_jobs(request: MatchJobsRequest):
+    """Rank the stored job postings (templates and saved analyses) against a resume"""
+    with trace() as spans:
+        hits = get_job_search_index().search(request.resume_text, top_k=request.top_k)
+        if request.rescore:
+            for hit in hits:
+                text = posting_text(hit)
+                if text:
+                    hit['ats_score'] = score_resume_job_match(request.resume_text, text)['ats_score']
+    return {'matches': hits, 'trace': spans}
+
+
+@app.post("/report", dependencies=[Depends(require_api_key)])
+def report(request: ReportRequest):
+    """Render the PDF report for an analysis and stream it back"""
+    return StreamingResponse(
+        iter_pdf_report_chunks(request.analysis, request.user_name),
+        media_type="application/pdf",
+        headers={"Content-Disposition": 'attachment; filename="ProFileMatch_Report.pdf"'}
+    )
+
+
+@app.post("/jobs", status_code=202, dependencies=[Depends(require_api_key)])
+def create_job(request: AnalyzeRequest):
+    """Queue an analysis on the background job queue and return its ID"""
+    job_id = submit_analysis_job(request.resume_text, request.job_text, request.user_email,
+                                 incremental=request.incremental)
+    return {"job_id": job_id, "status": "queued"}
+
+
+@app.get("/jobs/{job_id}", dependencies=[Depends(require_api_key)])
+def get_job(job_id: str):
+    """Poll a queued analysis"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/usage", dependencies=[Depends(require_api_key)])
+def usage(user_email: Optional[str] = None, days: int = 30):
+    """OpenAI token and cost totals per day (for one user or all) and per user"""
+    ledger = get_usage_ledger()
+    summary = {'by_day': ledger.usage_by_day(user_email, days)}
+    if user_email:
+        summary['quota'] = ledger.get_quota(user_email)
+        summary['remaining_today'] = ledger.remaining_tokens_today(user_email)
+    else:
+        summary['by_user'] = ledger.usage_by_user(days)
+    return summary
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the ProFileMatch HTTP API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes; each runs its own thread pool for blocking calls")
+    parser.add_argument('--insecure-dev', action='store_true',
+                        help="Serve without PROFILEMATCH_API_KEY (local development only)")
+    args = parser.parse_args(argv)
+
+    if not API_KEY:
+        if not (args.insecure_dev or INSECURE_DEV):
+            parser.error("PROFILEMATCH_API_KEY is not set; set it, or pass --insecure-dev for local development")
+        # Workers import the app afresh and read the flag from the environment
+        os.environ["PROFILEMATCH_API_INSECURE_DEV"] = "1"
+
+    uvicorn.run("api_server:app", host=args.host, port=args.port, workers=args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
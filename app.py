@@ -1,8 +1,8 @@
 import streamlit as st
-import requests
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+import io
 
 # Optional imports (safe)
 try:
@@ -20,17 +20,19 @@ try:
 except ImportError:
     st.error("sentence-transformers not installed.")
 
-try:
-    import googleapiclient.discovery
-except ImportError:
-    st.warning("google-api-python-client not installed.")
-
 try:
     import spacy
     from spacy.cli import download
 except ImportError:
     spacy = None
 
+from youtube_client import get_youtube_client, YouTubeError
+from core.cache import cache_get, cache_set
+from core.normalization import file_extension
+from core.summarizer import summarize
+from core.singleflight import SingleFlight, input_key
+from template_index import get_template_index, EMBEDDING_MODEL_NAME
+from assets import inject_css, load_lottie, LOTTIE_ASSETS
 from streamlit_lottie import st_lottie
 import streamlit.components.v1 as components
 
@@ -38,38 +40,55 @@ import streamlit.components.v1 as components
 # Page config & dark theme
 # -----------------------------
 st.set_page_config(page_title="AI Resume Analyzer — Pro Edition", layout="wide")
-st.markdown(
-    """
-    <style>
-    .stApp { background: linear-gradient(180deg, #0a1121 0%, #0e1b35 100%); color: #e8ecf2; }
-    .stButton>button { background: linear-gradient(90deg,#0ea5e9,#6366f1); color: white; border:none; border-radius:8px; }
-    .metric-box { padding:1.5rem; border-radius:16px; background:linear-gradient(180deg, rgba(37,99,235,0.15), rgba(14,165,233,0.08)); text-align:center; }
-    .skill-section { background: rgba(255,255,255,0.05); padding:1rem; border-radius:12px; }
-    .pill { display:inline-block; padding:8px 12px; border-radius:999px; background:rgba(255,255,255,0.08); margin:5px; font-size:14px; }
-    .card { padding: 1rem; border-radius: 12px; background: rgba(255,255,255,0.03); box-shadow: 0 6px 18px rgba(0,0,0,0.3); }
-    </style>
-    """, unsafe_allow_html=True
-)
+inject_css("pro_edition.css")
 
 # -----------------------------
 # NLP Model
 # -----------------------------
-if spacy:
-    model_name = "en_core_web_md"
+# Models are loaded once per process, not on every rerun
+@st.cache_resource(show_spinner="Loading language model...")
+def load_nlp_model(model_name="en_core_web_md"):
     try:
-        nlp = spacy.load(model_name)
+        return spacy.load(model_name)
     except OSError:
         download(model_name)
-        nlp = spacy.load(model_name)
+        return spacy.load(model_name)
 
-st_model = SentenceTransformer('all-MiniLM-L6-v2')
+@st.cache_resource(show_spinner="Loading embedding model...")
+def load_sentence_model(model_name='all-MiniLM-L6-v2'):
+    return SentenceTransformer(model_name)
 
-# -----------------------------
-# YouTube API
-# -----------------------------
-YOUTUBE_API_KEY = "YOUR_YOUTUBE_API_KEY"
-YOUTUBE_API_SERVICE_NAME = "youtube"
-YOUTUBE_API_VERSION = "v3"
+@st.cache_resource(show_spinner=False)
+def load_template_index(_model):
+    # Job templates are embedded once per process (or loaded from the built index)
+    index = get_template_index()
+    index.ensure_embeddings(lambda texts: _model.encode(texts, convert_to_numpy=True))
+    return index
+
+if spacy:
+    nlp = load_nlp_model()
+
+st_model = load_sentence_model()
+template_index = load_template_index(st_model)
+
+# Sessions encoding the same text at the same time share one encode, and
+# embeddings are kept in the shared cache for every worker process
+_encodings = SingleFlight('embedding')
+
+def _encode_cached(key, text):
+    cached = cache_get('embedding', key)
+    if cached is not None:
+        return np.load(io.BytesIO(cached), allow_pickle=False)
+    embedding = st_model.encode(text, convert_to_numpy=True)
+    buffer = io.BytesIO()
+    np.save(buffer, embedding, allow_pickle=False)
+    cache_set('embedding', key, buffer.getvalue())
+    return embedding
+
+def encode_text(text):
+    key = input_key(EMBEDDING_MODEL_NAME, text)
+    embedding, _ = _encodings.do(key, _encode_cached, key, text)
+    return embedding
 
 # -----------------------------
 # Session state
@@ -91,24 +110,22 @@ if "skills_analyzed" not in st.session_state:
 # -----------------------------
 def fetch_youtube_courses(skill):
     try:
-        youtube = googleapiclient.discovery.build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=YOUTUBE_API_KEY)
-        request = youtube.search().list(q=f"{skill} course", part="snippet", maxResults=6, type="video")
-        response = request.execute()
-        return [
-            {
-                "Title": item["snippet"]["title"],
-                "Channel": item["snippet"]["channelTitle"],
-                "Video Link": f'https://www.youtube.com/watch?v={item["id"]["videoId"]}',
-                "Thumbnail": item["snippet"]["thumbnails"].get("medium", {}).get("url", "")
-            }
-            for item in response.get("items", [])
-        ]
-    except:
+        videos = get_youtube_client().search_videos(f"{skill} course", max_results=6)
+    except YouTubeError:
         return []
+    return [
+        {
+            "Title": video["title"],
+            "Channel": video["channel"],
+            "Video Link": video["url"],
+            "Thumbnail": video["thumbnail"]
+        }
+        for video in videos
+    ]
 
 def extract_text(uploaded_file):
     if uploaded_file:
-        ext = uploaded_file.name.split(".")[-1].lower()
+        ext = file_extension(uploaded_file.name)
         if ext == "pdf":
             if pdfplumber:
                 with pdfplumber.open(uploaded_file) as pdf:
@@ -125,8 +142,8 @@ def extract_text(uploaded_file):
     return "No text extracted."
 
 def generate_summary(text):
-    sentences = text.split(". ")[:3]
-    return "... ".join(sentences) + "..." if sentences else "No content extracted."
+    sentences = summarize(text, max_sentences=3)
+    return " ".join(sentences) if sentences else "No content extracted."
 
 def extract_skills(text):
     if spacy:
@@ -139,8 +156,14 @@ def extract_skills(text):
     return []
 
 def calculate_matching_score(resume_text, job_text):
-    embeddings = st_model.encode([resume_text, job_text], convert_to_tensor=True)
-    return round(float(util.pytorch_cos_sim(embeddings[0], embeddings[1])[0]), 2) * 100
+    template = template_index.lookup(job_text)
+    if template is not None and template.embedding is not None:
+        # Template postings are pre-embedded, only the resume needs encoding
+        resume_embedding = encode_text(resume_text)
+        return round(float(util.pytorch_cos_sim(resume_embedding, template.embedding)[0]), 2) * 100
+    resume_embedding = encode_text(resume_text)
+    job_embedding = encode_text(job_text)
+    return round(float(util.pytorch_cos_sim(resume_embedding, job_embedding)[0]), 2) * 100
 
 def plot_skill_distribution_pie(resume_skills, job_skills):
     resume_labels = list(resume_skills) if resume_skills else ["No Skills Found"]
@@ -154,17 +177,9 @@ def plot_skill_distribution_pie(resume_skills, job_skills):
     axes[1].set_title("Job Skills")
     st.pyplot(fig)
 
-def load_lottie_url(url: str):
-    try:
-        r = requests.get(url)
-        if r.status_code == 200:
-            return r.json()
-    except:
-        return None
-    return None
-
-LOTTIE_UPLOAD = load_lottie_url("https://assets2.lottiefiles.com/packages/lf20_w51pcehl.json")
-LOTTIE_SCORE = load_lottie_url("https://assets6.lottiefiles.com/packages/lf20_g8n0xqbm.json")
+# Served from the disk cache; a cold cache fetches in the background
+LOTTIE_UPLOAD = load_lottie(LOTTIE_ASSETS["upload"])
+LOTTIE_SCORE = load_lottie(LOTTIE_ASSETS["score"])
 
 # -----------------------------
 # Navigation
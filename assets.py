@@ -0,0 +1,135 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import requests
+import streamlit as st
+
+# Static assets for the Streamlit UI. CSS and fonts are bundled under
+# static/ (served by Streamlit's static file serving), and remote lottie
+# animations are cached on disk so no page render waits on the network.
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+ASSET_CACHE_DIR = os.environ.get("ASSET_CACHE_DIR", ".asset_cache")
+LOTTIE_FETCH_TIMEOUT = float(os.environ.get("LOTTIE_FETCH_TIMEOUT", "3"))
+
+INTER_FONT_URL = os.environ.get(
+    "INTER_FONT_URL",
+    "https://github.com/rsms/inter/raw/v4.0/docs/font-files/InterVariable.woff2"
+)
+INTER_FONT_PATH = os.path.join(STATIC_DIR, "fonts", "Inter-Variable.woff2")
+
+LOTTIE_ASSETS = {
+    "upload": "https://assets2.lottiefiles.com/packages/lf20_w51pcehl.json",
+    "score": "https://assets6.lottiefiles.com/packages/lf20_g8n0xqbm.json",
+}
+
+_pending_fetches = set()
+_pending_lock = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def load_css(name):
+    """Read a bundled stylesheet once per process and wrap it in a <style> tag"""
+    with open(os.path.join(STATIC_DIR, "css", name), 'r', encoding='utf-8') as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+def inject_css(name):
+    """Add a bundled stylesheet to the current page"""
+    st.markdown(load_css(name), unsafe_allow_html=True)
+
+
+def _lottie_cache_path(url):
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(ASSET_CACHE_DIR, "lottie", f"{digest}.json")
+
+
+@st.cache_data(show_spinner=False)
+def _read_lottie(path, mtime):
+    # mtime is part of the cache key so a refreshed file is picked up
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def fetch_lottie(url, timeout=LOTTIE_FETCH_TIMEOUT):
+    """Download a lottie animation into the disk cache, returning True on success"""
+    path = _lottie_cache_path(url)
+    try:
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError):
+        return False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _fetch_in_background(url):
+    with _pending_lock:
+        if url in _pending_fetches:
+            return
+        _pending_fetches.add(url)
+
+    def run():
+        try:
+            fetch_lottie(url)
+        finally:
+            with _pending_lock:
+                _pending_fetches.discard(url)
+
+    threading.Thread(target=run, name="lottie-fetch", daemon=True).start()
+
+
+def load_lottie(url):
+    """Return a lottie animation from the disk cache
+
+    On a cache miss the download is started in the background and None is
+    returned, so the page renders without the animation instead of waiting.
+    """
+    path = _lottie_cache_path(url)
+    try:
+        return _read_lottie(path, os.path.getmtime(path))
+    except (OSError, ValueError):
+        _fetch_in_background(url)
+        return None
+
+
+def fetch_fonts(url=INTER_FONT_URL, path=INTER_FONT_PATH):
+    """Download the Inter variable font into static/fonts"""
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(response.content)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prepare static assets for deployment")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('fetch-fonts', help="Download the bundled Inter font")
+    subparsers.add_parser('warm-lottie', help="Download all lottie animations into the disk cache")
+    args = parser.parse_args(argv)
+
+    if args.command == 'fetch-fonts':
+        print(f"Saved {fetch_fonts()}")
+        return 0
+
+    failed = 0
+    for name, url in LOTTIE_ASSETS.items():
+        ok = fetch_lottie(url, timeout=30)
+        failed += not ok
+        print(f"{name}: {'cached' if ok else 'FAILED'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,13 @@ import streamlit as st
 import hashlib
 import json
 import os
+import uuid
 
-# Simple file-based user storage (in production, use a proper database)
+from core.locking import file_lock
+
+# Simple file-based user storage (in production, use a proper database).
+# Writes are atomic and registrations hold a file lock, so several app
+# processes can share the file.
 USERS_FILE = "users.json"
 
 def load_users():
@@ -18,8 +23,10 @@ def load_users():
 
 def save_users(users):
     """Save users to JSON file"""
-    with open(USERS_FILE, 'w') as f:
+    tmp_path = f"{USERS_FILE}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'w') as f:
         json.dump(users, f)
+    os.replace(tmp_path, USERS_FILE)
 
 def hash_password(password):
     """Hash password using SHA256"""
@@ -27,15 +34,17 @@ def hash_password(password):
 
 def create_user(name, email, password):
     """Create a new user"""
-    users = load_users()
-    if email in users:
-        return False, "User already exists"
-    
-    users[email] = {
-        'name': name,
-        'password': hash_password(password)
-    }
-    save_users(users)
+    # Held across the read and the write so concurrent sign-ups aren't lost
+    with file_lock(USERS_FILE):
+        users = load_users()
+        if email in users:
+            return False, "User already exists"
+        
+        users[email] = {
+            'name': name,
+            'password': hash_password(password)
+        }
+        save_users(users)
     return True, "Account created successfully"
 
 def authenticate_user(email, password):
@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+# Batch PDF report generation for whole screening runs.
+# ReportLab rendering is CPU-bound Python, so reports are rendered in a
+# process pool and written to a zip archive or a directory as they finish.
+
+
+def _render_report(name, analysis_results):
+    """Render one report in a worker process"""
+    from pdf_generator import create_professional_pdf_report
+    return create_professional_pdf_report(analysis_results, name).getvalue()
+
+
+def _safe_filename(name):
+    cleaned = re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('._')
+    return cleaned or "candidate"
+
+
+class _ReportWriter:
+    """Write finished PDFs to a zip archive or a directory"""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.is_zip = output_path.lower().endswith('.zip')
+        self._used_names = set()
+        if self.is_zip:
+            parent = os.path.dirname(os.path.abspath(output_path))
+            os.makedirs(parent, exist_ok=True)
+            # PDFs are already compressed, storing them is faster than deflating again
+            self._zip = zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_STORED)
+        else:
+            os.makedirs(output_path, exist_ok=True)
+            self._zip = None
+
+    def _unique_name(self, name):
+        base = f"ProFileMatch_Report_{_safe_filename(name)}"
+        filename = f"{base}.pdf"
+        counter = 2
+        while filename in self._used_names:
+            filename = f"{base}_{counter}.pdf"
+            counter += 1
+        self._used_names.add(filename)
+        return filename
+
+    def write(self, name, pdf_bytes):
+        filename = self._unique_name(name)
+        if self._zip is not None:
+            self._zip.writestr(filename, pdf_bytes)
+            return f"{self.output_path}:{filename}"
+        path = os.path.join(self.output_path, filename)
+        with open(path, 'wb') as f:
+            f.write(pdf_bytes)
+        return path
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+
+
+def generate_batch_reports(candidates, output_path, max_workers=None, progress_callback=None):
+    """Render a PDF report per candidate in parallel
+
+    candidates is an iterable of (candidate_name, analysis_results) pairs and
+    output_path is either a .zip file or a directory. progress_callback, if
+    given, is called as progress_callback(done, total, candidate_name, error).
+    """
+    candidates = list(candidates)
+    total = len(candidates)
+    max_workers = max_workers or os.cpu_count() or 1
+    # Bound the number of rendered-but-unwritten PDFs held in memory
+    max_pending = max_workers * 2
+
+    summary = {'output': output_path, 'total': total, 'written': [], 'failed': []}
+    started = time.perf_counter()
+    writer = _ReportWriter(output_path)
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            remaining = iter(candidates)
+            done_count = 0
+
+            def submit_next():
+                for name, analysis_results in remaining:
+                    future = executor.submit(_render_report, name, analysis_results)
+                    pending[future] = name
+                    if len(pending) >= max_pending:
+                        return
+
+            submit_next()
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = pending.pop(future)
+                    error = None
+                    try:
+                        summary['written'].append(writer.write(name, future.result()))
+                    except Exception as e:
+                        error = str(e)
+                        summary['failed'].append({'name': name, 'error': error})
+                    done_count += 1
+                    if progress_callback:
+                        progress_callback(done_count, total, name, error)
+                submit_next()
+    finally:
+        writer.close()
+
+    summary['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+def load_candidates(paths):
+    """Load (name, analysis_results) pairs from JSON/JSONL files or directories of them"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, filename)
+                for filename in sorted(os.listdir(path))
+                if filename.endswith(('.json', '.jsonl'))
+            )
+        else:
+            files.append(path)
+
+    candidates = []
+    for filepath in files:
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        with open(filepath, 'r') as f:
+            if filepath.endswith('.jsonl'):
+                records = [json.loads(line) for line in f if line.strip()]
+            else:
+                data = json.load(f)
+                records = data if isinstance(data, list) else [data]
+
+        for i, record in enumerate(records):
+            default_name = stem if len(records) == 1 else f"{stem}_{i + 1}"
+            name = record.get('candidate_name') or record.get('user_name') or default_name
+            candidates.append((name, record))
+    return candidates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a ProFileMatch PDF report for every analysis in a screening run"
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help="Analysis JSON/JSONL files or directories (e.g. saved_analyses/)")
+    parser.add_argument('-o', '--output', default='reports.zip',
+                        help="Output .zip file or directory (default: reports.zip)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    candidates = load_candidates(args.inputs)
+    if not candidates:
+        print("No analyses found.", file=sys.stderr)
+        return 1
+
+    def print_progress(done, total, name, error):
+        status = f"FAILED ({error})" if error else "ok"
+        print(f"[{done}/{total}] {name}: {status}", flush=True)
+
+    summary = generate_batch_reports(candidates, args.output, args.workers, print_progress)
+    print(f"Wrote {len(summary['written'])}/{summary['total']} reports to "
+          f"{summary['output']} in {summary['elapsed_seconds']}s")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+import httpx
+
+# Load test for api_server.py: fires concurrent requests at one endpoint and
+# reports throughput and latency percentiles. Start the server first, e.g.
+#   python api_server.py --workers 4 --insecure-dev
+#   python benchmarks/api_load.py --endpoint analyze -n 500 -c 32
+
+SAMPLE_RESUME = """Jane Doe - Senior Software Engineer
+Experience: Acme Corp 2016 - present, building Python and Django services on AWS.
+Skills: Python, Django, PostgreSQL, Docker, Kubernetes, REST APIs, Git, CI/CD.
+Education: Bachelor of Science in Computer Science.
+"""
+
+SAMPLE_JOB = """Backend Engineer
+Requirements: 5+ years of experience with Python, Django and PostgreSQL.
+Experience with Docker, Kubernetes and AWS. Bachelor's degree in Computer Science.
+Nice to have: Redis, GraphQL, Terraform.
+"""
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _build_request(endpoint, batch_size):
+    if endpoint == 'analyze':
+        return {'method': 'POST', 'url': '/analyze',
+                'json': {'resume_text': SAMPLE_RESUME, 'job_text': SAMPLE_JOB}}
+    if endpoint == 'batch-analyze':
+        resumes = [{'id': f"candidate-{i}", 'resume_text': SAMPLE_RESUME} for i in range(batch_size)]
+        return {'method': 'POST', 'url': '/batch-analyze',
+                # top_k=0 keeps the run on the local ranking stage
+                'json': {'job_text': SAMPLE_JOB, 'resumes': resumes, 'top_k': 0}}
+    if endpoint == 'extract':
+        return {'method': 'POST', 'url': '/extract',
+                'files': {'file': ('resume.txt', SAMPLE_RESUME.encode('utf-8'), 'text/plain')}}
+    if endpoint == 'report':
+        analysis = {'ats_score': 72, 'matched_skills': ['Python', 'Django'],
+                    'missing_skills': ['Redis'], 'summary': "Strong backend profile."}
+        return {'method': 'POST', 'url': '/report', 'json': {'analysis': analysis, 'user_name': 'Load Test'}}
+    raise ValueError(f"Unknown endpoint {endpoint!r}")
+
+
+async def run_load(base_url, endpoint, total, concurrency, api_key=None, batch_size=20):
+    """Send total requests with at most concurrency in flight and return a summary"""
+    request = _build_request(endpoint, batch_size)
+    headers = {'X-API-Key': api_key} if api_key else {}
+    latencies = []
+    errors = 0
+    remaining = iter(range(total))
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=120) as client:
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                started = time.perf_counter()
+                try:
+                    response = await client.request(**request)
+                    await response.aread()
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append(time.perf_counter() - started)
+                errors += not ok
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall_seconds = time.perf_counter() - started
+
+    return {
+        'endpoint': endpoint,
+        'requests': total,
+        'concurrency': concurrency,
+        'errors': errors,
+        'wall_seconds': round(wall_seconds, 3),
+        'requests_per_second': round(total / wall_seconds, 1) if wall_seconds else 0.0,
+        'latency_ms': {
+            'mean': round(statistics.mean(latencies) * 1000, 2),
+            'p50': round(_percentile(latencies, 50) * 1000, 2),
+            'p95': round(_percentile(latencies, 95) * 1000, 2),
+            'p99': round(_percentile(latencies, 99) * 1000, 2),
+            'max': round(max(latencies) * 1000, 2),
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the ProFileMatch HTTP API")
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--endpoint', default='analyze',
+                        choices=['analyze', 'batch-analyze', 'extract', 'report'])
+    parser.add_argument('-n', '--requests', type=int, default=200)
+    parser.add_argument('-c', '--concurrency', type=int, default=16)
+    parser.add_argument('--batch-size', type=int, default=20, help="Resumes per batch-analyze request")
+    parser.add_argument('--api-key')
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run_load(args.url, args.endpoint, args.requests, args.concurrency,
+                                   api_key=args.api_key, batch_size=args.batch_size))
+    print(json.dumps(summary, indent=2))
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
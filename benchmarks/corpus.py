@@ -0,0 +1,132 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skills_taxonomy import SKILL_TAXONOMY
+
+# Synthetic resumes and job postings for benchmarks. Everything is derived
+# from a seed, so the same seed always produces the same corpus.
+
+FORMATS = ('pdf', 'docx', 'txt')
+
+_FIRST_NAMES = ["Alex", "Priya", "Jordan", "Wei", "Maria", "Samuel", "Aisha", "Lukas", "Emma", "Kenji"]
+_LAST_NAMES = ["Smith", "Patel", "Garcia", "Chen", "Okafor", "Novak", "Kim", "Silva", "Brown", "Haddad"]
+_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Hooli", "Vandelay"]
+_TITLES = ["Software Engineer", "Data Scientist", "Backend Developer", "DevOps Engineer",
+           "Frontend Developer", "Machine Learning Engineer", "Product Analyst"]
+_DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Data Science",
+            "Bachelor of Engineering", "PhD in Statistics", "Associate Degree in IT"]
+_VERBS = ["Built", "Led", "Designed", "Optimized", "Migrated", "Automated", "Maintained", "Scaled"]
+_OBJECTS = ["a payments service", "the data pipeline", "internal tooling", "the recommendation engine",
+            "CI/CD workflows", "customer-facing dashboards", "a microservices platform"]
+
+_ALL_SKILLS = sorted(skill for skills in SKILL_TAXONOMY.values() for skill in skills)
+
+
+def _resume_text(rng, experience_items):
+    name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+    skills = rng.sample(_ALL_SKILLS, rng.randint(8, 20))
+    lines = [name, rng.choice(_TITLES), "", "SUMMARY",
+             f"Engineer with {rng.randint(1, 15)} years of experience delivering production systems.", "",
+             "EXPERIENCE"]
+    year = 2025
+    for _ in range(experience_items):
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(_TITLES)} - {rng.choice(_COMPANIES)} ({start} - {year})")
+        for _ in range(rng.randint(2, 4)):
+            lines.append(f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} using "
+                         f"{', '.join(rng.sample(skills, 2))}")
+        year = start
+    lines += ["", "EDUCATION", rng.choice(_DEGREES), "", "SKILLS", ", ".join(skills)]
+    return "\n".join(lines)
+
+
+def _job_text(rng):
+    required = rng.sample(_ALL_SKILLS, rng.randint(4, 8))
+    preferred = rng.sample([s for s in _ALL_SKILLS if s not in required], rng.randint(2, 5))
+    degree = rng.choice(["Bachelor's degree", "Master's degree", "PhD"])
+    return "\n".join([
+        f"**Job Title:** {rng.choice(_TITLES)}",
+        f"**Company:** {rng.choice(_COMPANIES)}",
+        "**About the Role:** Join a growing team building reliable, well-tested software.",
+        "**Requirements:**",
+        f"- {rng.randint(2, 8)}+ years of professional experience",
+        f"- {degree} in Computer Science or a related field",
+        *[f"- Experience with {skill}" for skill in required],
+        "**Nice to Have:**",
+        *[f"- {skill}" for skill in preferred],
+    ])
+
+
+def generate_texts(n_resumes, n_jobs, seed=0, experience_items=4):
+    """Return (resume_texts, job_texts) for a seed"""
+    rng = random.Random(seed)
+    resumes = [_resume_text(rng, experience_items) for _ in range(n_resumes)]
+    jobs = [_job_text(rng) for _ in range(n_jobs)]
+    return resumes, jobs
+
+
+def write_pdf(text, path):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+    from xml.sax.saxutils import escape
+
+    style = getSampleStyleSheet()['Normal']
+    story = []
+    for line in text.split("\n"):
+        story.append(Paragraph(escape(line), style) if line else Spacer(1, 8))
+    # invariant=1 keeps the output byte-identical for the same input
+    SimpleDocTemplate(path, pagesize=letter, invariant=1).build(story)
+
+
+def write_docx(text, path):
+    from docx import Document
+
+    document = Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def write_txt(text, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+_WRITERS = {'pdf': write_pdf, 'docx': write_docx, 'txt': write_txt}
+
+
+def generate_corpus(output_dir, n_resumes=30, n_jobs=10, seed=0, formats=FORMATS):
+    """Write resumes and postings in rotating formats; returns {'resumes': [...], 'jobs': [...]} paths"""
+    resumes, jobs = generate_texts(n_resumes, n_jobs, seed)
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = {'resumes': [], 'jobs': []}
+    for kind, texts in (('resumes', resumes), ('jobs', jobs)):
+        for i, text in enumerate(texts):
+            fmt = formats[i % len(formats)]
+            path = os.path.join(output_dir, f"{kind[:-1]}_{i:04d}.{fmt}")
+            _WRITERS[fmt](text, path)
+            paths[kind].append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume/job corpus")
+    parser.add_argument('output_dir')
+    parser.add_argument('--resumes', type=int, default=30)
+    parser.add_argument('--jobs', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    paths = generate_corpus(args.output_dir, args.resumes, args.jobs, args.seed)
+    print(f"Wrote {len(paths['resumes'])} resumes and {len(paths['jobs'])} jobs to {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
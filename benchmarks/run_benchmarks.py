@@ -0,0 +1,439 @@
+import argparse
+import fnmatch
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+
+# Offline benchmark suite for the analysis pipeline: extraction, local
+# scoring, embedding scoring, the (stubbed) gpt-4o analysis, PDF reports
+# and saved-analysis storage. Results are written as JSON and can be
+# compared against a previous run:
+#   python benchmarks/run_benchmarks.py -o bench.json
+#   python benchmarks/run_benchmarks.py --baseline bench.json --fail-on-regression
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.15
+
+_PACKAGES = ('PyPDF2', 'reportlab', 'docx', 'numpy', 'sentence_transformers', 'openai', 'streamlit')
+
+
+def _package_versions():
+    versions = {}
+    for name in _PACKAGES:
+        try:
+            module = __import__(name)
+            versions[name] = getattr(module, '__version__', 'unknown')
+        except ImportError:
+            versions[name] = None
+    return versions
+
+
+def measure(fn, repeat, number, warmup=1):
+    """Time fn, returning per-call seconds for each of repeat rounds of number calls"""
+    for _ in range(warmup):
+        fn()
+    gc.collect()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    return {
+        'median_ms': round(median * 1000, 4),
+        'mean_ms': round(statistics.mean(ordered) * 1000, 4),
+        'min_ms': round(ordered[0] * 1000, 4),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] * 1000, 4),
+        'stdev_ms': round(statistics.stdev(ordered) * 1000, 4) if len(ordered) > 1 else 0.0,
+        'ops_per_second': round(1 / median, 1) if median else None,
+        'rounds': len(ordered),
+    }
+
+
+class _Cycle:
+    """Hands out items round-robin so each timed call gets the next input"""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.index = 0
+
+    def next(self):
+        item = self.items[self.index % len(self.items)]
+        self.index += 1
+        return item
+
+
+# Offline stand-ins for the external services
+
+_STUB_ANALYSIS = {
+    "ats_score": 72,
+    "matched_skills": ["Python", "SQL", "Docker"],
+    "missing_skills": ["Kubernetes", "Terraform"],
+    "summary": "Solid backend profile with most of the required skills.",
+    "experience_match": "Meets the experience requirement.",
+    "education_match": "Meets the degree requirement.",
+    "recommendations": ["Add Kubernetes projects", "Quantify achievements"],
+}
+
+
+class _StubOpenAI:
+    def __init__(self):
+        message = SimpleNamespace(content=json.dumps(_STUB_ANALYSIS))
+        response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response))
+
+
+class _StubYouTube:
+    configured = True
+
+    def search_videos(self, query, max_results=6, **params):
+        return [
+            {"title": f"{query} #{i}", "channel": "Stub", "video_id": f"v{i}",
+             "url": f"https://www.youtube.com/watch?v=v{i}", "thumbnail": ""}
+            for i in range(max_results)
+        ]
+
+
+def install_stubs():
+    """Route the gpt-4o and YouTube calls to canned local responses"""
+    import core.analysis
+    import core.recommendations
+
+    core.analysis.OPENAI_API_KEY = "offline-benchmark"
+    core.analysis._openai_client = _StubOpenAI()
+    stub_youtube = _StubYouTube()
+    core.recommendations.get_youtube_client = lambda: stub_youtube
+
+
+def use_temporary_storage(root):
+    import core.cache
+    import core.document_store
+    import core.job_search
+    import core.storage
+    import core.usage
+
+    core.storage.SAVED_ANALYSES_DIR = os.path.join(root, "saved_analyses")
+    core.document_store._store = core.document_store.DocumentStore(root=os.path.join(root, "documents"))
+    core.usage._ledger = core.usage.UsageLedger(db_path=os.path.join(root, "usage.db"), default_daily_quota=0)
+    # Saves index their job postings
+    core.job_search._index = core.job_search.JobSearchIndex(db_path=os.path.join(root, "job_search.db"))
+    # Benchmarks time the work itself, not shared-cache hits
+    core.cache.set_cache(core.cache.NullCache())
+
+
+# Benchmarks. Each takes the shared context and returns a zero-argument
+# callable timing one operation, or raises _Skip.
+
+class _Skip(Exception):
+    pass
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def _extraction_benchmark(fmt):
+    def setup(ctx):
+        from core.extraction import extract_text_from_path
+        files = [p for p in ctx['paths']['resumes'] if p.endswith(f".{fmt}")]
+        if not files:
+            raise _Skip(f"no .{fmt} files in the corpus")
+        if fmt == 'docx':
+            from core.extraction import DOCX_AVAILABLE
+            if not DOCX_AVAILABLE:
+                raise _Skip("python-docx is not installed")
+        cycle = _Cycle(files)
+        return lambda: extract_text_from_path(cycle.next())
+    return setup
+
+
+for _fmt in ('pdf', 'docx', 'txt'):
+    benchmark(f"extract.{_fmt}")(_extraction_benchmark(_fmt))
+
+
+@benchmark("score.keyword_warm")
+def _score_warm(ctx):
+    from scoring_engine import score_resume_job_match
+    cycle = _Cycle(ctx['pairs'])
+    for resume, job in ctx['pairs']:
+        score_resume_job_match(resume, job)
+    return lambda: score_resume_job_match(*cycle.next())
+
+
+@benchmark("score.keyword_cold")
+def _score_cold(ctx):
+    import job_parser
+    import scoring_engine
+    cycle = _Cycle(ctx['pairs'])
+
+    def run():
+        job_parser._parse_cache.clear()
+        scoring_engine._resume_cache.clear()
+        scoring_engine.score_resume_job_match(*cycle.next())
+    return run
+
+
+@benchmark("score.embedding")
+def _score_embedding(ctx):
+    try:
+        from sentence_transformers import SentenceTransformer, util
+    except ImportError:
+        raise _Skip("sentence-transformers is not installed")
+    from scoring_engine import score_resume_job_match
+    from template_index import EMBEDDING_MODEL_NAME
+    try:
+        model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    except Exception as e:
+        raise _Skip(f"embedding model unavailable offline: {e}")
+    cycle = _Cycle(ctx['pairs'])
+
+    def run():
+        resume, job = cycle.next()
+        embeddings = model.encode([resume, job], convert_to_tensor=True)
+        similarity = float(util.cos_sim(embeddings[0], embeddings[1])[0][0])
+        score_resume_job_match(resume, job, embedding_similarity=similarity)
+    return run
+
+
+@benchmark("analyze.llm_stubbed")
+def _analyze_llm(ctx):
+    from core.analysis import analyze_resume_job_match
+    cycle = _Cycle(ctx['pairs'])
+    return lambda: analyze_resume_job_match(*cycle.next())
+
+
+@benchmark("recommendations.youtube_stubbed")
+def _recommendations(ctx):
+    from core.recommendations import get_youtube_recommendations
+    cycle = _Cycle(["Python", "Kubernetes", "Terraform", "SQL"])
+    return lambda: get_youtube_recommendations(cycle.next())
+
+
+@benchmark("report.pdf")
+def _report_pdf(ctx):
+    from pdf_generator import create_professional_pdf_report
+    cycle = _Cycle(ctx['analyses'])
+    return lambda: create_professional_pdf_report(cycle.next(), "Benchmark User")
+
+
+@benchmark("report.pdf_stream")
+def _report_pdf_stream(ctx):
+    from pdf_generator import write_pdf_report
+    cycle = _Cycle(ctx['analyses'])
+    return lambda: write_pdf_report(cycle.next(), io.BytesIO(), "Benchmark User")
+
+
+@benchmark("storage.list")
+def _storage_list(ctx):
+    from core.storage import load_user_analyses
+    return lambda: load_user_analyses(ctx['storage_user'])
+
+
+@benchmark("storage.get")
+def _storage_get(ctx):
+    from core.storage import get_analysis
+    cycle = _Cycle(ctx['saved_ids'])
+    return lambda: get_analysis(cycle.next(), ctx['storage_user'])
+
+
+@benchmark("storage.save")
+def _storage_save(ctx):
+    # Registered after list/get so the records it adds don't skew their timings
+    from core.storage import save_analysis_result
+    cycle = _Cycle(ctx['saved_inputs'])
+    return lambda: save_analysis_result(cycle.next(), "bench-save@example.com")
+
+
+@benchmark("pipeline.end_to_end")
+def _pipeline(ctx):
+    from core.analysis import analyze_resume_job_match
+    from core.extraction import extract_text_from_path
+    from core.recommendations import get_youtube_recommendations
+    from pdf_generator import write_pdf_report
+    cycle = _Cycle(list(zip(ctx['paths']['resumes'], ctx['paths']['jobs'] * len(ctx['paths']['resumes']))))
+
+    def run():
+        resume_path, job_path = cycle.next()
+        resume = extract_text_from_path(resume_path)
+        job = extract_text_from_path(job_path)
+        results = analyze_resume_job_match(resume, job)
+        for skill in results.get('missing_skills', [])[:3]:
+            get_youtube_recommendations(skill)
+        write_pdf_report(results, io.BytesIO(), "Benchmark User")
+    return run
+
+
+def build_context(work_dir, n_resumes, n_jobs, seed):
+    from core.analysis import get_demo_analysis_results
+    from core.extraction import extract_text_from_path
+    from core.storage import save_analysis_result
+
+    paths = generate_corpus(os.path.join(work_dir, "corpus"), n_resumes, n_jobs, seed)
+    resumes = [extract_text_from_path(p) for p in paths['resumes']]
+    jobs = [extract_text_from_path(p) for p in paths['jobs']]
+    pairs = [(resume, jobs[i % len(jobs)]) for i, resume in enumerate(resumes)]
+    analyses = [get_demo_analysis_results(resume, job) for resume, job in pairs]
+    saved_inputs = [dict(a, resume_text=r, job_text=j) for a, (r, j) in zip(analyses, pairs)]
+
+    storage_user = "bench@example.com"
+    saved_ids = [save_analysis_result(item, storage_user) for item in saved_inputs]
+    return {
+        'paths': paths,
+        'pairs': pairs,
+        'analyses': analyses,
+        'saved_inputs': saved_inputs,
+        'saved_ids': saved_ids,
+        'storage_user': storage_user,
+    }
+
+
+def run_suite(only=None, repeat=7, number=None, n_resumes=24, n_jobs=6, seed=0):
+    """Run the selected benchmarks and return the results document"""
+    from core import metrics
+
+    # Measure the pipeline itself, not the instrumentation
+    metrics.set_enabled(False)
+    install_stubs()
+
+    work_dir = tempfile.mkdtemp(prefix="profilematch-bench-")
+    try:
+        use_temporary_storage(work_dir)
+        ctx = build_context(work_dir, n_resumes, n_jobs, seed)
+
+        results = {}
+        for name, setup in BENCHMARKS.items():
+            if only and not any(fnmatch.fnmatch(name, pattern) for pattern in only):
+                continue
+            try:
+                fn = setup(ctx)
+            except _Skip as e:
+                results[name] = {'skipped': str(e)}
+                print(f"{name:36s} skipped ({e})", file=sys.stderr)
+                continue
+
+            # Aim for roughly 0.2s per round, bounded for very slow operations
+            calls = number
+            if calls is None:
+                started = time.perf_counter()
+                fn()
+                single = time.perf_counter() - started
+                calls = max(1, min(1000, int(0.2 / single) if single > 0 else 1000))
+            stats = summarize(measure(fn, repeat, calls))
+            stats['calls_per_round'] = calls
+            results[name] = stats
+            print(f"{name:36s} median {stats['median_ms']:10.4f} ms  "
+                  f"p95 {stats['p95_ms']:10.4f} ms", file=sys.stderr)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'packages': _package_versions(),
+        },
+        'config': {'repeat': repeat, 'resumes': n_resumes, 'jobs': n_jobs, 'seed': seed},
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare medians with a baseline; returns rows with the change ratio and a status"""
+    rows = []
+    for name, stats in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if 'skipped' in stats or not base or 'skipped' in base:
+            rows.append({'name': name, 'status': 'n/a'})
+            continue
+        ratio = stats['median_ms'] / base['median_ms'] if base['median_ms'] else float('inf')
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        rows.append({
+            'name': name,
+            'baseline_ms': base['median_ms'],
+            'current_ms': stats['median_ms'],
+            'ratio': round(ratio, 3),
+            'status': status,
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ProFileMatch analysis pipeline offline")
+    parser.add_argument('-o', '--output', help="Write results JSON here")
+    parser.add_argument('--baseline', help="Results JSON from a previous run to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative median slowdown that counts as a regression")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    parser.add_argument('--only', action='append', help="Glob of benchmark names to run (repeatable)")
+    parser.add_argument('--repeat', type=int, default=7, help="Timed rounds per benchmark")
+    parser.add_argument('--number', type=int, help="Calls per round (default: calibrated)")
+    parser.add_argument('--resumes', type=int, default=24)
+    parser.add_argument('--jobs', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--list', action='store_true', help="List benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    document = run_suite(args.only, args.repeat, args.number, args.resumes, args.jobs, args.seed)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(document, baseline, args.threshold)
+        document['comparison'] = {'baseline': args.baseline, 'threshold': args.threshold, 'rows': rows}
+        for row in rows:
+            if row['status'] == 'n/a':
+                print(f"{row['name']:36s} n/a")
+            else:
+                print(f"{row['name']:36s} {row['baseline_ms']:10.4f} -> {row['current_ms']:10.4f} ms "
+                      f"x{row['ratio']:.3f} {row['status']}")
+        if args.fail_on_regression and any(row['status'] == 'regression' for row in rows):
+            exit_code = 1
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+    elif not args.baseline:
+        print(json.dumps(document, indent=2))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.errors import AnalysisError, ExtractionError
+from core.usage import estimate_llm_cost, estimate_llm_tokens
+from scoring_engine import score_resume_job_match
+
+# Two-stage screening: every resume is ranked with the local scoring
+# engine first and only the top-K / above-threshold candidates get the
+# full gpt-4o analysis. Each run reports the calls, cost and time saved.
+
+CASCADE_TOP_K = int(os.environ.get("CASCADE_TOP_K", "10"))
+CASCADE_MIN_LOCAL_SCORE = float(os.environ.get("CASCADE_MIN_LOCAL_SCORE", "50"))
+CASCADE_LLM_WORKERS = int(os.environ.get("CASCADE_LLM_WORKERS", "4"))
+
+# Rough fallback when no measured LLM latency is available
+DEFAULT_LLM_SECONDS = 8.0
+
+
+def select_candidates(ranked, top_k=CASCADE_TOP_K, min_local_score=CASCADE_MIN_LOCAL_SCORE):
+    """Pick the candidates that go on to the LLM stage from a best-first ranking
+
+    Either limit can be None to disable it.
+    """
+    selected = []
+    for candidate in ranked:
+        if top_k is not None and len(selected) >= top_k:
+            break
+        if min_local_score is not None and candidate['local_score'] < min_local_score:
+            break
+        selected.append(candidate)
+    return selected
+
+
+def _is_paid_call(llm_usage):
+    # A completion made for this analysis, as opposed to a cache hit, a
+    # coalesced call or a local fallback
+    return (bool(llm_usage) and not llm_usage.get('cached')
+            and llm_usage.get('prompt_tokens', 0) + llm_usage.get('completion_tokens', 0) > 0)
+
+
+def run_cascade(resumes, job_description, top_k=CASCADE_TOP_K,
+                min_local_score=CASCADE_MIN_LOCAL_SCORE, analyze_fn=None,
+                max_workers=CASCADE_LLM_WORKERS):
+    """Rank resumes locally, then run the full analysis only on the shortlist
+
+    resumes is an iterable of (candidate_id, resume_text). analyze_fn
+    defaults to core.analysis.analyze_resume_job_match. Returns the
+    per-candidate results (best first) and a run report.
+    """
+    if analyze_fn is None:
+        from core.analysis import analyze_resume_job_match
+        analyze_fn = analyze_resume_job_match
+
+    resumes = list(resumes)
+
+    # Stage 1: local scoring for everyone
+    local_started = time.perf_counter()
+    ranked = []
+    for candidate_id, resume_text in resumes:
+        local = score_resume_job_match(resume_text, job_description)
+        ranked.append({
+            'candidate_id': candidate_id,
+            'resume_text': resume_text,
+            'local_score': local['ats_score'],
+            'local_analysis': local,
+            'stage': 'local',
+            'analysis': None,
+        })
+    ranked.sort(key=lambda candidate: candidate['local_score'], reverse=True)
+    local_seconds = time.perf_counter() - local_started
+
+    # Stage 2: full analysis for the shortlist
+    shortlist = select_candidates(ranked, top_k, min_local_score)
+
+    def analyze(candidate):
+        try:
+            return analyze_fn(candidate['resume_text'], job_description)
+        except AnalysisError:
+            # Keep the local ranking for this candidate rather than failing the run
+            return None
+
+    llm_started = time.perf_counter()
+    if shortlist:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(shortlist)))) as executor:
+            for candidate, analysis in zip(shortlist, executor.map(analyze, shortlist)):
+                candidate['analysis'] = analysis
+                candidate['stage'] = 'llm'
+    llm_wall_seconds = time.perf_counter() - llm_started
+
+    # Savings report, from what each analysis says it cost. Cache hits and
+    # coalesced calls cost nothing; local fallbacks (no API key, quota used
+    # up, API errors) never reached the LLM.
+    usages = [(c['analysis'] or {}).get('llm_usage') for c in shortlist]
+    paid = [usage for usage in usages if _is_paid_call(usage)]
+    cache_hits = sum(1 for usage in usages if usage and usage.get('cached'))
+    fallbacks = sum(1 for usage in usages if not usage)
+    not_called = [c for c, usage in zip(shortlist, usages) if not _is_paid_call(usage)]
+    not_called += [c for c in ranked if c['stage'] == 'local']
+    saved_tokens = [estimate_llm_tokens(c['resume_text'], job_description) for c in not_called]
+    avg_llm_seconds = (sum(usage['latency_ms'] for usage in paid) / 1000 / len(paid)) if paid else DEFAULT_LLM_SECONDS
+
+    report = {
+        'candidates': len(ranked),
+        'shortlisted': len(shortlist),
+        'llm_calls': len(paid),
+        'llm_cache_hits': cache_hits,
+        'llm_coalesced': len(shortlist) - len(paid) - cache_hits - fallbacks,
+        'llm_fallbacks': fallbacks,
+        'llm_calls_avoided': len(not_called),
+        'top_k': top_k,
+        'min_local_score': min_local_score,
+        'local_stage_seconds': round(local_seconds, 4),
+        'local_ms_per_candidate': round(local_seconds * 1000 / len(ranked), 3) if ranked else 0.0,
+        'llm_stage_seconds': round(llm_wall_seconds, 3),
+        'avg_llm_call_seconds': round(avg_llm_seconds, 3),
+        'estimated_llm_seconds_saved': round(avg_llm_seconds * len(not_called), 1),
+        'estimated_cost_usd': round(sum(usage.get('cost_usd', 0.0) for usage in paid), 4),
+        'estimated_cost_saved_usd': round(sum(estimate_llm_cost(*tokens) for tokens in saved_tokens), 4),
+        'estimated_tokens_saved': sum(p + c for p, c in saved_tokens),
+    }
+
+    results = []
+    for candidate in ranked:
+        candidate.pop('resume_text')
+        results.append(candidate)
+    return {'results': results, 'report': report}
+
+
+def _read_document(path):
+    from core.extraction import extract_text_from_path
+    try:
+        return extract_text_from_path(path)
+    except ExtractionError as e:
+        print(f"{path}: {e}", file=sys.stderr)
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Screen many resumes against one job: local ranking, then gpt-4o on the shortlist"
+    )
+    parser.add_argument('job', help="Job description file (PDF, TXT or DOCX)")
+    parser.add_argument('resumes', nargs='+', help="Resume files or directories of resumes")
+    parser.add_argument('--top-k', type=int, default=CASCADE_TOP_K,
+                        help="Maximum candidates sent to the LLM (0 ranks locally only, negative disables the limit)")
+    parser.add_argument('--min-score', type=float, default=CASCADE_MIN_LOCAL_SCORE,
+                        help="Minimum local score for the LLM stage (negative disables the limit)")
+    parser.add_argument('--workers', type=int, default=CASCADE_LLM_WORKERS)
+    parser.add_argument('--output', help="Write the full JSON results here")
+    args = parser.parse_args(argv)
+
+    paths = []
+    for path in args.resumes:
+        if os.path.isdir(path):
+            paths.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.lower().endswith(('.pdf', '.txt', '.docx', '.doc')))
+        else:
+            paths.append(path)
+
+    job_description = _read_document(args.job)
+    if not job_description:
+        print(f"Could not read job description {args.job}", file=sys.stderr)
+        return 1
+
+    resumes = []
+    for path in paths:
+        text = _read_document(path)
+        if text:
+            resumes.append((os.path.basename(path), text))
+        else:
+            print(f"Skipping unreadable resume {path}", file=sys.stderr)
+
+    outcome = run_cascade(
+        resumes,
+        job_description,
+        top_k=args.top_k if args.top_k >= 0 else None,
+        min_local_score=args.min_score if args.min_score >= 0 else None,
+        max_workers=args.workers
+    )
+
+    for candidate in outcome['results']:
+        final = candidate['analysis']['ats_score'] if candidate['analysis'] else '-'
+        print(f"{candidate['candidate_id']}: local={candidate['local_score']} "
+              f"final={final} ({candidate['stage']})")
+    print(json.dumps(outcome['report'], indent=2))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(outcome, f, indent=2, default=list)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""Streamlit-free core: document extraction, analysis, storage and recommendations
+
+Nothing in this package imports Streamlit, so it can be used from worker
+processes, the HTTP API and CLIs. Errors are raised as core.errors types.
+Import the submodules directly (core.extraction, core.analysis,
+core.storage, core.recommendations) so a worker only loads what it uses.
+"""
+
+from core.errors import (
+    ProFileMatchError,
+    ExtractionError,
+    UnsupportedFormatError,
+    AnalysisError,
+    StorageError,
+)
+from core.results import AnalysisResult, AnalysisResults, SavedAnalysis, VideoRecommendation
@@ -0,0 +1,240 @@
+import json
+import os
+import threading
+import time
+
+from core.cache import cache_get, cache_set
+from core.errors import AnalysisError, QuotaExceededError
+from core.metrics import timed, timer
+from core.results import AnalysisResult, AnalysisResults
+from core.singleflight import SingleFlight, input_key
+from core.usage import COALESCED, ERROR, estimate_llm_cost, estimate_llm_tokens, get_usage_ledger
+from job_parser import DEGREE_NAMES
+from scoring_engine import score_resume_job_match
+
+# the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
+# do not change this unless explicitly requested by the user
+OPENAI_MODEL = "gpt-4o"
+OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "your-openai-api-key")
+# How long an LLM analysis of an identical resume/job pair is reused, in seconds
+ANALYSIS_CACHE_TTL = int(os.environ.get("ANALYSIS_CACHE_TTL", str(7 * 24 * 3600)))
+
+_openai_client = None
+_openai_client_lock = threading.Lock()
+# Identical analyses running at the same time (a double-clicked button,
+# a retried request) share one completion
+_completions = SingleFlight('llm_analysis')
+
+
+def llm_configured():
+    """Whether a real OpenAI API key is available"""
+    return bool(OPENAI_API_KEY) and OPENAI_API_KEY != "your-openai-api-key"
+
+
+def get_openai_client():
+    """Return the process-wide OpenAI client, created on first use"""
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                # Imported here so processes that only score locally skip the SDK import
+                from openai import OpenAI
+                _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    return _openai_client
+
+
+def build_analysis_prompt(resume_text, job_description):
+    """The user prompt for the gpt-4o analysis"""
+    return f"""
+    You are an expert ATS (Applicant Tracking System) analyzer. Analyze the following resume against the job description and provide a detailed comparison.
+
+    RESUME:
+    {resume_text}
+
+    JOB DESCRIPTION:
+    {job_description}
+
+    Please analyze and return a JSON response with the following structure:
+    {{
+        "ats_score": <number between 0-100>,
+        "matched_skills": [<list of skills that match>],
+        "missing_skills": [<list of skills mentioned in job description but missing from resume>],
+        "summary": "<2-3 sentence analysis of candidate fit>",
+        "experience_match": "<brief analysis of experience match>",
+        "education_match": "<brief analysis of education match>",
+        "recommendations": [<list of specific recommendations to improve the match>]
+    }}
+
+    Be thorough in your analysis and ensure the ATS score accurately reflects the match percentage.
+    """
+
+
+def _create_completion(resume_text, job_description):
+    with timer('llm_call'):
+        return get_openai_client().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert ATS analyzer. Provide accurate, detailed analysis in the requested JSON format."
+                },
+                {
+                    "role": "user",
+                    "content": build_analysis_prompt(resume_text, job_description)
+                }
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1
+        )
+
+
+@timed('analyze')
+def analyze_resume_job_match(resume_text, job_description, user_email=None) -> AnalysisResults:
+    """Analyze resume against job description using OpenAI
+
+    Falls back to the local scoring engine when no API key is configured,
+    the user's token quota is used up, or the API call fails. Each call's
+    token usage is recorded against user_email; a call that shares an
+    identical in-flight completion is recorded with no tokens, and one
+    answered from the shared cache isn't recorded. Raises AnalysisError if
+    the API returns no content.
+    """
+    if not llm_configured():
+        return get_demo_analysis_results(resume_text, job_description)
+
+    key = input_key(OPENAI_MODEL, resume_text, job_description)
+    cached = cache_get('analysis', key)
+    if cached is not None:
+        try:
+            result = AnalysisResult.from_bytes(cached).to_dict()
+        except (ValueError, EOFError, TypeError):
+            # Written by an incompatible version; analyze again
+            result = None
+        if result is not None:
+            result['llm_usage'] = {'model': OPENAI_MODEL, 'prompt_tokens': 0, 'completion_tokens': 0,
+                                   'cost_usd': 0.0, 'latency_ms': 0.0, 'cached': True}
+            return result
+
+    ledger = get_usage_ledger()
+    try:
+        call_id = ledger.reserve(user_email, OPENAI_MODEL, sum(estimate_llm_tokens(resume_text, job_description)))
+    except QuotaExceededError as e:
+        results = get_demo_analysis_results(resume_text, job_description)
+        results['llm_skipped'] = str(e)
+        return results
+
+    started = time.perf_counter()
+    try:
+        response, shared = _completions.do(key, _create_completion, resume_text, job_description)
+    except Exception:
+        ledger.complete(call_id, 0, 0, time.perf_counter() - started, status=ERROR)
+        # Silently fall back to alternative analysis
+        return get_demo_analysis_results(resume_text, job_description)
+
+    latency = time.perf_counter() - started
+    if shared:
+        prompt_tokens = completion_tokens = 0
+        ledger.complete(call_id, 0, 0, latency, status=COALESCED)
+    else:
+        usage = getattr(response, 'usage', None)
+        prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+        completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+        ledger.complete(call_id, prompt_tokens, completion_tokens, latency)
+
+    try:
+        content = response.choices[0].message.content
+        result = json.loads(content) if content else None
+    except (AttributeError, IndexError, ValueError):
+        return get_demo_analysis_results(resume_text, job_description)
+
+    if not result:
+        raise AnalysisError("The analysis service returned an empty response.")
+    try:
+        parsed = AnalysisResult.from_dict(result)
+    except AnalysisError:
+        # Malformed model output; score locally instead
+        return get_demo_analysis_results(resume_text, job_description)
+    if not shared:
+        cache_set('analysis', key, parsed.to_bytes(), ANALYSIS_CACHE_TTL)
+    result = parsed.to_dict()
+    result['llm_usage'] = {
+        'model': OPENAI_MODEL,
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'cost_usd': round(estimate_llm_cost(prompt_tokens, completion_tokens), 6),
+        'latency_ms': round(latency * 1000, 1),
+    }
+    return result
+
+
+@timed('local_scoring')
+def get_demo_analysis_results(resume_text, job_description, embedding_similarity=None) -> AnalysisResults:
+    """Generate analysis results with the local scoring engine"""
+    local = score_resume_job_match(resume_text, job_description, embedding_similarity)
+    ats_score = local['ats_score']
+    breakdown = local['score_breakdown']
+    matched_skills = local['matched_skills']
+    missing_required = local['missing_required_skills']
+
+    # Summary
+    if ats_score >= 80:
+        fit = "a strong match"
+    elif ats_score >= 60:
+        fit = "a reasonable match with some gaps"
+    else:
+        fit = "a weak match for this role"
+    summary = f"Based on our analysis, this resume achieves an ATS score of {ats_score}% and is {fit}."
+    if 'required_skills' in breakdown:
+        required = breakdown['required_skills']
+        total_required = len(required['matched']) + len(required['missing'])
+        summary += f" It covers {len(required['matched'])} of {total_required} required skills."
+
+    # Experience
+    experience = breakdown.get('experience')
+    if experience is None:
+        experience_match = "The job description does not state a minimum amount of experience."
+    elif experience['score'] >= 1:
+        experience_match = (f"The resume shows about {experience['resume_years']} years of experience, "
+                            f"meeting the {experience['required_years']}+ years requested.")
+    else:
+        experience_match = (f"The resume shows about {experience['resume_years']} years of experience, "
+                            f"short of the {experience['required_years']}+ years requested.")
+
+    # Education
+    education = breakdown.get('education')
+    if education is None:
+        education_match = "The job description does not state a degree requirement."
+    elif education['resume_degree'] is None:
+        education_match = (f"The role asks for {DEGREE_NAMES[education['required_degree']]} or higher, "
+                           f"but no degree was found in the resume.")
+    elif education['score'] >= 1:
+        education_match = (f"The resume lists {DEGREE_NAMES[education['resume_degree']]}, meeting the "
+                           f"requirement of {DEGREE_NAMES[education['required_degree']]}.")
+    else:
+        education_match = (f"The role asks for {DEGREE_NAMES[education['required_degree']]}; "
+                           f"the resume lists {DEGREE_NAMES[education['resume_degree']]}.")
+
+    # Recommendations
+    recommendations = []
+    if missing_required:
+        recommendations.append(f"Add evidence of these required skills if you have them: {', '.join(missing_required[:5])}")
+    preferred = breakdown.get('preferred_skills')
+    if preferred and preferred['missing']:
+        recommendations.append(f"Consider highlighting preferred skills such as {', '.join(preferred['missing'][:3])}")
+    if experience is not None and experience['score'] < 1:
+        recommendations.append("Make the length of your relevant experience explicit, with dates for each role")
+    if education is not None and education['score'] < 1:
+        recommendations.append("List your degrees and relevant certifications in a dedicated education section")
+    recommendations.append("Include quantifiable achievements and metrics in your resume")
+
+    return {
+        "ats_score": ats_score,
+        "matched_skills": matched_skills,
+        "missing_skills": local['missing_skills'],
+        "summary": summary,
+        "experience_match": experience_match,
+        "education_match": education_match,
+        "recommendations": recommendations,
+        "score_breakdown": breakdown,
+        "analysis_source": "local"
+    }
@@ -0,0 +1,251 @@
+import fnmatch
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from core.metrics import increment
+
+# Shared cache for expensive results (LLM analyses, embeddings, YouTube
+# recommendations), so every worker process benefits from work any of them
+# has done. Values are bytes; callers pick the serialization.
+#
+#   CACHE_BACKEND=sqlite  one SQLite file shared by the processes on a machine (default)
+#   CACHE_BACKEND=redis   a Redis server at REDIS_URL, shared across machines (pip install redis)
+#   CACHE_BACKEND=memory  this process only, through the in-process Redis fake
+#   CACHE_BACKEND=none    caching off
+#
+# A failing backend never fails a request: errors are logged and count as misses.
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "sqlite").lower()
+CACHE_DB_PATH = os.environ.get("CACHE_DB_PATH", "cache.db")
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "20000"))
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+CACHE_KEY_PREFIX = "profilematch:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_created ON cache (created_at);
+"""
+
+
+class SQLiteCache:
+    """Cache in a local SQLite file, shared by every process that opens it"""
+
+    # Expired and surplus entries are trimmed once every this many writes
+    TRIM_EVERY = 256
+
+    def __init__(self, db_path=CACHE_DB_PATH, max_entries=CACHE_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def get(self, key):
+        row = self._conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] is not None and row[1] < time.time():
+            self._conn.execute("DELETE FROM cache WHERE key = ? AND expires_at < ?", (key, time.time()))
+            return None
+        return row[0]
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)",
+            (key, sqlite3.Binary(value), now + ttl if ttl else None, now)
+        )
+        self._writes += 1
+        if self._writes % self.TRIM_EVERY == 0:
+            self.trim()
+
+    def delete(self, key):
+        self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        self._conn.execute("DELETE FROM cache")
+
+    def trim(self):
+        """Drop expired entries and the oldest ones beyond max_entries"""
+        conn = self._conn
+        conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+        conn.execute(
+            "DELETE FROM cache WHERE key IN "
+            "(SELECT key FROM cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+
+class FakeRedis:
+    """In-process stand-in for the part of the redis client RedisCache uses"""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[name]
+                return None
+            return value
+
+    def set(self, name, value, ex=None):
+        with self._lock:
+            self._data[name] = (bytes(value), time.monotonic() + ex if ex else None)
+        return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match=None):
+        with self._lock:
+            names = list(self._data)
+        return iter(name for name in names if match is None or fnmatch.fnmatchcase(name, match))
+
+
+class RedisCache:
+    """Cache in Redis (or anything speaking its client API, like FakeRedis)"""
+
+    def __init__(self, url=REDIS_URL, client=None, prefix=CACHE_KEY_PREFIX):
+        if client is None:
+            # Optional dependency, only needed for this backend
+            import redis
+            client = redis.Redis.from_url(url, socket_timeout=2)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ttl=None):
+        # Redis takes whole seconds; int() would turn a sub-second ttl into no expiry
+        self.client.set(self.prefix + key, value, ex=math.ceil(ttl) if ttl else None)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for name in self.client.scan_iter(match=f"{self.prefix}*"):
+            self.client.delete(name)
+
+
+class NullCache:
+    """Backend that stores nothing"""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+
+def create_cache(backend=CACHE_BACKEND):
+    """Build the cache backend named by CACHE_BACKEND"""
+    if backend == 'redis':
+        return RedisCache()
+    if backend == 'memory':
+        return RedisCache(client=FakeRedis())
+    if backend == 'none':
+        return NullCache()
+    return SQLiteCache()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the process-wide cache backend"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = create_cache()
+                except Exception:
+                    logger.exception("Cache backend %r unavailable, caching disabled", CACHE_BACKEND)
+                    _cache = NullCache()
+    return _cache
+
+
+def set_cache(cache):
+    """Replace the process-wide cache backend, e.g. with a RedisCache(client=FakeRedis()) in tests"""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def cache_get(namespace, key):
+    """Cached bytes for key in namespace, or None on a miss or backend error"""
+    try:
+        value = get_cache().get(f"{namespace}:{key}")
+    except Exception:
+        logger.warning("Cache read failed for %s", namespace, exc_info=True)
+        increment('cache_errors_total', namespace=namespace)
+        return None
+    increment('cache_requests_total', namespace=namespace, result='hit' if value is not None else 'miss')
+    return value
+
+
+def cache_set(namespace, key, value, ttl=None):
+    """Store bytes for key in namespace; ttl is in seconds"""
+    try:
+        get_cache().set(f"{namespace}:{key}", value, ttl)
+    except Exception:
+        logger.warning("Cache write failed for %s", namespace, exc_info=True)
+        increment('cache_errors_total', namespace=namespace)
+
+
+def cache_get_json(namespace, key):
+    value = cache_get(namespace, key)
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return None
+
+
+def cache_set_json(namespace, key, value, ttl=None):
+    cache_set(namespace, key, json.dumps(value, separators=(',', ':')).encode('utf-8'), ttl)
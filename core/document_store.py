@@ -0,0 +1,213 @@
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from core.errors import StorageError
+
+# Content-addressed store for resume and job description texts. Each
+# normalized text is kept once, keyed by the SHA-256 of its UTF-8 bytes and
+# optionally compressed. A SQLite index tracks how many saved analyses refer
+# to each document, so a blob is removed when its last reference goes away.
+
+DOCUMENT_STORE_DIR = os.environ.get(
+    "DOCUMENT_STORE_DIR",
+    os.path.join(os.environ.get("SAVED_ANALYSES_DIR", "saved_analyses"), "documents")
+)
+# "zstd", "gzip" or "none"; zstd falls back to gzip when zstandard isn't installed
+DOCUMENT_COMPRESSION = os.environ.get("DOCUMENT_COMPRESSION", "zstd")
+
+CODEC_EXTENSIONS = {'none': '.txt', 'gzip': '.gz', 'zstd': '.zst'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    hash TEXT PRIMARY KEY,
+    refcount INTEGER NOT NULL,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def normalize_document(text):
+    """Canonical form a document is stored and hashed in"""
+    lines = (text or '').replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(line.rstrip() for line in lines).strip()
+
+
+def document_hash(text):
+    """SHA-256 key of a document, after normalization"""
+    return hashlib.sha256(normalize_document(text).encode('utf-8')).hexdigest()
+
+
+def _compress(data, codec):
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    if codec == 'gzip':
+        return gzip.compress(data, compresslevel=6)
+    return data
+
+
+def _decompress(data, codec):
+    if codec == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise StorageError("This document is zstd-compressed but zstandard is not installed.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == 'gzip':
+        return gzip.decompress(data)
+    return data
+
+
+class DocumentStore:
+    """Deduplicated, reference-counted text storage on the local filesystem"""
+
+    # Compressing very short texts costs more than it saves
+    MIN_COMPRESS_BYTES = 256
+
+    def __init__(self, root=DOCUMENT_STORE_DIR, compression=DOCUMENT_COMPRESSION):
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            compression = 'gzip'
+        if compression not in CODEC_EXTENSIONS:
+            raise ValueError(f"Unknown compression {compression!r}")
+        self.root = root
+        self.compression = compression
+        self._local = threading.local()
+
+        os.makedirs(root, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(os.path.join(self.root, "index.db"), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _blob_path(self, content_hash, codec):
+        return os.path.join(self.root, content_hash[:2], f"{content_hash}{CODEC_EXTENSIONS[codec]}")
+
+    def _transaction(self):
+        # BEGIN IMMEDIATE serializes writers across threads and processes, so
+        # a blob can't be deleted by one release while another put revives it
+        return _ImmediateTransaction(self._conn)
+
+    def put(self, text) -> str:
+        """Store a document (or add a reference to an existing one) and return its hash"""
+        data = normalize_document(text).encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE documents SET refcount = refcount + 1 WHERE hash = ?", (content_hash,)
+            ).rowcount
+            if not updated:
+                codec = self.compression if len(data) >= self.MIN_COMPRESS_BYTES else 'none'
+                stored = _compress(data, codec)
+                path = self._blob_path(content_hash, codec)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(stored)
+                os.replace(tmp_path, path)
+                conn.execute(
+                    "INSERT INTO documents (hash, refcount, codec, size, stored_size, created_at) "
+                    "VALUES (?, 1, ?, ?, ?, ?)",
+                    (content_hash, codec, len(data), len(stored), time.time())
+                )
+        return content_hash
+
+    def get(self, content_hash) -> Optional[str]:
+        """Return a stored document by hash, or None if it doesn't exist"""
+        row = self._conn.execute("SELECT codec FROM documents WHERE hash = ?", (content_hash,)).fetchone()
+        if row is None:
+            return None
+        try:
+            with open(self._blob_path(content_hash, row[0]), 'rb') as f:
+                return _decompress(f.read(), row[0]).decode('utf-8')
+        except FileNotFoundError:
+            return None
+
+    def release(self, content_hash) -> int:
+        """Drop one reference to a document, deleting it at zero; returns the remaining count"""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT refcount, codec FROM documents WHERE hash = ?", (content_hash,)
+            ).fetchone()
+            if row is None:
+                return 0
+            refcount, codec = row
+            if refcount > 1:
+                conn.execute("UPDATE documents SET refcount = refcount - 1 WHERE hash = ?", (content_hash,))
+                return refcount - 1
+            conn.execute("DELETE FROM documents WHERE hash = ?", (content_hash,))
+            try:
+                os.remove(self._blob_path(content_hash, codec))
+            except FileNotFoundError:
+                pass
+            return 0
+
+    def refcount(self, content_hash) -> int:
+        row = self._conn.execute("SELECT refcount FROM documents WHERE hash = ?", (content_hash,)).fetchone()
+        return row[0] if row else 0
+
+    def stats(self):
+        """Document count, references and raw vs. stored bytes"""
+        documents, references, raw_bytes, stored_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(refcount), 0), COALESCE(SUM(size), 0), "
+            "COALESCE(SUM(stored_size), 0) FROM documents"
+        ).fetchone()
+        return {
+            'documents': documents,
+            'references': references,
+            'raw_bytes': raw_bytes,
+            'stored_bytes': stored_bytes,
+            'compression': self.compression,
+        }
+
+
+class _ImmediateTransaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_document_store():
+    """Return the process-wide document store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = DocumentStore()
+    return _store
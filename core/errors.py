@@ -0,0 +1,26 @@
+# Exceptions raised by the core package. Adapters (Streamlit pages, the
+# HTTP API, CLIs) decide how to surface them; messages are user-facing.
+
+
+class ProFileMatchError(Exception):
+    """Base class for core errors"""
+
+
+class ExtractionError(ProFileMatchError):
+    """A document could not be read"""
+
+
+class UnsupportedFormatError(ExtractionError):
+    """The document's file type is not supported"""
+
+
+class AnalysisError(ProFileMatchError):
+    """A resume/job analysis could not be produced"""
+
+
+class StorageError(ProFileMatchError):
+    """Saved analyses could not be read or written"""
+
+
+class QuotaExceededError(AnalysisError):
+    """A user has used up their LLM token quota"""
@@ -0,0 +1,83 @@
+import os
+
+import PyPDF2
+
+from core.errors import ExtractionError, UnsupportedFormatError
+from core.metrics import timed
+from core.normalization import file_extension, normalize_text
+
+try:
+    from docx import Document
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+
+def supported_extensions():
+    """File extensions extract_text can read"""
+    extensions = ['pdf', 'txt']
+    if DOCX_AVAILABLE:
+        extensions.extend(['docx', 'doc'])
+    return extensions
+
+
+def extract_text_from_pdf(pdf_file) -> str:
+    """Extract text from PDF file"""
+    try:
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        text = ""
+        for page in pdf_reader.pages:
+            text += page.extract_text() + "\n"
+        return text.strip()
+    except Exception as e:
+        raise ExtractionError("Unable to read PDF file. Please try a different file or convert to text format.") from e
+
+
+def extract_text_from_txt(txt_file) -> str:
+    """Extract text from TXT file"""
+    try:
+        return str(txt_file.read(), "utf-8")
+    except Exception as e:
+        raise ExtractionError("Unable to read text file. Please check the file format and try again.") from e
+
+
+def extract_text_from_docx(docx_file) -> str:
+    """Extract text from DOCX file"""
+    if not DOCX_AVAILABLE:
+        raise UnsupportedFormatError("DOCX support not available. Please convert to PDF or TXT format.")
+
+    try:
+        doc = Document(docx_file)
+        return '\n'.join(paragraph.text for paragraph in doc.paragraphs)
+    except Exception as e:
+        raise ExtractionError("Unable to read DOCX file. Please check the file format and try again.") from e
+
+
+@timed('extract_text')
+def extract_text(file_obj, filename=None) -> str:
+    """Extract text from a PDF, TXT or DOCX file object, picking the reader by extension
+
+    filename defaults to file_obj.name. The text comes back normalized
+    (core.normalization). Raises ExtractionError.
+    """
+    name = filename if filename is not None else getattr(file_obj, 'name', '')
+    extension = file_extension(name)
+
+    if extension == 'pdf':
+        return normalize_text(extract_text_from_pdf(file_obj), dehyphenate=True)
+    elif extension == 'txt':
+        return normalize_text(extract_text_from_txt(file_obj))
+    elif extension in ['docx', 'doc']:
+        return normalize_text(extract_text_from_docx(file_obj))
+
+    supported_formats = ", ".join(ext.upper() for ext in supported_extensions())
+    raise UnsupportedFormatError(f"Unsupported file format. Please upload {supported_formats} files only.")
+
+
+def extract_text_from_path(path) -> str:
+    """Extract text from a document on disk"""
+    try:
+        with open(path, 'rb') as f:
+            return extract_text(f, os.path.basename(path))
+    except OSError as e:
+        raise ExtractionError(f"Unable to open {path}.") from e
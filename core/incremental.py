@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from core.analysis import analyze_resume_job_match, get_demo_analysis_results, llm_configured
+from core.document_store import document_hash
+from core.metrics import increment, timed
+from core.results import AnalysisResults
+from scoring_engine import split_resume_sections
+
+# Diff-aware re-analysis for users iterating on a resume against one job.
+# Each (user, job) pair keeps a baseline: the section fingerprints and
+# result of the last full analysis (the anchor) plus the last score shown.
+# Re-running after edits rescores locally, where only changed sections are
+# re-scanned for skills, and shifts the anchor's score by the change in the
+# local score. The LLM is called again once the edits since the anchor
+# cover more than INCREMENTAL_LLM_THRESHOLD of the resume, or when the
+# anchor itself is a local fallback from a run where the LLM failed.
+
+REANALYSIS_DB_PATH = os.environ.get("REANALYSIS_DB_PATH", "reanalysis.db")
+# Fraction of the resume's characters that must have changed since the last
+# full analysis before the LLM is called again
+INCREMENTAL_LLM_THRESHOLD = float(os.environ.get("INCREMENTAL_LLM_THRESHOLD", "0.25"))
+
+FULL = 'full'
+LLM = 'llm'
+LOCAL = 'local'
+UNCHANGED = 'unchanged'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS baselines (
+    user_email TEXT NOT NULL,
+    job_hash TEXT NOT NULL,
+    anchor_sections TEXT NOT NULL,
+    anchor_result TEXT NOT NULL,
+    anchor_local_score INTEGER NOT NULL,
+    last_sections TEXT NOT NULL,
+    last_score INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (user_email, job_hash)
+);
+"""
+
+
+def section_fingerprints(resume_text):
+    """[name, content hash, length] of each resume section"""
+    return [
+        [name, hashlib.sha256(text.encode('utf-8')).hexdigest()[:16], len(text)]
+        for name, text in split_resume_sections(resume_text)
+    ]
+
+
+def diff_sections(old, new):
+    """Names of changed sections and the fraction of characters they cover"""
+    old_by_name = {name: (digest, length) for name, digest, length in old}
+    new_by_name = {name: (digest, length) for name, digest, length in new}
+    changed = []
+    changed_chars = 0
+    for name, digest, length in new:
+        if old_by_name.get(name, (None,))[0] != digest:
+            changed.append(name)
+            changed_chars += length
+    for name, digest, length in old:
+        if name not in new_by_name:
+            changed.append(name)
+            changed_chars += length
+    total = max(sum(length for _, _, length in old), sum(length for _, _, length in new), 1)
+    return changed, min(changed_chars / total, 1.0)
+
+
+class ReanalysisStore:
+    """SQLite table of per-user, per-job analysis baselines"""
+
+    def __init__(self, db_path=REANALYSIS_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def get(self, user_email, job_hash):
+        row = self._conn.execute(
+            "SELECT * FROM baselines WHERE user_email = ? AND job_hash = ?", (user_email, job_hash)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'anchor_sections': json.loads(row['anchor_sections']),
+            'anchor_result': json.loads(row['anchor_result']),
+            'anchor_local_score': row['anchor_local_score'],
+            'last_sections': json.loads(row['last_sections']),
+            'last_score': row['last_score'],
+        }
+
+    def set_anchor(self, user_email, job_hash, sections, result, local_score):
+        """Record a full analysis as the new anchor (and last run)"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO baselines (user_email, job_hash, anchor_sections, anchor_result, "
+            "anchor_local_score, last_sections, last_score, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (user_email, job_hash, json.dumps(sections), json.dumps(result), local_score,
+             json.dumps(sections), result['ats_score'], time.time())
+        )
+
+    def set_last(self, user_email, job_hash, sections, score):
+        self._conn.execute(
+            "UPDATE baselines SET last_sections = ?, last_score = ?, updated_at = ? "
+            "WHERE user_email = ? AND job_hash = ?",
+            (json.dumps(sections), score, time.time(), user_email, job_hash)
+        )
+
+    def clear(self, user_email, job_hash=None):
+        """Forget a user's baselines (for one job, or all)"""
+        if job_hash is None:
+            self._conn.execute("DELETE FROM baselines WHERE user_email = ?", (user_email,))
+        else:
+            self._conn.execute("DELETE FROM baselines WHERE user_email = ? AND job_hash = ?", (user_email, job_hash))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_reanalysis_store():
+    """Return the process-wide baseline store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ReanalysisStore()
+    return _store
+
+
+# Per-run data that isn't carried over when an anchor is reused
+_RUN_FIELDS = ('resume_text', 'job_text', 'trace', 'id', 'llm_usage', 'llm_skipped', 'reanalysis')
+
+
+def _anchor_record(results):
+    return {key: value for key, value in results.items() if key not in _RUN_FIELDS}
+
+
+@timed('incremental_analyze')
+def analyze_incrementally(resume_text, job_description, user_email) -> AnalysisResults:
+    """Analyze, reusing the user's previous analysis of this job where the resume hasn't changed
+
+    The result has a 'reanalysis' entry with the mode used (full, llm,
+    local or unchanged), the sections changed since the previous run, and
+    the previous score and delta. Without a user_email this is a plain
+    analyze_resume_job_match().
+    """
+    if not user_email:
+        return analyze_resume_job_match(resume_text, job_description, user_email)
+
+    store = get_reanalysis_store()
+    job_hash = document_hash(job_description)
+    sections = section_fingerprints(resume_text)
+    baseline = store.get(user_email, job_hash)
+
+    if baseline is None:
+        mode, changed, previous_score = FULL, [], None
+    else:
+        changed, _ = diff_sections(baseline['last_sections'], sections)
+        _, anchor_change = diff_sections(baseline['anchor_sections'], sections)
+        previous_score = baseline['last_score']
+        # An anchor from the local fallback (quota exhausted, OpenAI error)
+        # is never reused while the LLM is configured; every run retries it
+        retry_llm = baseline['anchor_result'].get('analysis_source') == 'local' and llm_configured()
+        if retry_llm:
+            mode = LLM
+        elif anchor_change == 0:
+            mode = UNCHANGED
+        elif anchor_change >= INCREMENTAL_LLM_THRESHOLD and llm_configured():
+            mode = LLM
+        else:
+            mode = LOCAL
+
+    if mode in (FULL, LLM):
+        results = analyze_resume_job_match(resume_text, job_description, user_email)
+        if results.get('analysis_source') == 'local':
+            local_score = results['ats_score']
+        else:
+            local_score = get_demo_analysis_results(resume_text, job_description)['ats_score']
+        store.set_anchor(user_email, job_hash, sections, _anchor_record(results), local_score)
+    elif mode == UNCHANGED:
+        results = dict(baseline['anchor_result'])
+        store.set_last(user_email, job_hash, sections, results['ats_score'])
+    else:
+        results = get_demo_analysis_results(resume_text, job_description)
+        anchor = baseline['anchor_result']
+        if anchor.get('analysis_source') != 'local':
+            # Keep the LLM's scale: move its score by as much as the local score moved
+            shifted = anchor['ats_score'] + results['ats_score'] - baseline['anchor_local_score']
+            results['ats_score'] = int(min(max(shifted, 0), 100))
+            results['analysis_source'] = 'incremental'
+        store.set_last(user_email, job_hash, sections, results['ats_score'])
+
+    increment('incremental_analyses_total', mode=mode)
+    results['reanalysis'] = {
+        'mode': mode,
+        'changed_sections': changed,
+        'previous_score': previous_score,
+        'score_delta': results['ats_score'] - previous_score if previous_score is not None else None,
+    }
+    return results
@@ -0,0 +1,368 @@
+import argparse
+import json
+import logging
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import Counter
+
+import numpy as np
+
+from core.document_store import document_hash, get_document_store
+from core.metrics import timed
+from core.normalization import prepare_document
+
+# Reverse matching: which stored job postings best fit a resume. Postings
+# (job templates and the job texts of saved analyses) go into an inverted
+# index persisted in SQLite, one (term, document, frequency) row per
+# posting term, added to as analyses are saved. Each process mirrors the
+# index in memory as NumPy-ready posting lists and catches up on rows other
+# processes added, so a BM25 query is a few array operations.
+
+JOB_SEARCH_DB_PATH = os.environ.get("JOB_SEARCH_DB_PATH", "job_search.db")
+
+# Okapi BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SAVED = 'saved'
+TEMPLATE = 'template'
+
+_STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+for from had has have having he her his how i if in into is it its job jobs me more most my no not
+of on or our out over own role same she should so some such than that the their them then there
+these they this those through to too under up us very was we were what when where which while who
+will with within work would year years you your
+""".split())
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings_docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    hash TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    added_at REAL NOT NULL,
+    UNIQUE (source, hash)
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def index_terms(text):
+    """Term frequencies of a text as indexed and queried"""
+    return Counter(token for token in prepare_document(text).tokens
+                   if token not in _STOP_WORDS and len(token) > 1)
+
+
+def posting_title(text):
+    """Job title of a posting, from its **Job Title:**/**Position:** line or first line"""
+    from job_parser import parse_sections
+
+    sections = parse_sections(text)
+    for name in ('job title', 'position', 'title'):
+        if sections.get(name):
+            return sections[name].splitlines()[0].strip()[:120]
+    for line in (text or '').splitlines():
+        if line.strip():
+            return line.strip().strip('*# ')[:120]
+    return "Untitled posting"
+
+
+class JobSearchIndex:
+    """BM25 index over job postings, persisted in SQLite and mirrored in memory"""
+
+    def __init__(self, db_path=JOB_SEARCH_DB_PATH, k1=BM25_K1, b=BM25_B):
+        self.db_path = db_path
+        self.k1 = k1
+        self.b = b
+        self._local = threading.local()
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+        # In-memory mirror; positions index the per-document arrays
+        self._mirror_lock = threading.Lock()
+        self._generation = None
+        self._max_doc_id = 0
+        self._positions = {}
+        self._hashes = []
+        self._titles = []
+        self._sources = []
+        self._lengths = array('f')
+        self._deleted = np.zeros(0, dtype=bool)
+        self._postings = {}
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def add(self, text, source=SAVED, title=None):
+        """Index a posting (no-op if it is already indexed from source); returns its document hash
+
+        A text is indexed once per source, so a saved job description that
+        is also a template can be removed without hiding the template.
+        """
+        content_hash = document_hash(text)
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT id, deleted FROM postings_docs WHERE source = ? AND hash = ?", (source, content_hash)
+            ).fetchone()
+            if row is not None:
+                if row[1]:
+                    conn.execute("UPDATE postings_docs SET deleted = 0 WHERE id = ?", (row[0],))
+                    conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+            else:
+                terms = index_terms(text)
+                doc_id = conn.execute(
+                    "INSERT INTO postings_docs (hash, source, title, length, added_at) VALUES (?, ?, ?, ?, ?)",
+                    (content_hash, source, title or posting_title(text), sum(terms.values()), time.time())
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    ((term, doc_id, tf) for term, tf in terms.items())
+                )
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return content_hash
+
+    def remove(self, content_hash, source=SAVED):
+        """Drop a posting indexed from source from search results"""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            updated = conn.execute(
+                "UPDATE postings_docs SET deleted = 1 WHERE source = ? AND hash = ? AND deleted = 0",
+                (source, content_hash)
+            ).rowcount
+            if updated:
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return bool(updated)
+
+    def _refresh(self):
+        # Catch up with rows added (by any process) since the last refresh
+        conn = self._conn
+        generation = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0]
+        if generation == self._generation:
+            return
+        docs = conn.execute(
+            "SELECT id, hash, source, title, length FROM postings_docs WHERE id > ? ORDER BY id",
+            (self._max_doc_id,)
+        ).fetchall()
+        for doc_id, content_hash, source, title, length in docs:
+            self._positions[doc_id] = len(self._hashes)
+            self._hashes.append(content_hash)
+            self._sources.append(source)
+            self._titles.append(title)
+            self._lengths.append(length)
+        if docs:
+            rows = conn.execute(
+                "SELECT term, doc_id, tf FROM postings WHERE doc_id > ? AND doc_id <= ?",
+                (self._max_doc_id, docs[-1][0])
+            )
+            for term, doc_id, tf in rows:
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = (array('i'), array('f'))
+                posting[0].append(self._positions[doc_id])
+                posting[1].append(tf)
+            self._max_doc_id = docs[-1][0]
+
+        deleted = np.zeros(len(self._hashes), dtype=bool)
+        for (doc_id,) in conn.execute("SELECT id FROM postings_docs WHERE deleted = 1 AND id <= ?",
+                                      (self._max_doc_id,)):
+            deleted[self._positions[doc_id]] = True
+        self._deleted = deleted
+        self._generation = generation
+
+    @timed('job_search')
+    def search(self, query_text, top_k=10, source=None):
+        """Postings ranked by BM25 against query_text (e.g. a resume), best first
+
+        Returns dicts with hash, title, source and score.
+        """
+        query_terms = index_terms(query_text)
+        with self._mirror_lock:
+            self._refresh()
+            n_docs = len(self._hashes)
+            if not n_docs or not query_terms:
+                return []
+            live = ~self._deleted
+            if source is not None:
+                live &= np.array([s == source for s in self._sources], dtype=bool)
+            n_live = int(live.sum())
+            if not n_live:
+                return []
+
+            lengths = np.frombuffer(self._lengths, dtype=np.float32, count=n_docs)
+            average_length = float(lengths[live].mean()) or 1.0
+            length_norm = self.k1 * (1 - self.b + self.b * lengths / average_length)
+
+            scores = np.zeros(n_docs, dtype=np.float32)
+            for term in query_terms:
+                posting = self._postings.get(term)
+                if posting is None:
+                    continue
+                positions = np.frombuffer(posting[0], dtype=np.int32)
+                tfs = np.frombuffer(posting[1], dtype=np.float32)
+                df = int(np.count_nonzero(live[positions]))
+                if not df:
+                    continue
+                idf = math.log(1 + (n_live - df + 0.5) / (df + 0.5))
+                scores[positions] += idf * tfs * (self.k1 + 1) / (tfs + length_norm[positions])
+            scores[~live] = 0.0
+
+            # A text is indexed at most once per source, so twice as many
+            # candidates always leave top_k distinct texts
+            candidates = min(2 * top_k, n_docs)
+            top = np.argpartition(-scores, candidates - 1)[:candidates]
+            top = top[np.argsort(-scores[top], kind='stable')]
+            hits = []
+            seen = set()
+            for i in top:
+                if scores[i] <= 0 or len(hits) == top_k:
+                    break
+                if self._hashes[i] in seen:
+                    continue
+                seen.add(self._hashes[i])
+                hits.append({'hash': self._hashes[i], 'title': self._titles[i], 'source': self._sources[i],
+                             'score': round(float(scores[i]), 4)})
+            return hits
+
+    def stats(self):
+        documents, deleted = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(deleted), 0) FROM postings_docs"
+        ).fetchone()
+        terms = self._conn.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0]
+        return {'documents': documents - deleted, 'deleted': deleted, 'terms': terms}
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_job_search_index():
+    """Return the process-wide posting index, with the job templates indexed"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = JobSearchIndex()
+                index_templates(index)
+                _index = index
+    return _index
+
+
+def index_templates(index):
+    """Add every job template to an index"""
+    # Imported here: the template modules pull in the Streamlit UI
+    from template_index import collect_templates
+
+    for name, text in collect_templates().items():
+        index.add(text, source=TEMPLATE, title=name)
+
+
+def index_saved_posting(job_text):
+    """Add a saved analysis's job description; indexing problems never fail the save"""
+    try:
+        get_job_search_index().add(job_text, source=SAVED)
+    except (sqlite3.Error, OSError):
+        logger.warning("Could not index job posting", exc_info=True)
+
+
+def unindex_saved_posting(content_hash):
+    try:
+        get_job_search_index().remove(content_hash, source=SAVED)
+    except (sqlite3.Error, OSError):
+        logger.warning("Could not remove job posting from the index", exc_info=True)
+
+
+def posting_text(hit):
+    """Full text of a search hit"""
+    if hit['source'] == TEMPLATE:
+        from template_index import get_template_index
+
+        entry = get_template_index().get(hit['title'])
+        return entry.text if entry is not None else None
+    return get_document_store().get(hit['hash'])
+
+
+def rebuild(index=None):
+    """Index the templates and the job description of every saved analysis"""
+    from core.storage import iter_analyses
+
+    index = index or get_job_search_index()
+    index_templates(index)
+    store = get_document_store()
+    for record in iter_analyses():
+        content_hash = record.job_text_hash
+        text = store.get(content_hash) if content_hash else None
+        if text:
+            index.add(text, source=SAVED)
+    return index.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BM25 search over stored job postings")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('rebuild', help="Index all templates and saved job descriptions")
+    subparsers.add_parser('stats', help="Show index size")
+    query = subparsers.add_parser('query', help="Find the postings that best fit a resume")
+    query.add_argument('resume', help="Resume file (PDF, DOCX or TXT)")
+    query.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == 'rebuild':
+        print(json.dumps(rebuild(), indent=2))
+    elif args.command == 'stats':
+        print(json.dumps(get_job_search_index().stats(), indent=2))
+    else:
+        from core.extraction import extract_text_from_path
+
+        started = time.perf_counter()
+        hits = get_job_search_index().search(extract_text_from_path(args.resume), top_k=args.top)
+        for rank, hit in enumerate(hits, 1):
+            print(f"{rank:>3}. {hit['score']:8.3f}  [{hit['source']}] {hit['title']}")
+        print(f"{len(hits)} results in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+import bisect
+import contextvars
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Lightweight in-process instrumentation. Stage timers feed latency
+# histograms and call counters that render in the Prometheus text format,
+# and every timed stage inside a trace() block is also recorded on that
+# trace, so a single analysis can report where its time went.
+#
+# Set METRICS_ENABLED=0 to turn timers into a flag check and a direct call.
+# Metrics are per process; with several API workers, scrape each one.
+
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1").lower() not in ("0", "false", "no")
+METRICS_PREFIX = "profilematch"
+
+# Seconds; spans cheap local scoring up to slow LLM calls and big reports
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_lock = threading.Lock()
+_histograms = {}
+_counters = {}
+_current_trace = contextvars.ContextVar('profilematch_trace', default=None)
+
+
+def set_enabled(enabled):
+    """Turn instrumentation on or off at runtime"""
+    global METRICS_ENABLED
+    METRICS_ENABLED = bool(enabled)
+
+
+def observe(stage, seconds, outcome='ok'):
+    """Record one timed call of a stage"""
+    index = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+    with _lock:
+        histogram = _histograms.get(stage)
+        if histogram is None:
+            histogram = _histograms[stage] = {'buckets': [0] * len(LATENCY_BUCKETS), 'sum': 0.0, 'count': 0}
+        if index < len(LATENCY_BUCKETS):
+            histogram['buckets'][index] += 1
+        histogram['sum'] += seconds
+        histogram['count'] += 1
+        key = (f"{METRICS_PREFIX}_stage_calls_total", (('outcome', outcome), ('stage', stage)))
+        _counters[key] = _counters.get(key, 0) + 1
+
+    spans = _current_trace.get()
+    if spans is not None:
+        spans.append({'stage': stage, 'ms': round(seconds * 1000, 3), 'outcome': outcome})
+
+
+def increment(name, amount=1, **labels):
+    """Add to a counter; the metric is exported as <prefix>_<name>"""
+    if not METRICS_ENABLED:
+        return
+    key = (f"{METRICS_PREFIX}_{name}", tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+class _Timer:
+    __slots__ = ('stage', 'started')
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe(self.stage, time.perf_counter() - self.started, 'error' if exc_type else 'ok')
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(stage):
+    """Context manager timing a stage"""
+    return _Timer(stage) if METRICS_ENABLED else _NULL_TIMER
+
+
+def timed(stage):
+    """Decorator timing every call of a function as a stage"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not METRICS_ENABLED:
+                return func(*args, **kwargs)
+            with _Timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def trace(spans=None):
+    """Collect the stages timed inside this block (in this thread or task) into a list
+
+    Pass an existing list to continue a trace started elsewhere, e.g. the
+    extraction spans recorded before an analysis was queued.
+    """
+    spans = [] if spans is None else spans
+    token = _current_trace.set(spans)
+    try:
+        yield spans
+    finally:
+        _current_trace.reset(token)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for name, value in labels:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def render_prometheus():
+    """All metrics in the Prometheus text exposition format"""
+    with _lock:
+        histograms = {stage: {'buckets': list(h['buckets']), 'sum': h['sum'], 'count': h['count']}
+                      for stage, h in _histograms.items()}
+        counters = dict(_counters)
+
+    lines = []
+    name = f"{METRICS_PREFIX}_stage_duration_seconds"
+    lines.append(f"# HELP {name} Time spent in each pipeline stage")
+    lines.append(f"# TYPE {name} histogram")
+    for stage in sorted(histograms):
+        histogram = histograms[stage]
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, histogram['buckets']):
+            cumulative += count
+            lines.append(f'{name}_bucket{_format_labels((("stage", stage), ("le", repr(bound))))} {cumulative}')
+        lines.append(f'{name}_bucket{_format_labels((("stage", stage), ("le", "+Inf")))} {histogram["count"]}')
+        lines.append(f'{name}_sum{_format_labels((("stage", stage),))} {histogram["sum"]:.6f}')
+        lines.append(f'{name}_count{_format_labels((("stage", stage),))} {histogram["count"]}')
+
+    by_name = {}
+    for (counter_name, labels), value in counters.items():
+        by_name.setdefault(counter_name, []).append((labels, value))
+    for counter_name in sorted(by_name):
+        lines.append(f"# TYPE {counter_name} counter")
+        for labels, value in sorted(by_name[counter_name]):
+            lines.append(f"{counter_name}{_format_labels(labels)} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def get_stage_summary():
+    """Call count, mean and total seconds per stage"""
+    with _lock:
+        return {
+            stage: {
+                'count': h['count'],
+                'total_seconds': round(h['sum'], 6),
+                'mean_ms': round(h['sum'] * 1000 / h['count'], 3) if h['count'] else 0.0,
+            }
+            for stage, h in _histograms.items()
+        }
+
+
+def reset_metrics():
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+# One text normalization pipeline for every document. Extraction runs
+# normalize_text() once on each document; stages that need sentences or
+# tokens call prepare_document(), which caches them by content hash so a
+# document is split and tokenized once no matter how many stages use it.
+
+PREPARED_CACHE_MAX_ENTRIES = 256
+
+# NFKC already expands ligatures (ﬁ -> fi) and odd spaces; these are the
+# characters it leaves alone that PDF and Word exports are full of
+_CHARACTER_MAP = str.maketrans({
+    '‘': "'", '’': "'", '‚': "'", '‛': "'",
+    '“': '"', '”': '"', '„': '"', '‟': '"',
+    '–': '-', '—': '-', '−': '-',
+    '­': None, '​': None, '‌': None, '‍': None, '⁠': None, '﻿': None,
+})
+
+# Bullet glyphs at the start of a line become a markdown "- " bullet
+_BULLET_RE = re.compile(r'^[ \t]*[•●▪▫◦‣⁃∙·■□'
+                        r'➢➤➔→✓✔★☆][ \t]*',
+                        re.MULTILINE)
+# A word broken across lines by a PDF line wrap: "develop-\nment"
+_HYPHENATION_RE = re.compile(r'(?<=[a-z])-\n(?=[a-z])')
+_INLINE_SPACE_RE = re.compile(r'[ \t\f\v]+')
+_TRAILING_SPACE_RE = re.compile(r' +$', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Sentence ends at ./!/? followed by whitespace and an upper-case letter,
+# digit or quote, unless the period belongs to a common abbreviation
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+(?=["\'(\[]?[A-Z0-9])')
+_ABBREVIATION_RE = re.compile(r'(?:\b(?:e\.g|i\.e|etc|vs|mr|mrs|ms|dr|prof|sr|jr|inc|ltd|co|no|approx|dept|st)'
+                              r'|\b[A-Z])\.$', re.IGNORECASE)
+_LIST_LINE_RE = re.compile(r'^\s*(?:[-+]|\d{1,2}[.)])\s+')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+
+# Lower-case words, keeping the symbols in tech names (c++, c#, node.js, ci/cd)
+_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*(?:[./][a-z0-9+#]+)*')
+
+
+def normalize_text(text, dehyphenate=False):
+    """Canonical form of a document: NFKC, plain punctuation and bullets, tidy whitespace
+
+    Line breaks are kept, since headings and bullets carry meaning.
+    dehyphenate rejoins words split by line wraps; use it for PDF text.
+    """
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).translate(_CHARACTER_MAP)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if dehyphenate:
+        text = _HYPHENATION_RE.sub('', text)
+    text = _BULLET_RE.sub('- ', text)
+    text = _INLINE_SPACE_RE.sub(' ', text)
+    text = _TRAILING_SPACE_RE.sub('', text)
+    return _BLANK_LINES_RE.sub('\n\n', text).strip()
+
+
+def split_sentences(text):
+    """Sentences of a normalized text
+
+    Bullets and header lines are units of their own; a line continues the
+    previous one only when that line wraps mid-sentence (no closing
+    punctuation, and this line starts in lower case).
+    """
+    sentences = []
+    for block in _PARAGRAPH_BREAK_RE.split(text or ''):
+        lines = [line.strip() for line in block.split('\n') if line.strip()]
+        paragraph = []
+        for line in lines:
+            if (_LIST_LINE_RE.match(line) or not paragraph or paragraph[-1][-1:] in '.!?:'
+                    or not line[0].islower()):
+                if paragraph:
+                    sentences.extend(_split_paragraph(' '.join(paragraph)))
+                paragraph = [_LIST_LINE_RE.sub('', line)]
+            else:
+                paragraph.append(line)
+        if paragraph:
+            sentences.extend(_split_paragraph(' '.join(paragraph)))
+    return [sentence for sentence in sentences if sentence]
+
+
+def _split_paragraph(paragraph):
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(paragraph):
+        candidate = paragraph[start:match.start()]
+        if _ABBREVIATION_RE.search(candidate):
+            continue
+        sentences.append(candidate.strip())
+        start = match.end()
+    sentences.append(paragraph[start:].strip())
+    return sentences
+
+
+def tokenize(text):
+    """Lower-case word tokens"""
+    return _TOKEN_RE.findall((text or '').lower())
+
+
+def file_extension(filename):
+    """Lower-case extension of a file name without the dot ('' if none)"""
+    return os.path.splitext(filename or '')[1].lstrip('.').lower()
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedDocument:
+    text: str
+    sentences: Tuple[str, ...]
+    tokens: Tuple[str, ...]
+
+
+_prepared_cache = OrderedDict()
+_prepared_cache_lock = threading.Lock()
+
+
+def prepare_document(text):
+    """Normalized text, sentences and tokens of a document, cached by content hash"""
+    key = hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+    with _prepared_cache_lock:
+        cached = _prepared_cache.get(key)
+        if cached is not None:
+            _prepared_cache.move_to_end(key)
+            return cached
+
+    normalized = normalize_text(text)
+    prepared = PreparedDocument(normalized, tuple(split_sentences(normalized)), tuple(tokenize(normalized)))
+
+    with _prepared_cache_lock:
+        _prepared_cache[key] = prepared
+        while len(_prepared_cache) > PREPARED_CACHE_MAX_ENTRIES:
+            _prepared_cache.popitem(last=False)
+    return prepared
@@ -0,0 +1,66 @@
+import os
+from typing import List
+from urllib.parse import quote_plus
+
+from core.cache import cache_get_json, cache_set_json
+from core.metrics import timed
+from core.results import VideoRecommendation
+from youtube_client import get_youtube_client
+
+PLACEHOLDER_THUMBNAIL = "https://img.youtube.com/vi/dQw4w9WgXcQ/maxresdefault.jpg"
+# Recommendations per skill are shared by all users for this many seconds
+RECOMMENDATION_CACHE_TTL = int(os.environ.get("RECOMMENDATION_CACHE_TTL", str(24 * 3600)))
+
+
+def placeholder_recommendations(skill) -> List[VideoRecommendation]:
+    """YouTube search links for a skill, used when no API key is available"""
+    query = quote_plus(skill)
+    titles_and_queries = [
+        (f"Learn {skill} - Complete Tutorial", f"learn+{query}"),
+        (f"{skill} for Beginners - Full Course", f"{query}+tutorial"),
+        (f"Advanced {skill} Techniques", f"advanced+{query}"),
+        (f"{skill} Crash Course - 2024", f"{query}+crash+course"),
+        (f"Master {skill} in 30 Days", f"master+{query}"),
+        (f"{skill} Best Practices & Tips", f"{query}+best+practices"),
+    ]
+    return [
+        {
+            "title": title,
+            "url": f"https://youtube.com/search?q={search}",
+            "thumbnail": PLACEHOLDER_THUMBNAIL
+        }
+        for title, search in titles_and_queries
+    ]
+
+
+@timed('youtube_recommendations')
+def get_youtube_recommendations(skill, max_results=6) -> List[VideoRecommendation]:
+    """Get YouTube video recommendations for a specific skill
+
+    Raises youtube_client.YouTubeError if the API call fails.
+    """
+    client = get_youtube_client()
+    if not client.configured:
+        return placeholder_recommendations(skill)
+
+    key = f"{skill.strip().lower()}:{max_results}"
+    cached = cache_get_json('youtube_recommendations', key)
+    if cached is not None:
+        return cached
+
+    videos = client.search_videos(
+        f"learn {skill} tutorial programming",
+        max_results=max_results,
+        order="relevance",
+        regionCode="US"
+    )
+    recommendations = [
+        {
+            "title": video["title"],
+            "url": video["url"],
+            "thumbnail": video["thumbnail"]
+        }
+        for video in videos
+    ]
+    cache_set_json('youtube_recommendations', key, recommendations, RECOMMENDATION_CACHE_TTL)
+    return recommendations
@@ -0,0 +1,196 @@
+import json
+import marshal
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+from core.errors import AnalysisError
+
+# Shapes of the plain dicts the core returns. They stay dicts so results
+# remain JSON-serializable and picklable across processes and the API.
+# AnalysisResult is the validated, compact form used where many results
+# are held at once (saved histories) and for parsing untrusted LLM output.
+
+
+class AnalysisResults(TypedDict, total=False):
+    ats_score: int
+    matched_skills: List[str]
+    missing_skills: List[str]
+    summary: str
+    experience_match: str
+    education_match: str
+    recommendations: List[str]
+    score_breakdown: Dict[str, Dict[str, Any]]
+    analysis_source: str
+    resume_text: str
+    job_text: str
+
+
+class SavedAnalysis(AnalysisResults, total=False):
+    id: str
+    timestamp: str
+    user_email: str
+    resume_text_hash: str
+    job_text_hash: str
+
+
+class VideoRecommendation(TypedDict):
+    title: str
+    url: str
+    thumbnail: str
+
+
+# Header of AnalysisResult.to_bytes(); bump the version when fields change
+_BINARY_MAGIC = b'PMR\x01'
+_JSON_SEPARATORS = (',', ':')
+
+
+def _parse_score(value):
+    if isinstance(value, bool):
+        raise AnalysisError("The analysis returned an invalid ATS score.")
+    if isinstance(value, str):
+        value = value.strip().rstrip('%')
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        raise AnalysisError("The analysis returned an invalid ATS score.") from None
+    if score != score:
+        raise AnalysisError("The analysis returned an invalid ATS score.")
+    return int(round(min(max(score, 0.0), 100.0)))
+
+
+def _parse_strings(value, name):
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        # Models occasionally answer with "a, b, c" instead of a list
+        value = value.split(',')
+    if not isinstance(value, (list, tuple)):
+        raise AnalysisError(f"The analysis returned an invalid {name} list.")
+    return tuple(item.strip() if isinstance(item, str) else str(item) for item in value
+                 if item is not None and str(item).strip())
+
+
+def _parse_skills(value, name):
+    # Interned, so the same skill across a history of results is one string
+    skills = []
+    seen = set()
+    for skill in _parse_strings(value, name):
+        folded = skill.casefold()
+        if folded not in seen:
+            seen.add(folded)
+            skills.append(sys.intern(skill))
+    return tuple(skills)
+
+
+def _parse_text(value):
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """A validated analysis result; reads like a read-only dict via get() and []"""
+
+    ats_score: int
+    matched_skills: Tuple[str, ...] = ()
+    missing_skills: Tuple[str, ...] = ()
+    summary: str = ''
+    experience_match: str = ''
+    education_match: str = ''
+    recommendations: Tuple[str, ...] = ()
+    score_breakdown: Optional[Dict[str, Dict[str, Any]]] = None
+    analysis_source: Optional[str] = None
+    resume_text: Optional[str] = None
+    job_text: Optional[str] = None
+    id: Optional[str] = None
+    timestamp: Optional[str] = None
+    user_email: Optional[str] = None
+    resume_text_hash: Optional[str] = None
+    job_text_hash: Optional[str] = None
+    # Keys outside the model (trace, llm_usage, ...), kept as they are
+    extras: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Validate and normalize a result dict, e.g. parsed LLM output
+
+        Raises AnalysisError when the data isn't a usable analysis.
+        """
+        if not isinstance(data, dict):
+            raise AnalysisError("The analysis returned a malformed response.")
+        if 'ats_score' not in data:
+            raise AnalysisError("The analysis response has no ATS score.")
+        breakdown = data.get('score_breakdown')
+        if breakdown is not None and not isinstance(breakdown, dict):
+            raise AnalysisError("The analysis returned an invalid score breakdown.")
+        return cls(
+            ats_score=_parse_score(data['ats_score']),
+            matched_skills=_parse_skills(data.get('matched_skills'), 'matched skills'),
+            missing_skills=_parse_skills(data.get('missing_skills'), 'missing skills'),
+            summary=_parse_text(data.get('summary')) or '',
+            experience_match=_parse_text(data.get('experience_match')) or '',
+            education_match=_parse_text(data.get('education_match')) or '',
+            recommendations=_parse_strings(data.get('recommendations'), 'recommendations'),
+            score_breakdown=breakdown,
+            **{name: _parse_text(data.get(name)) for name in _OPTIONAL_TEXT_FIELDS},
+            extras={key: value for key, value in data.items() if key not in _FIELD_NAMES},
+        )
+
+    def to_dict(self) -> SavedAnalysis:
+        """Plain dict form; unset optional fields are left out"""
+        data = {}
+        for name in _FIELD_NAMES:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            data[name] = list(value) if isinstance(value, tuple) else value
+        data.update(self.extras)
+        return data
+
+    def to_json(self):
+        """Compact UTF-8 JSON"""
+        return json.dumps(self.to_dict(), separators=_JSON_SEPARATORS, ensure_ascii=False).encode('utf-8')
+
+    @classmethod
+    def from_json(cls, data):
+        return cls.from_dict(json.loads(data))
+
+    def to_bytes(self):
+        """Binary form for caches and IPC; tied to the Python version, so not for long-term storage"""
+        return _BINARY_MAGIC + marshal.dumps(
+            (tuple(getattr(self, name) for name in _FIELD_NAMES), self.extras)
+        )
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Inverse of to_bytes(); the data is trusted and not re-validated"""
+        if data[:len(_BINARY_MAGIC)] != _BINARY_MAGIC:
+            raise ValueError("Not an AnalysisResult in the current binary format")
+        values, extras = marshal.loads(data[len(_BINARY_MAGIC):])
+        if len(values) != len(_FIELD_NAMES):
+            raise ValueError("Not an AnalysisResult in the current binary format")
+        return cls(*values, extras=extras)
+
+    # Read-only mapping access, so code written against result dicts works unchanged
+
+    def get(self, key, default=None):
+        if key in _FIELD_NAMES:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extras.get(key, default)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(AnalysisResult) if f.name != 'extras')
+_OPTIONAL_TEXT_FIELDS = ('analysis_source', 'resume_text', 'job_text', 'id', 'timestamp',
+                         'user_email', 'resume_text_hash', 'job_text_hash')
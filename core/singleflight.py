@@ -0,0 +1,75 @@
+import hashlib
+import threading
+
+from core.metrics import increment
+
+# Coalescing of identical in-flight calls. While a call for a key is
+# running, further calls with the same key wait for it and get its result
+# (or its exception) instead of repeating the work; once it finishes the
+# key is forgotten, so this never serves stale results the way a cache can.
+# Only calls within one process are coalesced.
+
+
+def input_key(*parts):
+    """Stable hash of a call's inputs, for use as a single-flight key"""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = str(part).encode('utf-8')
+        # Length-prefixed so ("ab", "c") and ("a", "bc") don't collide
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome"""
+
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """Call func(*args, **kwargs) unless a call for key is already running
+
+        Returns (result, shared), where shared is True when the result came
+        from another caller's call. Shared results are the same object for
+        every caller, so don't mutate them.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            increment('singleflight_coalesced_total', group=self.name)
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result, False
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def in_flight(self):
+        """Number of keys with a call currently running"""
+        with self._lock:
+            return len(self._calls)
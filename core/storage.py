@@ -0,0 +1,296 @@
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from core.document_store import get_document_store
+from core.errors import AnalysisError, StorageError
+from core.metrics import timed
+from core.results import AnalysisResult, SavedAnalysis
+
+# Saved analyses live on disk as one small JSON record each. The resume and
+# job description texts go into the content-addressed document store, once
+# per distinct document, and records refer to them by hash. Records are
+# read back as AnalysisResult, so a long history stays compact in memory.
+# A SQLite index of (user, ID, timestamp) lets a listing open only the
+# current user's records.
+
+logger = logging.getLogger(__name__)
+
+SAVED_ANALYSES_DIR = os.environ.get("SAVED_ANALYSES_DIR", "saved_analyses")
+
+# Fields moved out of the record into the document store
+TEXT_FIELDS = ('resume_text', 'job_text')
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id TEXT PRIMARY KEY,
+    user_email TEXT,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS analyses_user ON analyses (user_email, timestamp);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _record_path(analysis_id):
+    # basename() keeps IDs from escaping the directory
+    return os.path.join(SAVED_ANALYSES_DIR, f"{os.path.basename(analysis_id)}.json")
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class AnalysisIndex:
+    """SQLite index of the saved analyses in a directory, by user"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._local = threading.local()
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_INDEX_SCHEMA)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute("SELECT 1 FROM meta WHERE key = 'built'").fetchone() is None:
+                    # One scan for the records saved before the index existed
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO analyses (id, user_email, timestamp) VALUES (?, ?, ?)",
+                        ((record.id, record.user_email, record.timestamp) for record in iter_analyses(directory))
+                    )
+                    conn.execute("INSERT INTO meta (key, value) VALUES ('built', ?)", (datetime.now().isoformat(),))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(os.path.join(self.directory, "index.db"), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def add(self, analysis_id, user_email, timestamp):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO analyses (id, user_email, timestamp) VALUES (?, ?, ?)",
+            (analysis_id, user_email, timestamp)
+        )
+
+    def remove(self, analysis_id):
+        self._conn.execute("DELETE FROM analyses WHERE id = ?", (analysis_id,))
+
+    def ids(self, user_email):
+        """IDs of a user's analyses, newest first"""
+        rows = self._conn.execute(
+            "SELECT id FROM analyses WHERE user_email = ? ORDER BY timestamp DESC", (user_email,)
+        )
+        return [row[0] for row in rows]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_analysis_index():
+    """Return the process-wide index of SAVED_ANALYSES_DIR"""
+    directory = SAVED_ANALYSES_DIR
+    index = _indexes.get(directory)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(directory)
+            if index is None:
+                index = _indexes[directory] = AnalysisIndex(directory)
+    return index
+
+
+def _resolve_texts(record):
+    store = get_document_store()
+    for field in TEXT_FIELDS:
+        content_hash = getattr(record, f"{field}_hash")
+        if content_hash and getattr(record, field) is None:
+            setattr(record, field, store.get(content_hash))
+    return record
+
+
+@timed('storage_save')
+def save_analysis_result(results, user_email) -> str:
+    """Save analysis result to persistent storage and return its ID"""
+    now = datetime.now()
+    analysis_id = f"analysis_{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+    try:
+        record = AnalysisResult.from_dict(results)
+    except AnalysisError as e:
+        raise StorageError("Unable to save results. Please try again.") from e
+    record.id = analysis_id
+    record.timestamp = now.isoformat()
+    record.user_email = user_email
+
+    job_text = record.job_text
+    store = get_document_store()
+    referenced = []
+    try:
+        os.makedirs(SAVED_ANALYSES_DIR, exist_ok=True)
+        for field in TEXT_FIELDS:
+            text = getattr(record, field)
+            setattr(record, field, None)
+            if text:
+                setattr(record, f"{field}_hash", store.put(text))
+                referenced.append(getattr(record, f"{field}_hash"))
+        path = _record_path(analysis_id)
+        _write_atomic(path, record.to_json())
+        try:
+            get_analysis_index().add(analysis_id, user_email, record.timestamp)
+        except sqlite3.Error:
+            # An unindexed record would never be listed
+            os.remove(path)
+            raise
+    except (OSError, sqlite3.Error, TypeError, ValueError) as e:
+        for content_hash in referenced:
+            store.release(content_hash)
+        raise StorageError("Unable to save results. Please try again.") from e
+
+    if job_text:
+        from core.job_search import index_saved_posting
+        index_saved_posting(job_text)
+    return analysis_id
+
+
+def _read_record(path, analysis_id):
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        record = AnalysisResult.from_json(data)
+    except AnalysisError as e:
+        raise ValueError(f"Invalid saved analysis {analysis_id}") from e
+    # Records saved before IDs were introduced are identified by their file name
+    if record.id is None:
+        record.id = analysis_id
+    return record
+
+
+@timed('storage_get')
+def get_analysis(analysis_id, user_email=None, include_texts=True) -> Optional[SavedAnalysis]:
+    """Load one saved analysis, or None if it doesn't exist or belongs to someone else"""
+    try:
+        record = _read_record(_record_path(analysis_id), analysis_id)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        raise StorageError("Unable to load saved results. Please refresh the page.") from e
+
+    if user_email is not None and record.user_email != user_email:
+        return None
+    return (_resolve_texts(record) if include_texts else record).to_dict()
+
+
+def _read_listed_record(path, analysis_id):
+    # Records that can't be read as an analysis (e.g. legacy ones saved from
+    # unvalidated LLM output) are logged and skipped, so one bad file doesn't
+    # hide a whole history
+    try:
+        return _read_record(path, analysis_id)
+    except FileNotFoundError:
+        # Deleted since it was listed
+        return None
+    except ValueError:
+        logger.warning("Skipping unreadable saved analysis %s", analysis_id, exc_info=True)
+        return None
+
+
+def iter_analyses(directory=None) -> Iterator[AnalysisResult]:
+    """Every readable saved analysis record, of all users, without texts and in no particular order"""
+    directory = directory or SAVED_ANALYSES_DIR
+    if not os.path.exists(directory):
+        return
+    for filename in os.listdir(directory):
+        if filename.endswith('.json'):
+            record = _read_listed_record(os.path.join(directory, filename), filename[:-len('.json')])
+            if record is not None:
+                yield record
+
+
+@timed('storage_list')
+def load_user_analyses(user_email, include_texts=False) -> List[AnalysisResult]:
+    """Load all analyses for a specific user, newest first
+
+    Records come back without the resume/job texts unless include_texts is set.
+    """
+    if not os.path.exists(SAVED_ANALYSES_DIR):
+        return []
+
+    user_analyses = []
+    try:
+        for analysis_id in get_analysis_index().ids(user_email):
+            record = _read_listed_record(_record_path(analysis_id), analysis_id)
+            if record is None or record.user_email != user_email:
+                continue
+            user_analyses.append(_resolve_texts(record) if include_texts else record)
+    except (OSError, sqlite3.Error) as e:
+        raise StorageError("Unable to load saved results. Please refresh the page.") from e
+    return user_analyses
+
+
+@timed('storage_delete')
+def delete_analysis(analysis_id, user_email=None) -> bool:
+    """Delete a saved analysis, returning False if it did not exist
+
+    Releases the record's references to its documents; a document is
+    removed from the store once no saved analysis uses it.
+    """
+    record = get_analysis(analysis_id, user_email, include_texts=False)
+    if record is None:
+        return False
+    try:
+        os.remove(_record_path(analysis_id))
+        get_analysis_index().remove(analysis_id)
+        store = get_document_store()
+        for field in TEXT_FIELDS:
+            content_hash = record.get(f"{field}_hash")
+            if content_hash and store.release(content_hash) == 0 and field == 'job_text':
+                # No saved analysis uses this posting any more
+                from core.job_search import unindex_saved_posting
+                unindex_saved_posting(content_hash)
+    except FileNotFoundError:
+        # Deleted concurrently; that delete released the references
+        return False
+    except (OSError, sqlite3.Error) as e:
+        raise StorageError("Unable to delete analysis. Please try again.") from e
+    return True
+
+
+def analysis_export_rows(analyses):
+    """Flatten analyses into one row dict each for CSV export"""
+    rows = []
+    for analysis in analyses:
+        rows.append({
+            'Timestamp': analysis.get('timestamp', ''),
+            'ATS Score': analysis.get('ats_score', 0),
+            'Matched Skills Count': len(analysis.get('matched_skills', [])),
+            'Missing Skills Count': len(analysis.get('missing_skills', [])),
+            'Matched Skills': ', '.join(analysis.get('matched_skills', [])),
+            'Missing Skills': ', '.join(analysis.get('missing_skills', [])),
+            'Summary': analysis.get('summary', ''),
+            'Experience Match': analysis.get('experience_match', ''),
+            'Education Match': analysis.get('education_match', '')
+        })
+    return rows
@@ -0,0 +1,105 @@
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+from core.normalization import prepare_document, tokenize
+
+# Extractive summaries for resumes and postings without an LLM. Sentences
+# are ranked with TextRank: PageRank over a graph whose edge weights are
+# sentence similarities, from TF-IDF vectors or from sentence embeddings
+# when the caller already has them. The top sentences come back in
+# document order.
+
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+# Lines shorter than this (names, headings, dates) are never picked
+MIN_SENTENCE_TOKENS = 4
+# Longer documents are ranked on their first sentences only, to bound the cost
+MAX_SENTENCES = 400
+
+_EMPHASIS_RE = re.compile(r'\*\*([^*]+)\*\*')
+
+
+def summary_candidates(text):
+    """The sentences of a document that a summary may use, in document order"""
+    seen = set()
+    candidates = []
+    for sentence in prepare_document(text).sentences[:MAX_SENTENCES]:
+        # Job postings use **Header:** markdown
+        sentence = _EMPHASIS_RE.sub(r'\1', sentence)
+        key = sentence.lower()
+        if key in seen or len(tokenize(sentence)) < MIN_SENTENCE_TOKENS:
+            continue
+        seen.add(key)
+        candidates.append(sentence)
+    return candidates
+
+
+def tfidf_matrix(sentences):
+    """L2-normalized TF-IDF rows (sublinear tf), one per sentence"""
+    token_counts = [Counter(tokenize(sentence)) for sentence in sentences]
+    vocabulary = {}
+    for counts in token_counts:
+        for token in counts:
+            vocabulary.setdefault(token, len(vocabulary))
+
+    matrix = np.zeros((len(sentences), len(vocabulary)), dtype=np.float32)
+    for row, counts in enumerate(token_counts):
+        for token, count in counts.items():
+            matrix[row, vocabulary[token]] = 1.0 + math.log(count)
+
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    matrix *= np.log((1 + len(sentences)) / (1 + document_frequency)) + 1.0
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def textrank(vectors):
+    """TextRank scores of sentences given as L2-normalized row vectors"""
+    similarity = np.clip(vectors @ vectors.T, 0.0, None)
+    np.fill_diagonal(similarity, 0.0)
+    n = similarity.shape[0]
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # A sentence similar to nothing spreads its score evenly
+    transition = np.where(out_weight > 0, similarity / np.where(out_weight == 0, 1.0, out_weight), 1.0 / n)
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1 - DAMPING) / n + DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+
+def summarize(text, max_sentences=3, sentence_embeddings=None):
+    """The most informative sentences of a document, in document order
+
+    sentence_embeddings optionally maps each sentence of
+    summary_candidates(text) to its embedding (a dict, or an array with one
+    row per candidate); without it sentences are compared by TF-IDF.
+    """
+    sentences = summary_candidates(text)
+    if len(sentences) <= max_sentences:
+        return sentences
+
+    vectors = None
+    if sentence_embeddings is not None:
+        if isinstance(sentence_embeddings, dict):
+            rows = [sentence_embeddings.get(sentence) for sentence in sentences]
+            if all(row is not None for row in rows):
+                vectors = np.asarray(rows, dtype=np.float32)
+        elif len(sentence_embeddings) == len(sentences):
+            vectors = np.asarray(sentence_embeddings, dtype=np.float32)
+    if vectors is None:
+        vectors = tfidf_matrix(sentences)
+    else:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1.0, norms)
+
+    scores = textrank(vectors)
+    top = sorted(np.argsort(-scores, kind='stable')[:max_sentences])
+    return [sentences[i] for i in top]
@@ -0,0 +1,262 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from core.errors import QuotaExceededError
+
+# Accounting for OpenAI calls. Every call gets a row with its model, tokens,
+# latency and cost, so spend can be aggregated per user and per day. Before
+# a call, its estimated tokens are reserved against the user's daily quota
+# in the same transaction as the quota check, so concurrent requests can't
+# overshoot it; the reservation is then replaced by the real usage.
+
+LLM_USAGE_DB_PATH = os.environ.get("LLM_USAGE_DB_PATH", "usage.db")
+# Default tokens per user per UTC day; 0 disables the quota
+LLM_DAILY_TOKEN_QUOTA = int(os.environ.get("LLM_DAILY_TOKEN_QUOTA", "0"))
+
+# gpt-4o list prices in USD per 1K tokens
+LLM_INPUT_COST_PER_1K = float(os.environ.get("LLM_INPUT_COST_PER_1K", "0.0025"))
+LLM_OUTPUT_COST_PER_1K = float(os.environ.get("LLM_OUTPUT_COST_PER_1K", "0.01"))
+
+# Prompt scaffolding around the two documents and a typical JSON answer
+PROMPT_OVERHEAD_TOKENS = 350
+EXPECTED_COMPLETION_TOKENS = 450
+
+ANONYMOUS_USER = "anonymous"
+
+PENDING = 'pending'
+OK = 'ok'
+ERROR = 'error'
+# Shared another caller's in-flight completion, so used no tokens of its own
+COALESCED = 'coalesced'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_calls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_email TEXT NOT NULL,
+    day TEXT NOT NULL,
+    model TEXT NOT NULL,
+    status TEXT NOT NULL,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    reserved_tokens INTEGER NOT NULL DEFAULT 0,
+    latency_ms REAL,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS llm_calls_user_day ON llm_calls (user_email, day);
+CREATE INDEX IF NOT EXISTS llm_calls_day ON llm_calls (day);
+CREATE TABLE IF NOT EXISTS user_quotas (
+    user_email TEXT PRIMARY KEY,
+    daily_tokens INTEGER NOT NULL
+);
+"""
+
+
+def estimate_llm_tokens(resume_text, job_description):
+    """Approximate (prompt, completion) tokens of one analysis at ~4 characters per token"""
+    prompt_tokens = (len(resume_text) + len(job_description)) // 4 + PROMPT_OVERHEAD_TOKENS
+    return prompt_tokens, EXPECTED_COMPLETION_TOKENS
+
+
+def estimate_llm_cost(prompt_tokens, completion_tokens):
+    """USD cost of one completion"""
+    return (prompt_tokens / 1000) * LLM_INPUT_COST_PER_1K + (completion_tokens / 1000) * LLM_OUTPUT_COST_PER_1K
+
+
+def _today():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+
+class UsageLedger:
+    """SQLite ledger of OpenAI calls with per-user daily token quotas"""
+
+    def __init__(self, db_path=LLM_USAGE_DB_PATH, default_daily_quota=LLM_DAILY_TOKEN_QUOTA):
+        self.db_path = db_path
+        self.default_daily_quota = default_daily_quota
+        self._local = threading.local()
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def get_quota(self, user_email):
+        """Daily token quota of a user (0 means unlimited)"""
+        row = self._conn.execute(
+            "SELECT daily_tokens FROM user_quotas WHERE user_email = ?", (user_email or ANONYMOUS_USER,)
+        ).fetchone()
+        return row['daily_tokens'] if row else self.default_daily_quota
+
+    def set_quota(self, user_email, daily_tokens):
+        """Override a user's daily token quota; None restores the default"""
+        if daily_tokens is None:
+            self._conn.execute("DELETE FROM user_quotas WHERE user_email = ?", (user_email,))
+        else:
+            self._conn.execute(
+                "INSERT INTO user_quotas (user_email, daily_tokens) VALUES (?, ?) "
+                "ON CONFLICT(user_email) DO UPDATE SET daily_tokens = excluded.daily_tokens",
+                (user_email, int(daily_tokens))
+            )
+
+    def _tokens_used(self, conn, user_email, day):
+        # Pending calls count with their reservation, finished ones with real usage
+        return conn.execute(
+            "SELECT COALESCE(SUM(CASE WHEN status = ? THEN reserved_tokens "
+            "ELSE prompt_tokens + completion_tokens END), 0) "
+            "FROM llm_calls WHERE user_email = ? AND day = ?",
+            (PENDING, user_email, day)
+        ).fetchone()[0]
+
+    def tokens_used_today(self, user_email):
+        return self._tokens_used(self._conn, user_email or ANONYMOUS_USER, _today())
+
+    def remaining_tokens_today(self, user_email):
+        """Tokens left in today's quota, or None when the user has no quota"""
+        quota = self.get_quota(user_email)
+        if not quota:
+            return None
+        return max(quota - self.tokens_used_today(user_email), 0)
+
+    def reserve(self, user_email, model, estimated_tokens):
+        """Check the quota and reserve tokens for a call; returns the call ID
+
+        Raises QuotaExceededError when the reservation would exceed the
+        user's daily quota.
+        """
+        user_email = user_email or ANONYMOUS_USER
+        day = _today()
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            quota = self.get_quota(user_email)
+            if quota:
+                used = self._tokens_used(conn, user_email, day)
+                if used + estimated_tokens > quota:
+                    raise QuotaExceededError(
+                        f"Daily AI analysis limit reached ({used:,} of {quota:,} tokens used today)."
+                    )
+            call_id = conn.execute(
+                "INSERT INTO llm_calls (user_email, day, model, status, reserved_tokens, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (user_email, day, model, PENDING, estimated_tokens, time.time())
+            ).lastrowid
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return call_id
+
+    def complete(self, call_id, prompt_tokens, completion_tokens, latency_seconds, status=OK):
+        """Replace a reservation with the call's actual usage"""
+        self._conn.execute(
+            "UPDATE llm_calls SET status = ?, prompt_tokens = ?, completion_tokens = ?, "
+            "latency_ms = ?, cost_usd = ? WHERE id = ?",
+            (status, prompt_tokens, completion_tokens, round(latency_seconds * 1000, 1),
+             estimate_llm_cost(prompt_tokens, completion_tokens), call_id)
+        )
+
+    def _aggregate(self, group_by, where, params):
+        rows = self._conn.execute(
+            f"SELECT {group_by} AS key, COUNT(*) AS calls, "
+            "SUM(status = 'error') AS errors, SUM(status = 'coalesced') AS coalesced, "
+            "SUM(prompt_tokens) AS prompt_tokens, SUM(completion_tokens) AS completion_tokens, "
+            "SUM(cost_usd) AS cost_usd, AVG(latency_ms) AS avg_latency_ms "
+            f"FROM llm_calls WHERE status != ? {where} GROUP BY {group_by} ORDER BY {group_by}",
+            (PENDING, *params)
+        ).fetchall()
+        return [
+            {
+                group_by: row['key'],
+                'calls': row['calls'],
+                'errors': row['errors'],
+                'coalesced': row['coalesced'],
+                'prompt_tokens': row['prompt_tokens'],
+                'completion_tokens': row['completion_tokens'],
+                'total_tokens': row['prompt_tokens'] + row['completion_tokens'],
+                'cost_usd': round(row['cost_usd'], 6),
+                'avg_latency_ms': round(row['avg_latency_ms'], 1) if row['avg_latency_ms'] is not None else None,
+            }
+            for row in rows
+        ]
+
+    def usage_by_user(self, days=30):
+        """Totals per user over the last N days"""
+        since = (datetime.now(timezone.utc) - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        return self._aggregate('user_email', "AND day >= ?", (since,))
+
+    def usage_by_day(self, user_email=None, days=30):
+        """Totals per UTC day over the last N days, for one user or everyone"""
+        since = (datetime.now(timezone.utc) - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        if user_email:
+            return self._aggregate('day', "AND day >= ? AND user_email = ?", (since, user_email))
+        return self._aggregate('day', "AND day >= ?", (since,))
+
+    def release_stale_reservations(self, older_than_seconds=3600):
+        """Mark reservations left pending by a crashed process as failed"""
+        return self._conn.execute(
+            "UPDATE llm_calls SET status = ? WHERE status = ? AND created_at < ?",
+            (ERROR, PENDING, time.time() - older_than_seconds)
+        ).rowcount
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_usage_ledger():
+    """Return the process-wide usage ledger"""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                ledger = UsageLedger()
+                ledger.release_stale_reservations()
+                _ledger = ledger
+    return _ledger
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OpenAI usage and quotas")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    by_user = subparsers.add_parser('by-user', help="Token and cost totals per user")
+    by_user.add_argument('--days', type=int, default=30)
+    by_day = subparsers.add_parser('by-day', help="Token and cost totals per day")
+    by_day.add_argument('--days', type=int, default=30)
+    by_day.add_argument('--user')
+    quota = subparsers.add_parser('set-quota', help="Set a user's daily token quota")
+    quota.add_argument('user')
+    quota.add_argument('tokens', help="Daily tokens, 0 for unlimited, or 'default'")
+    args = parser.parse_args(argv)
+
+    ledger = get_usage_ledger()
+    if args.command == 'by-user':
+        print(json.dumps(ledger.usage_by_user(args.days), indent=2))
+    elif args.command == 'by-day':
+        print(json.dumps(ledger.usage_by_day(args.user, args.days), indent=2))
+    else:
+        ledger.set_quota(args.user, None if args.tokens == 'default' else int(args.tokens))
+        print(f"{args.user}: {ledger.get_quota(args.user) or 'unlimited'} tokens/day")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
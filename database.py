@@ -1,69 +1,41 @@
 import streamlit as st
-import json
-import os
 from datetime import datetime
 import pandas as pd
+from core import storage
+from core.errors import StorageError
+from profiling import profiled_page
 
 def save_analysis_result(results, user_email):
     """Save analysis result to persistent storage"""
-    
-    # Create results directory if it doesn't exist
-    if not os.path.exists("saved_analyses"):
-        os.makedirs("saved_analyses")
-    
-    # Add metadata
-    results_with_metadata = results.copy()
-    results_with_metadata.update({
-        'timestamp': datetime.now().isoformat(),
-        'user_email': user_email
-    })
-    
-    # Save to file
-    filename = f"saved_analyses/analysis_{user_email}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    
     try:
-        with open(filename, 'w') as f:
-            json.dump(results_with_metadata, f, indent=2)
-        return True, filename
-    except Exception as e:
-        st.error("Unable to save results. Please try again.")
+        return True, storage.save_analysis_result(results, user_email)
+    except StorageError as e:
+        st.error(str(e))
         return False, None
 
 def load_user_analyses(user_email):
     """Load all analyses for a specific user"""
-    
-    if not os.path.exists("saved_analyses"):
+    try:
+        return storage.load_user_analyses(user_email)
+    except StorageError as e:
+        st.error(str(e))
         return []
-    
-    user_analyses = []
-    
+
+def get_analysis(analysis_id, user_email):
+    """Load one saved analysis with its resume and job texts"""
     try:
-        for filename in os.listdir("saved_analyses"):
-            if filename.endswith('.json') and user_email in filename:
-                filepath = os.path.join("saved_analyses", filename)
-                with open(filepath, 'r') as f:
-                    analysis = json.load(f)
-                    analysis['filename'] = filename
-                    user_analyses.append(analysis)
-        
-        # Sort by timestamp (newest first)
-        user_analyses.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
-    except Exception as e:
-        st.error("Unable to load saved results. Please refresh the page.")
-    
-    return user_analyses
+        return storage.get_analysis(analysis_id, user_email)
+    except StorageError as e:
+        st.error(str(e))
+        return None
 
-def delete_analysis(filename):
+def delete_analysis(analysis_id, user_email):
     """Delete a saved analysis"""
     try:
-        filepath = os.path.join("saved_analyses", filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            return True
-    except Exception as e:
-        st.error("Unable to delete analysis. Please try again.")
-    return False
+        return storage.delete_analysis(analysis_id, user_email)
+    except StorageError as e:
+        st.error(str(e))
+        return False
 
 def export_analysis_to_csv(analyses):
     """Export analyses to CSV format"""
@@ -71,25 +43,9 @@ def export_analysis_to_csv(analyses):
     if not analyses:
         return None
     
-    # Flatten the data for CSV export
-    flattened_data = []
-    
-    for analysis in analyses:
-        row = {
-            'Timestamp': analysis.get('timestamp', ''),
-            'ATS Score': analysis.get('ats_score', 0),
-            'Matched Skills Count': len(analysis.get('matched_skills', [])),
-            'Missing Skills Count': len(analysis.get('missing_skills', [])),
-            'Matched Skills': ', '.join(analysis.get('matched_skills', [])),
-            'Missing Skills': ', '.join(analysis.get('missing_skills', [])),
-            'Summary': analysis.get('summary', ''),
-            'Experience Match': analysis.get('experience_match', ''),
-            'Education Match': analysis.get('education_match', '')
-        }
-        flattened_data.append(row)
-    
-    return pd.DataFrame(flattened_data)
+    return pd.DataFrame(storage.analysis_export_rows(analyses))
 
+@profiled_page('saved_results')
 def show_saved_results_page():
     """Display the saved results page"""
     
@@ -115,13 +71,9 @@ def show_saved_results_page():
         st.error("Session expired. Please log in again.")
         return
     
-    # Load saved analyses
+    # Load saved analyses (without the resume/job texts, those are fetched on demand)
     saved_analyses = load_user_analyses(user_email)
     
-    # Also include session-based results
-    if 'saved_results' in st.session_state and st.session_state.saved_results:
-        saved_analyses.extend(st.session_state.saved_results)
-    
     if not saved_analyses:
         st.markdown("""
             <div style="text-align: center; padding: 3rem; background: #2D2D2D; border-radius: 10px; margin: 2rem 0;">
@@ -232,9 +184,11 @@ def show_saved_results_page():
             with col1:
                 if st.button(f"📊 View Details #{i+1}", key=f"view_{i}"):
                     # Set this analysis as current and navigate to results
-                    st.session_state.analysis_results = analysis
-                    st.session_state.current_page = 'results'
-                    st.rerun()
+                    full_analysis = get_analysis(analysis['id'], user_email)
+                    if full_analysis:
+                        st.session_state.analysis_results = full_analysis
+                        st.session_state.current_page = 'results'
+                        st.rerun()
             
             with col2:
                 # Individual export
@@ -251,17 +205,9 @@ def show_saved_results_page():
             
             with col3:
                 if st.button(f"🗑️ Delete #{i+1}", key=f"delete_{i}", type="secondary"):
-                    # Delete from file system if it has a filename
-                    if 'filename' in analysis:
-                        if delete_analysis(analysis['filename']):
-                            st.success("Analysis deleted successfully!")
-                            st.rerun()
-                    else:
-                        # Delete from session state
-                        if analysis in st.session_state.saved_results:
-                            st.session_state.saved_results.remove(analysis)
-                            st.success("Analysis deleted successfully!")
-                            st.rerun()
+                    if delete_analysis(analysis['id'], user_email):
+                        st.success("Analysis deleted successfully!")
+                        st.rerun()
     
     # Action buttons at the bottom
     st.markdown("---")
@@ -1,68 +1,87 @@
 import streamlit as st
-import PyPDF2
-import io
-from ai_analyzer import analyze_resume_job_match
+import time
+from core import extraction
+from core.errors import ExtractionError
+from core.metrics import trace
+from profiling import profiled_page
 from job_templates import show_job_templates, get_template_content, clear_template
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+from job_queue import get_job_queue, submit_analysis_job, SUCCEEDED, FAILED
 
-def extract_text_from_pdf(pdf_file):
-    """Extract text from PDF file"""
+def _extract_or_report(extract, file_obj):
+    """Run a core extractor, showing its error in the page instead of raising"""
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
-    except Exception as e:
-        st.error("Unable to read PDF file. Please try a different file or convert to text format.")
+        return extract(file_obj)
+    except ExtractionError as e:
+        st.error(str(e))
         return None
 
+def extract_text_from_pdf(pdf_file):
+    """Extract text from PDF file"""
+    return _extract_or_report(extraction.extract_text_from_pdf, pdf_file)
+
 def extract_text_from_txt(txt_file):
     """Extract text from TXT file"""
-    try:
-        return str(txt_file.read(), "utf-8")
-    except Exception as e:
-        st.error("Unable to read text file. Please check the file format and try again.")
-        return None
+    return _extract_or_report(extraction.extract_text_from_txt, txt_file)
 
 def extract_text_from_docx(docx_file):
     """Extract text from DOCX file"""
-    if not DOCX_AVAILABLE:
-        st.error("DOCX support not available. Please convert to PDF or TXT format.")
-        return None
-    
-    try:
-        doc = Document(docx_file)
-        text = []
-        for paragraph in doc.paragraphs:
-            text.append(paragraph.text)
-        return '\n'.join(text)
-    except Exception as e:
-        st.error("Unable to read DOCX file. Please check the file format and try again.")
-        return None
+    return _extract_or_report(extraction.extract_text_from_docx, docx_file)
 
 def process_uploaded_file(uploaded_file):
     """Process uploaded file and extract text"""
     if uploaded_file is None:
         return None
+    return _extract_or_report(extraction.extract_text, uploaded_file)
+
+def _clear_analysis_job():
+    """Forget the tracked analysis job"""
+    st.session_state.pop('analysis_job_id', None)
+    st.query_params.pop('job', None)
+
+@st.fragment(run_every=1.0)
+def show_analysis_job_status():
+    """Show the progress of the queued analysis and open the results when it is done"""
+    job_id = st.session_state.get('analysis_job_id') or st.query_params.get('job')
+    if not job_id:
+        return
+    
+    job = get_job_queue().get(job_id)
+    user_email = st.session_state.user_data.get('email')
+    if job is None or (job['user_email'] and job['user_email'] != user_email):
+        _clear_analysis_job()
+        return
+    st.session_state.analysis_job_id = job_id
     
-    file_extension = uploaded_file.name.split('.')[-1].lower()
+    if job['status'] == SUCCEEDED:
+        _clear_analysis_job()
+        st.session_state.analysis_results = job['result']
+        st.session_state.current_page = 'results'
+        st.rerun(scope="app")
     
-    if file_extension == 'pdf':
-        return extract_text_from_pdf(uploaded_file)
-    elif file_extension == 'txt':
-        return extract_text_from_txt(uploaded_file)
-    elif file_extension in ['docx', 'doc']:
-        return extract_text_from_docx(uploaded_file)
+    if job['status'] == FAILED:
+        _clear_analysis_job()
+        st.error("❌ Analysis failed. Please check your documents and try again.")
+        return
+    
+    if job['status'] == 'queued':
+        status_message = f"⏳ Waiting in queue (position {job.get('queue_position', 1)})..."
+        progress = 15
     else:
-        supported_formats = "PDF, TXT" + (", DOCX, DOC" if DOCX_AVAILABLE else "")
-        st.error(f"Unsupported file format. Please upload {supported_formats} files only.")
-        return None
+        elapsed = time.time() - (job['started_at'] or time.time())
+        status_message = f"🔄 Analyzing your resume against the job description... ({elapsed:.0f}s)"
+        # Creep towards 95% while the analysis runs
+        progress = min(95, 30 + int(elapsed * 5))
+    
+    st.markdown("""
+        <div class="progress-container">
+            <h4 style="color: #ffffff; text-align: center; margin-bottom: 1rem; font-weight: 600;">🔍 Processing Your Files...</h4>
+        </div>
+    """, unsafe_allow_html=True)
+    st.progress(progress)
+    st.markdown(f"**{status_message}**")
+    st.caption("You can keep this page open or refresh it; the analysis continues in the background.")
 
+@profiled_page('upload')
 def show_upload_page():
     """Display the enhanced file upload page with drag & drop and animations"""
     
@@ -105,9 +124,7 @@ def show_upload_page():
         """, unsafe_allow_html=True)
         
         # Determine supported file types
-        supported_types = ['pdf', 'txt']
-        if DOCX_AVAILABLE:
-            supported_types.extend(['docx', 'doc'])
+        supported_types = extraction.supported_extensions()
         
         resume_file = st.file_uploader(
             "Choose your resume file",
@@ -199,19 +216,20 @@ def show_upload_page():
         analyze_button = st.button("🚀 Analyze Match", use_container_width=True, type="primary")
         
         if analyze_button:
-            # Get resume content
-            resume_content = None
-            if resume_file:
-                resume_content = process_uploaded_file(resume_file)
-            elif resume_text.strip():
-                resume_content = resume_text.strip()
-            
-            # Get job description text
-            job_content = None
-            if job_file:
-                job_content = process_uploaded_file(job_file)
-            elif job_text.strip():
-                job_content = job_text.strip()
+            with trace() as spans:
+                # Get resume content
+                resume_content = None
+                if resume_file:
+                    resume_content = process_uploaded_file(resume_file)
+                elif resume_text.strip():
+                    resume_content = resume_text.strip()
+                
+                # Get job description text
+                job_content = None
+                if job_file:
+                    job_content = process_uploaded_file(job_file)
+                elif job_text.strip():
+                    job_content = job_text.strip()
             
             # Validate inputs
             if not resume_content:
@@ -222,72 +240,15 @@ def show_upload_page():
                 st.error("❌ Please upload a job description file or paste job description text")
                 return
             
-            # Animated progress section
-            progress_container = st.empty()
-            
-            with progress_container.container():
-                st.markdown("""
-                    <div class="progress-container">
-                        <h4 style="color: #ffffff; text-align: center; margin-bottom: 1rem; font-weight: 600;">🔍 Processing Your Files...</h4>
-                    </div>
-                """, unsafe_allow_html=True)
-                
-                # Progress steps with animations
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                import time
-                
-                status_text.markdown("**Step 1:** Extracting text from files...")
-                time.sleep(0.5)
-                progress_bar.progress(25)
-                
-                status_text.markdown("**Step 2:** Preparing content for AI analysis...")
-                time.sleep(0.5)
-                progress_bar.progress(50)
-                
-                status_text.markdown("**Step 3:** Running AI analysis...")
-                time.sleep(0.5)
-                progress_bar.progress(75)
-                
-                # Show processing message
-                with st.spinner("🔄 Analyzing your resume against the job description..."):
-                    try:
-                        # Analyze the resume-job match
-                        results = analyze_resume_job_match(resume_content, job_content)
-                        
-                        if results:
-                            status_text.markdown("**Step 4:** Analysis complete! ✅")
-                            progress_bar.progress(100)
-                            
-                            # Store results in session state
-                            st.session_state.analysis_results = results
-                            st.session_state.analysis_results['resume_text'] = resume_content
-                            st.session_state.analysis_results['job_text'] = job_content
-                            
-                            # Success animation
-                            st.markdown("""
-                                <div class="success-check" style="background: linear-gradient(135deg, #2ecc71, #27ae60); padding: 1.5rem; border-radius: 15px; text-align: center; margin: 1rem 0;">
-                                    <h3 style="color: white; margin: 0;">🎉 Analysis Complete!</h3>
-                                    <p style="color: white; margin: 0.5rem 0 0 0;">Redirecting to results...</p>
-                                </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # Small delay for user to see the success message
-                            time.sleep(1.5)
-                            
-                            # Navigate to results page
-                            st.session_state.current_page = 'results'
-                            st.rerun()
-                        else:
-                            progress_bar.progress(100)
-                            status_text.markdown("❌ **Error:** Analysis failed")
-                            st.error("❌ Analysis failed. Please check your documents and try again.")
-                            
-                    except Exception as e:
-                        progress_bar.progress(100)
-                        status_text.markdown("❌ **Error:** Unable to complete analysis")
-                        st.error("❌ Unable to complete analysis. Please try again or contact support.")
+            # Queue the analysis; the status panel below polls it until it finishes
+            user_email = st.session_state.user_data.get('email')
+            job_id = submit_analysis_job(resume_content, job_content, user_email, trace=spans, incremental=True)
+            st.session_state.analysis_job_id = job_id
+            # Keep the job ID in the URL so a browser refresh can pick it back up
+            st.query_params['job'] = job_id
+            st.rerun()
+        
+        show_analysis_job_status()
     
     # Enhanced navigation to saved results
     st.markdown("---")
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import re
+import sys
+import threading
+from collections import OrderedDict
+
+from core.normalization import normalize_text
+from skills_taxonomy import extract_skills
+
+# Deterministic parser that turns a job description into structured
+# requirements (required/preferred skills, years of experience, degree).
+# Results are cached by content hash, so each posting is parsed once.
+
+PARSER_VERSION = 1
+PARSE_CACHE_MAX_ENTRIES = 1024
+
+DEGREE_RANKS = {
+    'associate': 1,
+    'bachelor': 2,
+    'master': 3,
+    'phd': 4,
+}
+
+# How each level reads in generated text
+DEGREE_NAMES = {
+    'associate': "an associate degree",
+    'bachelor': "a Bachelor's degree",
+    'master': "a Master's degree",
+    'phd': "a PhD",
+}
+
+_SECTION_RE = re.compile(r'^\s*\*\*(?P<name>[^*]+?):\*\*[ \t]*(?P<inline>.*)$', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# "3+ years", "2-4 years", "five years" are all "at least N years"
+_NUMBER_WORDS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+}
+_YEARS_RE = re.compile(
+    r'\b(?P<years>\d{1,2}|' + '|'.join(_NUMBER_WORDS) + r')\s*\+?\s*'
+    r'(?:(?:-|to)\s*\d{1,2}\s*)?(?:\+\s*)?years?\b',
+    re.IGNORECASE
+)
+
+_DEGREE_PATTERNS = (
+    ('phd', re.compile(r"\b(?:ph\.?\s?d\.?|doctorate|doctoral)\b", re.IGNORECASE)),
+    ('master', re.compile(r"(?<!scrum )\b(?:master'?s?|m\.?sc\.?|m\.s\.|mba|advanced degree)\b", re.IGNORECASE)),
+    ('bachelor', re.compile(r"\b(?:bachelor'?s?|b\.?sc\.?|b\.s\.|b\.a\.|undergraduate degree)\b", re.IGNORECASE)),
+    ('associate', re.compile(r"\bassociate'?s? degree\b", re.IGNORECASE)),
+)
+
+_REQUIRED_SECTIONS = ('required skills', 'requirements', 'required qualifications', 'qualifications')
+_PREFERRED_SECTIONS = ('preferred skills', 'preferred qualifications', 'nice to have', 'bonus')
+
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def normalize_job_text(text):
+    """Collapse whitespace so equivalent copies of a posting hash the same"""
+    return _WHITESPACE_RE.sub(' ', text or '').strip()
+
+
+def content_hash(text):
+    """SHA-256 of the normalized text"""
+    return hashlib.sha256(normalize_job_text(text).encode('utf-8')).hexdigest()
+
+
+def parse_sections(text):
+    """Split a markdown job description into {section name: body} on **Header:** lines"""
+    text = text or ''
+    sections = {}
+    matches = list(_SECTION_RE.finditer(text))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = (match.group('inline') + '\n' + text[match.end():end]).strip()
+        sections[match.group('name').strip().lower()] = body
+    return sections
+
+
+def extract_years_of_experience(text):
+    """Return the largest "N years" figure mentioned in text, or None"""
+    years = []
+    for match in _YEARS_RE.finditer(text or ''):
+        value = match.group('years').lower()
+        years.append(_NUMBER_WORDS.get(value) or int(value))
+    return max(years) if years else None
+
+
+def extract_degree_levels(text):
+    """Return the set of degree levels mentioned in text"""
+    return {level for level, pattern in _DEGREE_PATTERNS if pattern.search(text or '')}
+
+
+def _minimum_degree(text):
+    # "Bachelor's or Master's" means a bachelor's is enough
+    levels = extract_degree_levels(text)
+    return min(levels, key=DEGREE_RANKS.get) if levels else None
+
+
+def _first_section(sections, names):
+    for name in names:
+        if name in sections:
+            return sections[name]
+    return None
+
+
+def _parse(text, text_hash):
+    sections = parse_sections(text)
+    required_text = _first_section(sections, _REQUIRED_SECTIONS)
+    preferred_text = _first_section(sections, _PREFERRED_SECTIONS)
+    structured = required_text is not None or preferred_text is not None
+
+    if structured:
+        required_skills = extract_skills(required_text or '')
+        required_set = set(required_skills)
+        preferred_skills = [s for s in extract_skills(preferred_text or '') if s not in required_set]
+        requirement_text = required_text or ''
+    else:
+        # Unstructured posting: every mentioned skill counts as required
+        required_skills = extract_skills(text)
+        preferred_skills = []
+        requirement_text = text
+
+    title = sections.get('position', '').splitlines()[0].strip() if sections.get('position') else None
+
+    return {
+        'parser_version': PARSER_VERSION,
+        'content_hash': text_hash,
+        'title': title,
+        'structured': structured,
+        'required_skills': tuple(required_skills),
+        'preferred_skills': tuple(preferred_skills),
+        'min_years_experience': extract_years_of_experience(requirement_text),
+        'degree_level': _minimum_degree(requirement_text),
+        'preferred_degree_level': _minimum_degree(preferred_text or ''),
+    }
+
+
+def parse_job_requirements(job_text):
+    """Parse a job description into structured requirements, cached by content hash
+
+    The returned dict is JSON-serializable; skill lists are tuples so the
+    cached copy can be shared safely.
+    """
+    key = content_hash(job_text)
+
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+            return dict(cached)
+
+    # The hash is of the text as given, so it matches content_hash(job_text)
+    # wherever else the posting is looked up
+    parsed = _parse(normalize_text(job_text), key)
+
+    with _parse_cache_lock:
+        _parse_cache[key] = parsed
+        while len(_parse_cache) > PARSE_CACHE_MAX_ENTRIES:
+            _parse_cache.popitem(last=False)
+
+    return dict(parsed)
+
+
+def requirements_to_json(requirements):
+    """Serialize parsed requirements to a JSON string"""
+    return json.dumps(requirements, sort_keys=True)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("usage: python job_parser.py JOB_DESCRIPTION_FILE [...]", file=sys.stderr)
+        return 2
+
+    for path in argv:
+        with open(path, 'r', encoding='utf-8') as f:
+            requirements = parse_job_requirements(f.read())
+        print(json.dumps(requirements, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
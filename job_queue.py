@@ -0,0 +1,316 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import logging
+
+# Background job subsystem: a SQLite-backed queue with a local pool of
+# worker threads. Jobs get an ID at submission, so the UI (or any other
+# caller) can poll their status across reruns and browser refreshes.
+
+logger = logging.getLogger(__name__)
+
+JOB_DB_PATH = os.environ.get("JOB_DB_PATH", "jobs.db")
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "4"))
+# Jobs stuck in "running" longer than this are assumed orphaned by a crash
+# (sooner when the process that claimed them is known to be gone)
+JOB_STALE_SECONDS = float(os.environ.get("JOB_STALE_SECONDS", "600"))
+# Finished jobs older than this are purged
+JOB_RETENTION_SECONDS = float(os.environ.get("JOB_RETENTION_SECONDS", str(7 * 24 * 3600)))
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    user_email TEXT,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    owner TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+
+def _process_gone(owner):
+    # Owners are "host:pid:instance"; only processes on this host can be checked
+    try:
+        host, pid, _ = owner.split(':')
+        pid = int(pid)
+    except (AttributeError, ValueError):
+        return False
+    if host != socket.gethostname():
+        return False
+    if pid == os.getpid():
+        # An earlier run that had this PID (common in containers)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return False
+    return False
+
+
+class JobQueue:
+    """SQLite-backed job queue processed by a local pool of worker threads"""
+
+    def __init__(self, db_path=JOB_DB_PATH, max_workers=JOB_WORKERS):
+        self.db_path = db_path
+        self.max_workers = max_workers
+        self._handlers = {}
+        self._local = threading.local()
+        self._wakeup = threading.Condition()
+        self._workers = []
+        self._started = False
+        self._stopping = False
+        # Recorded on the jobs this queue claims
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if 'owner' not in columns:
+                # Queues created before jobs recorded their owner
+                conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def _conn(self):
+        # One connection per thread; sqlite3 connections can't be shared
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def register(self, kind, handler):
+        """Register handler(payload) -> JSON-serializable result for a job kind"""
+        self._handlers[kind] = handler
+
+    def start(self):
+        """Start the worker threads (idempotent)"""
+        with self._wakeup:
+            if self._started:
+                return
+            self._started = True
+            self._stopping = False
+
+        self.requeue_orphaned_jobs()
+        self.requeue_stale_jobs()
+        self.purge_finished_jobs()
+        for i in range(self.max_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"job-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, timeout=None):
+        """Ask workers to exit after their current job"""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+        self._started = False
+
+    def submit(self, kind, payload, user_email=None):
+        """Queue a job and return its ID"""
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind {kind!r}")
+
+        job_id = uuid.uuid4().hex
+        self._conn.execute(
+            "INSERT INTO jobs (id, kind, status, user_email, payload, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, kind, QUEUED, user_email, json.dumps(payload), time.time())
+        )
+        self.start()
+        with self._wakeup:
+            self._wakeup.notify()
+        return job_id
+
+    def get(self, job_id):
+        """Return the job as a dict (with decoded result), or None"""
+        row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job.pop('payload')
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        if job['status'] == QUEUED:
+            job['queue_position'] = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ? AND created_at <= ?",
+                (QUEUED, job['created_at'])
+            ).fetchone()[0]
+        return job
+
+    def wait(self, job_id, timeout=None, poll_interval=0.2):
+        """Block until the job finishes or timeout expires, returning the job"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job['status'] in (SUCCEEDED, FAILED):
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(poll_interval)
+
+    def requeue_stale_jobs(self, stale_seconds=JOB_STALE_SECONDS):
+        """Put jobs orphaned in "running" (e.g. by a server restart) back in the queue"""
+        cursor = self._conn.execute(
+            "UPDATE jobs SET status = ?, started_at = NULL, owner = NULL WHERE status = ? AND started_at < ?",
+            (QUEUED, RUNNING, time.time() - stale_seconds)
+        )
+        return cursor.rowcount
+
+    def requeue_orphaned_jobs(self):
+        """Put "running" jobs whose claiming process has exited back in the queue"""
+        owners = [row['owner'] for row in self._conn.execute(
+            "SELECT DISTINCT owner FROM jobs WHERE status = ? AND owner IS NOT NULL AND owner != ?",
+            (RUNNING, self.owner)
+        )]
+        requeued = 0
+        for owner in filter(_process_gone, owners):
+            requeued += self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL, owner = NULL WHERE status = ? AND owner = ?",
+                (QUEUED, RUNNING, owner)
+            ).rowcount
+        if requeued:
+            logger.info("Requeued %d jobs left running by exited processes", requeued)
+        return requeued
+
+    def purge_finished_jobs(self, older_than_seconds=JOB_RETENTION_SECONDS):
+        cursor = self._conn.execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+            (SUCCEEDED, FAILED, time.time() - older_than_seconds)
+        )
+        return cursor.rowcount
+
+    def _claim_next(self):
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT id, kind, payload FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (QUEUED,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, started_at = ?, owner = ? WHERE id = ?",
+                    (RUNNING, time.time(), self.owner, row['id'])
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return row
+
+    def _finish(self, job_id, status, result=None, error=None):
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+            (status, json.dumps(result) if result is not None else None, error, time.time(), job_id)
+        )
+
+    def _worker_loop(self):
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+
+            try:
+                row = self._claim_next()
+            except sqlite3.OperationalError as e:
+                logger.warning("Could not claim a job: %s", e)
+                row = None
+
+            if row is None:
+                with self._wakeup:
+                    if self._stopping:
+                        return
+                    # Also poll, so jobs queued by other processes are picked up
+                    self._wakeup.wait(timeout=1.0)
+                continue
+
+            handler = self._handlers.get(row['kind'])
+            try:
+                if handler is None:
+                    raise ValueError(f"No handler registered for job kind {row['kind']!r}")
+                result = handler(json.loads(row['payload']))
+                self._finish(row['id'], SUCCEEDED, result=result)
+            except Exception as e:
+                logger.exception("Job %s failed", row['id'])
+                self._finish(row['id'], FAILED, error=str(e) or e.__class__.__name__)
+
+
+def run_analysis_job(payload):
+    """Job handler: analyze a resume against a job description"""
+    from core.analysis import analyze_resume_job_match
+    from core.incremental import analyze_incrementally
+    from core.metrics import trace
+
+    analyze = analyze_incrementally if payload.get('incremental') else analyze_resume_job_match
+    # Continue the trace the submitter started (e.g. with its extraction timings)
+    with trace(payload.get('trace') or []) as spans:
+        results = analyze(payload['resume_text'], payload['job_text'], payload.get('user_email'))
+    if not results:
+        raise RuntimeError("Analysis returned no results")
+    results['resume_text'] = payload['resume_text']
+    results['job_text'] = payload['job_text']
+    results['trace'] = spans
+    return results
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """Return the process-wide job queue with the built-in handlers registered and running
+
+    Workers start on first use, not first submit, so jobs queued before a
+    restart are picked up as soon as anything polls the queue.
+    """
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                queue = JobQueue()
+                queue.register('analysis', run_analysis_job)
+                queue.start()
+                _queue = queue
+    return _queue
+
+
+def submit_analysis_job(resume_text, job_text, user_email=None, trace=None, incremental=False):
+    """Queue a resume/job analysis and return its job ID
+
+    trace is an optional list of spans already recorded for this analysis.
+    With incremental set, the user's previous analysis of the same job is
+    reused where the resume hasn't changed.
+    """
+    return get_job_queue().submit(
+        'analysis',
+        {'resume_text': resume_text, 'job_text': job_text, 'user_email': user_email,
+         'trace': trace or [], 'incremental': incremental},
+        user_email=user_email
+    )
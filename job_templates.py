@@ -212,6 +212,9 @@ We are seeking an experienced Project Manager to plan, execute, and finalize pro
 
 def show_job_templates():
     """Display job description templates for quick selection"""
+    from template_index import get_template_index
+    
+    template_index = get_template_index()
     
     st.markdown("### 🎯 Quick Job Templates")
     st.markdown("Choose from pre-built job descriptions for common roles:")
@@ -222,22 +225,24 @@ def show_job_templates():
     with col1:
         selected_template = st.selectbox(
             "Select a job template",
-            options=["None"] + list(JOB_TEMPLATES.keys()),
+            options=["None"] + template_index.names,
             help="Choose a template to auto-fill the job description"
         )
     
+    entry = template_index.get(selected_template)
+    
     with col2:
         if st.button("📋 Use Template", use_container_width=True, disabled=(selected_template == "None")):
-            if selected_template in JOB_TEMPLATES:
+            if entry is not None:
                 # Store the template in session state
-                st.session_state.selected_job_template = JOB_TEMPLATES[selected_template]
+                st.session_state.selected_job_template = entry.text
                 st.success(f"✅ {selected_template} template loaded!")
-                return JOB_TEMPLATES[selected_template]
+                return entry.text
     
     # Show template preview
-    if selected_template != "None" and selected_template in JOB_TEMPLATES:
+    if entry is not None:
         with st.expander(f"👀 Preview: {selected_template}"):
-            st.markdown(JOB_TEMPLATES[selected_template])
+            st.markdown(entry.text)
     
     return None
 
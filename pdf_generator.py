@@ -1,183 +1,235 @@
-import streamlit as st
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, ActionFlowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 import io
+import json
+import hashlib
+import threading
+import tempfile
+from collections import OrderedDict
 from datetime import datetime
+from core.metrics import timed
 
-def create_professional_pdf_report(analysis_results, user_name="User"):
-    """Generate a professional PDF report of the analysis results"""
-    
-    # Create a BytesIO buffer
-    buffer = io.BytesIO()
-    
-    # Create the PDF document
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        topMargin=0.8*inch,
-        bottomMargin=0.8*inch,
-        leftMargin=0.8*inch,
-        rightMargin=0.8*inch
-    )
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
+# Bump when the report layout changes so cached PDFs are not reused
+REPORT_TEMPLATE_VERSION = "2"
+
+# Fields of the analysis that end up in the rendered report
+REPORT_FIELDS = (
+    'ats_score', 'summary', 'matched_skills', 'missing_skills',
+    'experience_match', 'education_match', 'recommendations'
+)
+
+PDF_CACHE_MAX_ENTRIES = 32
+
+# Long skills tables are split into tables of this many rows so layout
+# never has to measure one huge table at once
+SKILLS_TABLE_CHUNK_ROWS = 40
+
+# Chunk size used when streaming a rendered report to a response
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Styles are immutable once built, so build them once per process
+_base_styles = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_base_styles['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#2c3e50')
+)
+
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_base_styles['Heading2'],
+    fontSize=16,
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=colors.HexColor('#34495e')
+)
+
+BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=_base_styles['Normal'],
+    fontSize=11,
+    spaceAfter=12,
+    alignment=TA_JUSTIFY,
+    textColor=colors.HexColor('#2c3e50')
+)
+
+SCORE_LABEL_STYLE = ParagraphStyle(
+    'ScoreLabelStyle',
+    parent=_base_styles['Normal'],
+    fontSize=14,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#7f8c8d'),
+    spaceAfter=20
+)
+
+FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_base_styles['Normal'],
+    fontSize=10,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#7f8c8d')
+)
+
+def _score_style(color_hex):
+    return ParagraphStyle(
+        'ScoreStyle',
+        parent=_base_styles['Normal'],
+        fontSize=36,
         alignment=TA_CENTER,
-        textColor=colors.HexColor('#2c3e50')
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceAfter=12,
-        spaceBefore=20,
-        textColor=colors.HexColor('#34495e')
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=12,
-        alignment=TA_JUSTIFY,
-        textColor=colors.HexColor('#2c3e50')
+        textColor=colors.HexColor(color_hex),
+        spaceAfter=10
     )
-    
-    # Build the document content
-    story = []
-    
-    # Title
-    story.append(Paragraph("ProFileMatch Analysis Report", title_style))
-    story.append(Spacer(1, 20))
-    
-    # Report info
-    report_date = datetime.now().strftime("%B %d, %Y")
-    story.append(Paragraph(f"<b>Generated for:</b> {user_name}", body_style))
-    story.append(Paragraph(f"<b>Report Date:</b> {report_date}", body_style))
-    story.append(Spacer(1, 30))
+
+# (minimum score, label, style) from best to worst
+SCORE_BANDS = (
+    (80, "Excellent Match", _score_style('#27ae60')),
+    (60, "Good Match", _score_style('#f39c12')),
+    (0, "Needs Improvement", _score_style('#e74c3c')),
+)
+
+SKILLS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ecf0f1')),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#2c3e50')),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+])
+
+_pdf_cache = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
+def _iter_analysis_sections(analysis_results):
+    """Yield the report body as small lists of flowables, one section at a time"""
     
     # ATS Score Section
     ats_score = analysis_results.get('ats_score', 0)
-    story.append(Paragraph("ATS Match Score", heading_style))
     
     # Score color based on performance
-    if ats_score >= 80:
-        score_color = colors.HexColor('#27ae60')
-        score_label = "Excellent Match"
-    elif ats_score >= 60:
-        score_color = colors.HexColor('#f39c12')
-        score_label = "Good Match"
-    else:
-        score_color = colors.HexColor('#e74c3c')
-        score_label = "Needs Improvement"
-    
-    score_style = ParagraphStyle(
-        'ScoreStyle',
-        parent=styles['Normal'],
-        fontSize=36,
-        alignment=TA_CENTER,
-        textColor=score_color,
-        spaceAfter=10
-    )
+    for min_score, score_label, score_style in SCORE_BANDS:
+        if ats_score >= min_score:
+            break
     
-    story.append(Paragraph(f"<b>{ats_score}%</b>", score_style))
-    story.append(Paragraph(f"<i>{score_label}</i>", ParagraphStyle(
-        'ScoreLabelStyle',
-        parent=styles['Normal'],
-        fontSize=14,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#7f8c8d'),
-        spaceAfter=20
-    )))
+    yield [
+        Paragraph("ATS Match Score", HEADING_STYLE),
+        Paragraph(f"<b>{ats_score}%</b>", score_style),
+        Paragraph(f"<i>{score_label}</i>", SCORE_LABEL_STYLE),
+    ]
     
     # Summary Section
     summary = analysis_results.get('summary', 'No summary available.')
-    story.append(Paragraph("Executive Summary", heading_style))
-    story.append(Paragraph(summary, body_style))
-    story.append(Spacer(1, 20))
+    yield [
+        Paragraph("Executive Summary", HEADING_STYLE),
+        Paragraph(summary, BODY_STYLE),
+        Spacer(1, 20),
+    ]
     
     # Skills Analysis Table
     matched_skills = analysis_results.get('matched_skills', [])
     missing_skills = analysis_results.get('missing_skills', [])
     
     if matched_skills or missing_skills:
-        story.append(Paragraph("Skills Analysis", heading_style))
-        
-        # Create skills table
-        table_data = [['Matched Skills', 'Missing Skills']]
+        section = [Paragraph("Skills Analysis", HEADING_STYLE)]
         
         max_rows = max(len(matched_skills), len(missing_skills))
-        for i in range(max_rows):
-            matched = matched_skills[i] if i < len(matched_skills) else ""
-            missing = missing_skills[i] if i < len(missing_skills) else ""
-            table_data.append([matched, missing])
+        for start in range(0, max_rows, SKILLS_TABLE_CHUNK_ROWS):
+            # Create skills table
+            table_data = [['Matched Skills', 'Missing Skills']]
+            for i in range(start, min(start + SKILLS_TABLE_CHUNK_ROWS, max_rows)):
+                matched = matched_skills[i] if i < len(matched_skills) else ""
+                missing = missing_skills[i] if i < len(missing_skills) else ""
+                table_data.append([matched, missing])
+            
+            table = Table(table_data, colWidths=[2.5*inch, 2.5*inch])
+            table.setStyle(SKILLS_TABLE_STYLE)
+            section.append(table)
+            yield section
+            section = []
         
-        table = Table(table_data, colWidths=[2.5*inch, 2.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ecf0f1')),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#2c3e50')),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        ]))
-        
-        story.append(table)
-        story.append(Spacer(1, 20))
+        yield [Spacer(1, 20)]
     
     # Experience and Education Match
     experience_match = analysis_results.get('experience_match', 'No analysis available')
     education_match = analysis_results.get('education_match', 'No analysis available')
     
     if experience_match != 'No analysis available':
-        story.append(Paragraph("Experience Analysis", heading_style))
-        story.append(Paragraph(experience_match, body_style))
-        story.append(Spacer(1, 15))
+        yield [
+            Paragraph("Experience Analysis", HEADING_STYLE),
+            Paragraph(experience_match, BODY_STYLE),
+            Spacer(1, 15),
+        ]
     
     if education_match != 'No analysis available':
-        story.append(Paragraph("Education Analysis", heading_style))
-        story.append(Paragraph(education_match, body_style))
-        story.append(Spacer(1, 15))
+        yield [
+            Paragraph("Education Analysis", HEADING_STYLE),
+            Paragraph(education_match, BODY_STYLE),
+            Spacer(1, 15),
+        ]
     
     # Recommendations
     recommendations = analysis_results.get('recommendations', [])
     if recommendations:
-        story.append(Paragraph("Recommendations for Improvement", heading_style))
+        section = [Paragraph("Recommendations for Improvement", HEADING_STYLE)]
         for i, rec in enumerate(recommendations, 1):
-            story.append(Paragraph(f"<b>{i}.</b> {rec}", body_style))
-        story.append(Spacer(1, 20))
+            section.append(Paragraph(f"<b>{i}.</b> {rec}", BODY_STYLE))
+        section.append(Spacer(1, 20))
+        yield section
+
+@timed('pdf_report')
+def create_professional_pdf_report(analysis_results, user_name="User"):
+    """Generate a professional PDF report of the analysis results"""
+    
+    # Create a BytesIO buffer
+    buffer = io.BytesIO()
+    
+    # Create the PDF document
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        topMargin=0.8*inch,
+        bottomMargin=0.8*inch,
+        leftMargin=0.8*inch,
+        rightMargin=0.8*inch
+    )
+    
+    # Build the document content
+    story = []
+    
+    # Title
+    story.append(Paragraph("ProFileMatch Analysis Report", TITLE_STYLE))
+    story.append(Spacer(1, 20))
+    
+    # Report info
+    report_date = datetime.now().strftime("%B %d, %Y")
+    story.append(Paragraph(f"<b>Generated for:</b> {user_name}", BODY_STYLE))
+    story.append(Paragraph(f"<b>Report Date:</b> {report_date}", BODY_STYLE))
+    story.append(Spacer(1, 30))
+    
+    # Analysis sections
+    for section in _iter_analysis_sections(analysis_results):
+        story.extend(section)
     
     # Footer
     story.append(Spacer(1, 30))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=10,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#7f8c8d')
-    )
-    story.append(Paragraph("Generated by ProFileMatch - AI Resume & Job Matcher", footer_style))
-    story.append(Paragraph(f"Report Date: {report_date}", footer_style))
+    story.append(Paragraph("Generated by ProFileMatch - AI Resume & Job Matcher", FOOTER_STYLE))
+    story.append(Paragraph(f"Report Date: {report_date}", FOOTER_STYLE))
     
     # Build the PDF
     doc.build(story)
@@ -185,16 +237,188 @@ def create_professional_pdf_report(analysis_results, user_name="User"):
     
     return buffer
 
+class _SetCandidate(ActionFlowable):
+    """Switch the name printed in the page header"""
+    
+    def __init__(self, candidate_name):
+        ActionFlowable.__init__(self)
+        self.candidate_name = candidate_name
+    
+    def apply(self, doc):
+        doc.candidate_name = self.candidate_name
+
+class _ExpandStory(ActionFlowable):
+    """Pull the next batch of flowables into the story only when layout reaches it
+    
+    doc.build() consumes the story list in place, so inserting batches lazily
+    keeps at most one section of flowables alive at a time.
+    """
+    
+    def __init__(self, story, batches):
+        ActionFlowable.__init__(self)
+        self.story = story
+        self.batches = batches
+    
+    def apply(self, doc):
+        batch = next(self.batches, None)
+        if batch is not None:
+            self.story[0:0] = list(batch) + [_ExpandStory(self.story, self.batches)]
+
+class ReportDocTemplate(BaseDocTemplate):
+    """Report document with a reusable page template and header/footer callbacks"""
+    
+    def __init__(self, output, report_date, candidate_name="", **kwargs):
+        kwargs.setdefault('pagesize', A4)
+        kwargs.setdefault('topMargin', 1.0*inch)
+        kwargs.setdefault('bottomMargin', 0.9*inch)
+        kwargs.setdefault('leftMargin', 0.8*inch)
+        kwargs.setdefault('rightMargin', 0.8*inch)
+        kwargs.setdefault('pageCompression', 1)
+        BaseDocTemplate.__init__(self, output, **kwargs)
+        
+        self.report_date = report_date
+        self.candidate_name = candidate_name
+        
+        body_frame = Frame(
+            self.leftMargin, self.bottomMargin, self.width, self.height,
+            id='body', leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0
+        )
+        # Drawn at page end so a candidate switch on this page is already applied
+        self.addPageTemplates([
+            PageTemplate(id='report', frames=[body_frame], onPageEnd=self._draw_header_footer)
+        ])
+    
+    def _draw_header_footer(self, canvas, doc):
+        page_width, page_height = self.pagesize
+        canvas.saveState()
+        
+        # Header
+        canvas.setFont('Helvetica-Bold', 9)
+        canvas.setFillColor(colors.HexColor('#34495e'))
+        header_y = page_height - 0.6*inch
+        canvas.drawString(self.leftMargin, header_y, "ProFileMatch Analysis Report")
+        if self.candidate_name:
+            canvas.setFont('Helvetica', 9)
+            canvas.drawRightString(page_width - self.rightMargin, header_y, self.candidate_name)
+        canvas.setStrokeColor(colors.HexColor('#bdc3c7'))
+        canvas.line(self.leftMargin, header_y - 6, page_width - self.rightMargin, header_y - 6)
+        
+        # Footer
+        footer_y = 0.5*inch
+        canvas.line(self.leftMargin, footer_y + 12, page_width - self.rightMargin, footer_y + 12)
+        canvas.setFont('Helvetica', 8)
+        canvas.setFillColor(colors.HexColor('#7f8c8d'))
+        canvas.drawString(self.leftMargin, footer_y, "Generated by ProFileMatch - AI Resume & Job Matcher")
+        canvas.drawCentredString(page_width / 2, footer_y, f"Report Date: {self.report_date}")
+        canvas.drawRightString(page_width - self.rightMargin, footer_y, f"Page {doc.page}")
+        
+        canvas.restoreState()
+
+def _iter_candidate_batches(candidates):
+    for index, (candidate_name, analysis_results) in enumerate(candidates):
+        opening = [_SetCandidate(candidate_name)]
+        if index > 0:
+            opening.insert(0, PageBreak())
+        opening.append(Paragraph(f"Candidate: {candidate_name}", TITLE_STYLE))
+        
+        # Keep the title in the same batch as the first section so
+        # keep-with-next never has to look past a batch boundary
+        sections = _iter_analysis_sections(analysis_results)
+        yield opening + next(sections)
+        for section in sections:
+            yield section
+
+@timed('pdf_report_stream')
+def write_multi_candidate_pdf_report(candidates, output):
+    """Render a report for many (candidate_name, analysis_results) pairs into one PDF
+    
+    output is a file path or a writable binary file object. Sections are laid
+    out and flushed page by page instead of building one in-memory story.
+    """
+    report_date = datetime.now().strftime("%B %d, %Y")
+    doc = ReportDocTemplate(output, report_date, title="ProFileMatch Analysis Report")
+    
+    story = []
+    story.append(_ExpandStory(story, _iter_candidate_batches(candidates)))
+    doc.build(story)
+    return output
+
+def write_pdf_report(analysis_results, output, user_name="User"):
+    """Render a single analysis report straight to a file path or binary file object"""
+    return write_multi_candidate_pdf_report([(user_name, analysis_results)], output)
+
+def iter_pdf_report_chunks(analysis_results, user_name="User", candidates=None):
+    """Render into a spooled temp file and yield it in chunks for streamed responses"""
+    if candidates is None:
+        candidates = [(user_name, analysis_results)]
+    
+    # Small reports stay in memory, large ones spill to disk
+    with tempfile.SpooledTemporaryFile(max_size=STREAM_CHUNK_SIZE * 16) as spool:
+        write_multi_candidate_pdf_report(candidates, spool)
+        spool.seek(0)
+        while True:
+            chunk = spool.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+def _report_cache_key(analysis_results, user_name, report_date):
+    """Hash the rendered fields together with everything else that changes the PDF"""
+    payload = {field: analysis_results.get(field) for field in REPORT_FIELDS}
+    payload['_user_name'] = user_name
+    payload['_template_version'] = REPORT_TEMPLATE_VERSION
+    # The report prints today's date, so a new day means a new PDF
+    payload['_report_date'] = report_date
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def get_report_cache_key(analysis_results, user_name="User"):
+    """Return the cache key of the report that would be rendered today"""
+    return _report_cache_key(analysis_results, user_name, datetime.now().strftime("%Y-%m-%d"))
+
+def get_pdf_report_bytes(analysis_results, user_name="User"):
+    """Return the rendered PDF report, reusing a cached copy for identical analyses"""
+    key = get_report_cache_key(analysis_results, user_name)
+    
+    with _pdf_cache_lock:
+        cached = _pdf_cache.get(key)
+        if cached is not None:
+            _pdf_cache.move_to_end(key)
+            return cached
+    
+    pdf_bytes = create_professional_pdf_report(analysis_results, user_name).getvalue()
+    
+    with _pdf_cache_lock:
+        _pdf_cache[key] = pdf_bytes
+        _pdf_cache.move_to_end(key)
+        while len(_pdf_cache) > PDF_CACHE_MAX_ENTRIES:
+            _pdf_cache.popitem(last=False)
+    
+    return pdf_bytes
+
+def clear_pdf_cache():
+    """Drop all cached PDF reports"""
+    with _pdf_cache_lock:
+        _pdf_cache.clear()
+
 def add_pdf_download_button(analysis_results, user_name="User"):
     """Add a download button for the PDF report"""
+    # Imported here so report rendering stays usable without Streamlit
+    import streamlit as st
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
+        report_key = get_report_cache_key(analysis_results, user_name)
+        
+        # Keep the download button visible across reruns once this report was requested
         if st.button("📄 Download PDF Report", use_container_width=True, type="primary"):
+            st.session_state.pdf_report_key = report_key
+        
+        if st.session_state.get('pdf_report_key') == report_key:
             try:
-                # Generate PDF
+                # Cached after the first render, so reruns and repeat clicks are instant
                 with st.spinner("🔄 Generating your professional PDF report..."):
-                    pdf_buffer = create_professional_pdf_report(analysis_results, user_name)
+                    pdf_bytes = get_pdf_report_bytes(analysis_results, user_name)
                 
                 # Create download
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -202,7 +426,7 @@ def add_pdf_download_button(analysis_results, user_name="User"):
                 
                 st.download_button(
                     label="💾 Download Report",
-                    data=pdf_buffer,
+                    data=pdf_bytes,
                     file_name=filename,
                     mime="application/pdf",
                     use_container_width=True
@@ -212,4 +436,4 @@ def add_pdf_download_button(analysis_results, user_name="User"):
                 
             except Exception as e:
                 st.error("❌ Failed to generate PDF report. Please try again.")
-                st.error(f"Error details: {str(e)}")
\ No newline at end of file
+                st.error(f"Error details: {str(e)}")
@@ -0,0 +1,225 @@
+import cProfile
+import functools
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+
+import streamlit as st
+
+# Opt-in page profiling for the Streamlit app. A profiled page rerun runs
+# under cProfile or a sampling profiler; results are kept per page in
+# memory and can be viewed in the app or downloaded (.prof for
+# pstats/snakeviz, collapsed stacks for flamegraph.pl/speedscope).
+#
+#   PROFILE_PAGES=cprofile|sampling   profile every rerun for every user
+#   PROFILING_ADMINS=a@x.com,b@y.com  users who get a per-session toggle and
+#                                     are the only ones shown the profiles
+
+PROFILE_PAGES = os.environ.get("PROFILE_PAGES", "").lower()
+PROFILING_ADMINS = {email.strip().lower() for email in os.environ.get("PROFILING_ADMINS", "").split(",") if email.strip()}
+PROFILE_MODES = ('sampling', 'cprofile')
+PROFILE_HISTORY = int(os.environ.get("PROFILE_HISTORY", "50"))
+SAMPLE_INTERVAL_SECONDS = float(os.environ.get("PROFILE_SAMPLE_INTERVAL", "0.002"))
+TOP_FUNCTIONS = 30
+
+_profiles = deque(maxlen=PROFILE_HISTORY)
+# Sample counts merged across all sampled runs of each page
+_page_stacks = {}
+_profiles_lock = threading.Lock()
+# cProfile can't profile two reruns at once reliably, so it is serialized
+_cprofile_lock = threading.Lock()
+
+
+class SamplingProfiler:
+    """Samples one thread's stack at a fixed interval and counts collapsed stacks"""
+
+    def __init__(self, thread_id=None, interval=SAMPLE_INTERVAL_SECONDS):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="page-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+
+def collapsed_stacks(stacks):
+    """Brendan Gregg's collapsed format: one "frame;frame;frame count" line per stack"""
+    return "\n".join(f"{stack} {count}" for stack, count in stacks.most_common()) + "\n"
+
+
+def _cprofile_summary(profiler):
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+    return stream.getvalue()
+
+
+def _sampling_summary(stacks, samples):
+    # Self time per function: the leaf frame of each sample
+    leaves = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    lines = [f"{samples} samples", ""]
+    for name, count in leaves.most_common(TOP_FUNCTIONS):
+        lines.append(f"{count / samples * 100 if samples else 0:6.1f}%  {name}")
+    return "\n".join(lines)
+
+
+def profiling_mode():
+    """Profiler to use for this session's reruns, or None when profiling is off"""
+    if st.session_state.get('profiling_enabled'):
+        return st.session_state.get('profiling_mode', 'sampling')
+    if PROFILE_PAGES in PROFILE_MODES:
+        return PROFILE_PAGES
+    return None
+
+
+def _is_profiling_admin():
+    email = (st.session_state.get('user_data') or {}).get('email', '')
+    return email.lower() in PROFILING_ADMINS
+
+
+def _record(page, mode, started, duration, summary, prof_bytes=None, stacks=None):
+    record = {
+        'page': page,
+        'mode': mode,
+        'started_at': datetime.fromtimestamp(started).isoformat(timespec='seconds'),
+        'duration_ms': round(duration * 1000, 1),
+        'user_email': (st.session_state.get('user_data') or {}).get('email'),
+        'summary': summary,
+        'prof': prof_bytes,
+        'collapsed': collapsed_stacks(stacks) if stacks is not None else None,
+    }
+    with _profiles_lock:
+        _profiles.append(record)
+        if stacks is not None:
+            _page_stacks.setdefault(page, Counter()).update(stacks)
+    return record
+
+
+def get_profiles(page=None):
+    """Recorded profiles, newest first"""
+    with _profiles_lock:
+        records = list(_profiles)
+    return [r for r in reversed(records) if page is None or r['page'] == page]
+
+
+def get_page_collapsed_stacks(page):
+    """Collapsed stacks merged over every sampled rerun of a page"""
+    with _profiles_lock:
+        stacks = Counter(_page_stacks.get(page, {}))
+    return collapsed_stacks(stacks) if stacks else None
+
+
+def _run_profiled(page, mode, func, args, kwargs):
+    started = time.time()
+    perf_started = time.perf_counter()
+
+    if mode == 'cprofile':
+        if not _cprofile_lock.acquire(blocking=False):
+            # Another session is being profiled; run this rerun unprofiled
+            return func(*args, **kwargs)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # Also runs for st.rerun()/st.stop(), which end a rerun with an exception
+                profiler.disable()
+                profiler.create_stats()
+                # Serialize first: building pstats.Stats from the profiler empties its stats
+                prof_bytes = marshal.dumps(profiler.stats)
+                _record(page, mode, started, time.perf_counter() - perf_started,
+                        _cprofile_summary(profiler), prof_bytes=prof_bytes)
+        finally:
+            _cprofile_lock.release()
+
+    sampler = SamplingProfiler()
+    sampler.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        sampler.stop()
+        _record(page, mode, started, time.perf_counter() - perf_started,
+                _sampling_summary(sampler.stacks, sampler.samples), stacks=sampler.stacks)
+
+
+def show_profiling_panel(page):
+    """Profiling toggle (for admins) and the latest profiles of a page"""
+    if _is_profiling_admin():
+        with st.sidebar:
+            st.toggle("🔬 Profile pages", key='profiling_enabled')
+            if st.session_state.get('profiling_enabled'):
+                st.radio("Profiler", PROFILE_MODES, key='profiling_mode', horizontal=True)
+
+    if profiling_mode() is None:
+        return
+    # With admins configured, only they see profiles (including other users' reruns)
+    if PROFILING_ADMINS and not _is_profiling_admin():
+        return
+    profiles = get_profiles(page)
+    if not profiles:
+        return
+
+    latest = profiles[0]
+    with st.expander(f"🔬 Page profile: {page} ({latest['duration_ms']} ms, {latest['mode']})"):
+        st.code(latest['summary'], language=None)
+        stamp = latest['started_at'].replace(':', '')
+        if latest['prof']:
+            st.download_button("⬇️ pstats (.prof)", latest['prof'],
+                               file_name=f"{page}_{stamp}.prof", key=f"profile_prof_{page}")
+        if latest['collapsed']:
+            st.download_button("⬇️ Collapsed stacks (this rerun)", latest['collapsed'],
+                               file_name=f"{page}_{stamp}.collapsed.txt", key=f"profile_collapsed_{page}")
+        merged = get_page_collapsed_stacks(page)
+        if merged:
+            st.download_button("⬇️ Collapsed stacks (all reruns)", merged,
+                               file_name=f"{page}_all.collapsed.txt", key=f"profile_merged_{page}")
+        durations = [p['duration_ms'] for p in profiles]
+        st.caption(f"{len(durations)} profiled reruns of this page; "
+                   f"mean {sum(durations) / len(durations):.1f} ms, max {max(durations):.1f} ms")
+
+
+def profiled_page(page):
+    """Decorator for page functions: profiles the rerun when profiling is on"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mode = profiling_mode()
+            if mode is None:
+                result = func(*args, **kwargs)
+            else:
+                result = _run_profiled(page, mode, func, args, kwargs)
+            # Rendered after the profiled section so it doesn't show up in the profile
+            show_profiling_panel(page)
+            return result
+        return wrapper
+    return decorator
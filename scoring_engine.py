@@ -0,0 +1,266 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+from core.normalization import normalize_text
+from job_parser import DEGREE_RANKS, extract_degree_levels, extract_years_of_experience, parse_job_requirements
+from skills_taxonomy import extract_skills
+
+# Deterministic local ATS scoring. Combines required/preferred skill
+# coverage, years of experience, degree level and (optionally) embedding
+# similarity into one calibrated 0-100 score with a per-component breakdown.
+
+# Relative weight of each component; components that don't apply to a
+# posting (e.g. no degree requirement) are dropped and the rest renormalized
+COMPONENT_WEIGHTS = {
+    'required_skills': 0.50,
+    'preferred_skills': 0.15,
+    'experience': 0.15,
+    'education': 0.10,
+    'semantic_similarity': 0.10,
+}
+
+# Piecewise-linear map from the weighted raw score (0-1) to the ATS scale
+# the gpt-4o analysis uses. Re-fit these points from paired LLM/local scores.
+CALIBRATION_POINTS = (
+    (0.00, 5),
+    (0.30, 35),
+    (0.55, 60),
+    (0.75, 78),
+    (0.90, 90),
+    (1.00, 97),
+)
+
+# Cosine similarities of unrelated vs. matching resume/posting pairs sit
+# roughly in this band for all-MiniLM-L6-v2
+SIMILARITY_FLOOR = 0.20
+SIMILARITY_CEILING = 0.75
+
+RESUME_CACHE_MAX_ENTRIES = 512
+# Skills are extracted per resume section and cached by section content, so
+# re-scoring an edited resume only scans the sections that changed
+SECTION_CACHE_MAX_ENTRIES = 4096
+
+_MONTHS = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_DATE_RANGE_RE = re.compile(
+    rf'(?:{_MONTHS}\s+)?(?P<start>(?:19|20)\d{{2}})\s*(?:-|–|—|to)\s*'
+    rf'(?:(?:{_MONTHS}\s+)?(?P<end>(?:19|20)\d{{2}})|(?P<present>present|current|now|today))',
+    re.IGNORECASE
+)
+
+# A heading is a short line of its own: a known section name, or all caps
+_SECTION_HEADING_RE = re.compile(
+    r'^\s*(?:(?:professional\s+|work\s+|relevant\s+|technical\s+|core\s+|key\s+)?'
+    r'(?:summary|profile|objective|experience|employment(?:\s+history)?|work\s+history|education|'
+    r'skills|competencies|projects|certifications?|awards|publications|languages|interests|volunteering))'
+    r'\s*:?\s*$',
+    re.IGNORECASE
+)
+_UPPERCASE_HEADING_RE = re.compile(r'^\s*[A-Z][A-Z &/-]{2,39}\s*:?\s*$')
+
+_resume_cache = OrderedDict()
+_resume_cache_lock = threading.Lock()
+_section_cache = OrderedDict()
+_section_cache_lock = threading.Lock()
+
+
+def estimate_resume_years(resume_text):
+    """Estimate years of experience from explicit "N years" claims and employment date ranges"""
+    explicit = extract_years_of_experience(resume_text) or 0
+
+    current_year = date.today().year
+    ranges = []
+    for match in _DATE_RANGE_RE.finditer(resume_text or ''):
+        start = int(match.group('start'))
+        end = current_year if match.group('present') else int(match.group('end'))
+        if start <= end <= current_year:
+            ranges.append((start, end))
+
+    # Merge overlapping jobs so concurrent roles aren't double counted
+    covered = 0
+    for start, end in _merge_ranges(ranges):
+        covered += max(end - start, 0)
+
+    return max(explicit, covered)
+
+
+def _merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _is_heading(line):
+    # Known section names in any case; anything else only when written in caps
+    return bool(_SECTION_HEADING_RE.match(line) or _UPPERCASE_HEADING_RE.match(line))
+
+
+def split_resume_sections(resume_text):
+    """Split a resume into (heading, text) sections; text before the first heading is 'header'
+
+    Repeated headings get a numeric suffix so every section name is unique.
+    """
+    sections = []
+    name, lines = 'header', []
+    seen = {}
+    for line in (resume_text or '').splitlines():
+        if line.strip() and _is_heading(line):
+            if lines or sections:
+                sections.append((name, '\n'.join(lines)))
+            heading = line.strip().rstrip(':').strip().lower()
+            seen[heading] = seen.get(heading, 0) + 1
+            name = heading if seen[heading] == 1 else f"{heading} #{seen[heading]}"
+            lines = [line]
+        else:
+            lines.append(line)
+    if lines:
+        sections.append((name, '\n'.join(lines)))
+    return sections
+
+
+def _section_skills(section_text):
+    key = hashlib.sha256(section_text.encode('utf-8')).hexdigest()
+    with _section_cache_lock:
+        cached = _section_cache.get(key)
+        if cached is not None:
+            _section_cache.move_to_end(key)
+            return cached
+
+    skills = tuple(extract_skills(section_text))
+
+    with _section_cache_lock:
+        _section_cache[key] = skills
+        while len(_section_cache) > SECTION_CACHE_MAX_ENTRIES:
+            _section_cache.popitem(last=False)
+    return skills
+
+
+def get_resume_profile(resume_text):
+    """Skills, years of experience and degree level of a resume, cached by content hash"""
+    key = hashlib.sha256((resume_text or '').encode('utf-8')).hexdigest()
+
+    with _resume_cache_lock:
+        cached = _resume_cache.get(key)
+        if cached is not None:
+            _resume_cache.move_to_end(key)
+            return cached
+
+    # Pasted text hasn't been through extraction, which normalizes uploads
+    resume_text = normalize_text(resume_text)
+    levels = extract_degree_levels(resume_text)
+    skills = set()
+    for _, section_text in split_resume_sections(resume_text):
+        skills.update(_section_skills(section_text))
+    profile = {
+        'skills': frozenset(skills),
+        'years_experience': estimate_resume_years(resume_text),
+        'degree_level': max(levels, key=DEGREE_RANKS.get) if levels else None,
+    }
+
+    with _resume_cache_lock:
+        _resume_cache[key] = profile
+        while len(_resume_cache) > RESUME_CACHE_MAX_ENTRIES:
+            _resume_cache.popitem(last=False)
+    return profile
+
+
+def calibrate(raw_score):
+    """Map a weighted raw score in [0, 1] onto the 0-100 ATS scale"""
+    raw_score = min(max(raw_score, 0.0), 1.0)
+    for (x0, y0), (x1, y1) in zip(CALIBRATION_POINTS, CALIBRATION_POINTS[1:]):
+        if raw_score <= x1:
+            return y0 + (y1 - y0) * (raw_score - x0) / (x1 - x0)
+    return CALIBRATION_POINTS[-1][1]
+
+
+def _coverage(job_skills, resume_skills):
+    matched = [skill for skill in job_skills if skill in resume_skills]
+    missing = [skill for skill in job_skills if skill not in resume_skills]
+    return matched, missing
+
+
+def score_resume_job_match(resume_text, job_description, embedding_similarity=None):
+    """Score a resume against a job description without calling an LLM
+
+    embedding_similarity is an optional cosine similarity between the
+    resume and posting embeddings; without it that component is skipped.
+    """
+    started = time.perf_counter()
+    requirements = parse_job_requirements(job_description)
+    profile = get_resume_profile(resume_text)
+    resume_skills = profile['skills']
+
+    components = {}
+
+    required_matched, required_missing = _coverage(requirements['required_skills'], resume_skills)
+    if requirements['required_skills']:
+        components['required_skills'] = {
+            'score': len(required_matched) / len(requirements['required_skills']),
+            'matched': required_matched,
+            'missing': required_missing,
+        }
+
+    preferred_matched, preferred_missing = _coverage(requirements['preferred_skills'], resume_skills)
+    if requirements['preferred_skills']:
+        components['preferred_skills'] = {
+            'score': len(preferred_matched) / len(requirements['preferred_skills']),
+            'matched': preferred_matched,
+            'missing': preferred_missing,
+        }
+
+    required_years = requirements['min_years_experience']
+    resume_years = profile['years_experience']
+    if required_years:
+        components['experience'] = {
+            'score': min(resume_years / required_years, 1.0),
+            'required_years': required_years,
+            'resume_years': resume_years,
+        }
+
+    required_degree = requirements['degree_level']
+    resume_degree = profile['degree_level']
+    if required_degree:
+        if resume_degree is None:
+            degree_score = 0.0
+        elif DEGREE_RANKS[resume_degree] >= DEGREE_RANKS[required_degree]:
+            degree_score = 1.0
+        else:
+            # One level short still counts for something
+            degree_score = 0.5 if DEGREE_RANKS[required_degree] - DEGREE_RANKS[resume_degree] == 1 else 0.0
+        components['education'] = {
+            'score': degree_score,
+            'required_degree': required_degree,
+            'resume_degree': resume_degree,
+        }
+
+    if embedding_similarity is not None:
+        scaled = (embedding_similarity - SIMILARITY_FLOOR) / (SIMILARITY_CEILING - SIMILARITY_FLOOR)
+        components['semantic_similarity'] = {
+            'score': min(max(scaled, 0.0), 1.0),
+            'cosine_similarity': round(float(embedding_similarity), 4),
+        }
+
+    total_weight = sum(COMPONENT_WEIGHTS[name] for name in components)
+    for name, component in components.items():
+        component['weight'] = round(COMPONENT_WEIGHTS[name] / total_weight, 4) if total_weight else 0.0
+        component['score'] = round(component['score'], 4)
+
+    raw_score = sum(c['score'] * c['weight'] for c in components.values()) if total_weight else 0.0
+
+    return {
+        'ats_score': int(round(calibrate(raw_score))) if components else 0,
+        'raw_score': round(raw_score, 4),
+        'matched_skills': required_matched + preferred_matched,
+        'missing_skills': required_missing + preferred_missing,
+        'missing_required_skills': required_missing,
+        'score_breakdown': components,
+        'job_requirements': requirements,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 3),
+    }
@@ -0,0 +1,181 @@
+import re
+
+# Canonical skill names grouped by category, each with the spellings we
+# accept in resumes and job postings. Matching is case-insensitive except
+# for CASE_SENSITIVE_ALIASES, which are too ambiguous in lowercase.
+SKILL_TAXONOMY = {
+    "Programming Languages": {
+        "Python": ["python"],
+        "Java": ["java"],
+        "JavaScript": ["javascript", "js", "ecmascript"],
+        "TypeScript": ["typescript"],
+        "R": ["R"],
+        "Go": ["golang"],
+        "C++": ["c++"],
+        "C#": ["c#"],
+        "Ruby": ["ruby"],
+        "PHP": ["php"],
+        "Swift": ["Swift"],
+        "Kotlin": ["kotlin"],
+        "SQL": ["sql"],
+        "HTML": ["html", "html5"],
+        "CSS": ["css", "css3"],
+    },
+    "Frameworks & Libraries": {
+        "React": ["react", "react.js", "reactjs"],
+        "Angular": ["angular"],
+        "Vue.js": ["vue", "vue.js", "vuejs"],
+        "Node.js": ["node.js", "nodejs", "node"],
+        "Django": ["django"],
+        "Flask": ["flask"],
+        "Spring": ["spring boot", "spring"],
+        "Pandas": ["pandas"],
+        "NumPy": ["numpy"],
+        "scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
+        "TensorFlow": ["tensorflow"],
+        "PyTorch": ["pytorch"],
+        "matplotlib": ["matplotlib"],
+        "seaborn": ["seaborn"],
+    },
+    "Data & Databases": {
+        "NoSQL": ["nosql"],
+        "PostgreSQL": ["postgresql", "postgres"],
+        "MySQL": ["mysql"],
+        "MongoDB": ["mongodb", "mongo"],
+        "Redis": ["redis"],
+        "Spark": ["spark", "apache spark", "pyspark"],
+        "Hadoop": ["hadoop"],
+        "Kafka": ["kafka"],
+        "Airflow": ["airflow"],
+        "Snowflake": ["snowflake"],
+        "Data Analysis": ["data analysis", "data analytics"],
+        "Data Visualization": ["data visualization", "data visualisation"],
+        "Statistics": ["statistics", "statistical modeling", "statistical modelling"],
+        "Machine Learning": ["machine learning", "ml"],
+        "Deep Learning": ["deep learning"],
+        "NLP": ["nlp", "natural language processing"],
+        "Computer Vision": ["computer vision"],
+        "A/B Testing": ["a/b testing", "ab testing", "experimental design"],
+        "Tableau": ["tableau"],
+        "Power BI": ["power bi", "powerbi"],
+        "Excel": ["Excel", "spreadsheets"],
+    },
+    "Cloud & DevOps": {
+        "AWS": ["aws", "amazon web services"],
+        "Azure": ["azure"],
+        "GCP": ["gcp", "google cloud"],
+        "Docker": ["docker", "containerization"],
+        "Kubernetes": ["kubernetes", "k8s"],
+        "CI/CD": ["ci/cd", "continuous integration", "continuous delivery"],
+        "Terraform": ["terraform"],
+        "Jenkins": ["jenkins"],
+        "Linux": ["linux"],
+        "Git": ["git", "version control"],
+        "REST APIs": ["rest api", "rest apis", "restful"],
+        "GraphQL": ["graphql"],
+    },
+    "Design": {
+        "UX/UI": ["ux/ui", "ui/ux", "user experience", "ux", "ui"],
+        "Figma": ["figma"],
+        "Sketch": ["Sketch"],
+        "Adobe Creative Suite": ["adobe creative suite", "photoshop", "illustrator"],
+        "Prototyping": ["prototyping"],
+        "Responsive Design": ["responsive design", "responsive and mobile design", "mobile design"],
+        "User-Centered Design": ["user-centered design", "user centered design"],
+        "Design Systems": ["design systems", "design system"],
+        "Accessibility": ["accessibility"],
+        "Motion Design": ["motion design", "animation"],
+    },
+    "Marketing": {
+        "Digital Marketing": ["digital marketing"],
+        "Marketing Automation": ["marketing automation"],
+        "Social Media Marketing": ["social media marketing", "social media"],
+        "SEO": ["seo", "search engine optimization"],
+        "Google Analytics": ["google analytics"],
+        "HubSpot": ["hubspot"],
+        "Salesforce": ["salesforce"],
+        "CRM": ["crm"],
+        "Content Management Systems": ["content management systems", "content management system", "cms"],
+    },
+    "Management": {
+        "Project Management": ["project management"],
+        "Product Management": ["product management"],
+        "Agile": ["agile"],
+        "Scrum": ["scrum"],
+        "PMP": ["pmp"],
+        "Jira": ["jira"],
+        "Confluence": ["confluence"],
+        "Asana": ["asana"],
+        "MS Project": ["ms project", "microsoft project"],
+        "Risk Management": ["risk management"],
+        "Budget Management": ["budget management", "budgeting"],
+        "Stakeholder Management": ["stakeholder management"],
+        "Change Management": ["change management"],
+        "Quality Assurance": ["quality assurance", "qa"],
+    },
+    "Soft Skills": {
+        "Communication": ["communication"],
+        "Leadership": ["leadership"],
+        "Problem Solving": ["problem solving", "problem-solving"],
+        "Teamwork": ["teamwork", "collaboration"],
+        "Time Management": ["time management"],
+        "Analytical Skills": ["analytical"],
+    },
+}
+
+CASE_SENSITIVE_ALIASES = {"R", "Swift", "Excel", "Sketch"}
+
+SKILL_CATEGORIES = {
+    canonical: category
+    for category, skills in SKILL_TAXONOMY.items()
+    for canonical in skills
+}
+
+_ALIAS_TO_SKILL = {}
+_case_sensitive_aliases = []
+_case_insensitive_aliases = []
+for _skills in SKILL_TAXONOMY.values():
+    for _canonical, _aliases in _skills.items():
+        for _alias in _aliases:
+            if _alias in CASE_SENSITIVE_ALIASES:
+                _ALIAS_TO_SKILL[_alias] = _canonical
+                _case_sensitive_aliases.append(_alias)
+            else:
+                _ALIAS_TO_SKILL[_alias.lower()] = _canonical
+                _case_insensitive_aliases.append(_alias.lower())
+
+
+def _compile_aliases(aliases, flags=0):
+    # Longest alias first so "machine learning" wins over shorter overlaps
+    alternation = "|".join(re.escape(alias) for alias in sorted(aliases, key=len, reverse=True))
+    return re.compile(rf"(?<![\w+#.])(?:{alternation})(?![\w+#]|\.\w)", flags)
+
+
+_CI_PATTERN = _compile_aliases(_case_insensitive_aliases, re.IGNORECASE)
+_CS_PATTERN = _compile_aliases(_case_sensitive_aliases)
+
+
+def extract_skills(text):
+    """Return canonical skills mentioned in text, in order of first mention"""
+    if not text:
+        return []
+
+    found = []
+    for match in _CI_PATTERN.finditer(text):
+        found.append((match.start(), _ALIAS_TO_SKILL[match.group(0).lower()]))
+    for match in _CS_PATTERN.finditer(text):
+        found.append((match.start(), _ALIAS_TO_SKILL[match.group(0)]))
+    found.sort()
+
+    skills = []
+    seen = set()
+    for _, skill in found:
+        if skill not in seen:
+            seen.add(skill)
+            skills.append(skill)
+    return skills
+
+
+def skill_category(skill):
+    """Return the taxonomy category of a canonical skill, or None"""
+    return SKILL_CATEGORIES.get(skill)
@@ -0,0 +1,292 @@
+import argparse
+import json
+import os
+import sys
+import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from job_templates import JOB_TEMPLATES
+from job_parser import content_hash, normalize_job_text, parse_job_requirements, parse_sections
+
+# Precomputed job-side data for every job template: parsed requirements
+# (see job_parser), normalized text and an embedding vector. Stored as one
+# compact .npz file so template-based matches never re-process the job side.
+
+TEMPLATES_DIR = os.environ.get("JOB_TEMPLATES_DIR", "templates")
+TEMPLATE_INDEX_PATH = os.environ.get("TEMPLATE_INDEX_PATH", "template_index.npz")
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+INDEX_FORMAT_VERSION = 2
+
+
+def _template_name(text, fallback):
+    position = parse_sections(text).get('position')
+    if position:
+        return position.splitlines()[0].strip()
+    return fallback
+
+
+def load_templates_from_dir(directory=TEMPLATES_DIR):
+    """Load {name: text} from the .md/.txt files of a templates directory"""
+    templates = {}
+    if not directory or not os.path.isdir(directory):
+        return templates
+
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(('.md', '.txt')):
+            continue
+        with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+            text = f.read()
+        fallback = os.path.splitext(filename)[0].replace('_', ' ').title()
+        templates[_template_name(text, fallback)] = text
+    return templates
+
+
+class TemplateEntry:
+    """Precomputed job-side data for one template"""
+
+    __slots__ = ('name', 'text', 'normalized_text', 'requirements', 'embedding')
+
+    def __init__(self, name, text, requirements, embedding=None):
+        self.name = name
+        self.text = text
+        self.normalized_text = normalize_job_text(text)
+        self.requirements = requirements
+        self.embedding = embedding
+
+    @property
+    def content_hash(self):
+        return self.requirements['content_hash']
+
+    @property
+    def required_skills(self):
+        return tuple(self.requirements['required_skills'])
+
+    @property
+    def preferred_skills(self):
+        return tuple(self.requirements['preferred_skills'])
+
+    @property
+    def all_skills(self):
+        return self.required_skills + self.preferred_skills
+
+    @classmethod
+    def from_text(cls, name, text):
+        return cls(name=name, text=text, requirements=parse_job_requirements(text))
+
+
+class TemplateIndex:
+    """In-memory index of job templates, addressable by name or content hash"""
+
+    def __init__(self, entries=(), model_name=EMBEDDING_MODEL_NAME):
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._by_name = {}
+        self._by_hash = {}
+        for entry in entries:
+            self._add(entry)
+
+    def _add(self, entry):
+        self._by_name[entry.name] = entry
+        self._by_hash[entry.content_hash] = entry
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __iter__(self):
+        return iter(self._by_name.values())
+
+    @property
+    def names(self):
+        return list(self._by_name)
+
+    def get(self, name):
+        return self._by_name.get(name)
+
+    def lookup(self, job_text):
+        """Return the entry whose content matches job_text, or None"""
+        if not job_text:
+            return None
+        return self._by_hash.get(content_hash(job_text))
+
+    def add_template(self, name, text, encoder=None):
+        """Index a new template, embedding it right away if an encoder is given"""
+        entry = TemplateEntry.from_text(name, text)
+        if encoder is not None:
+            entry.embedding = _as_vector(encoder([entry.normalized_text])[0])
+        with self._lock:
+            old = self._by_name.get(name)
+            if old is not None:
+                self._by_hash.pop(old.content_hash, None)
+            self._add(entry)
+        return entry
+
+    def ensure_embeddings(self, encoder, model_name=EMBEDDING_MODEL_NAME):
+        """Embed every template that has no vector yet (or was embedded by another model)"""
+        with self._lock:
+            if model_name != self.model_name:
+                for entry in self._by_name.values():
+                    entry.embedding = None
+                self.model_name = model_name
+
+            missing = [entry for entry in self._by_name.values() if entry.embedding is None]
+            if not missing:
+                return 0
+            vectors = encoder([entry.normalized_text for entry in missing])
+            for entry, vector in zip(missing, vectors):
+                entry.embedding = _as_vector(vector)
+            return len(missing)
+
+    def save(self, path=TEMPLATE_INDEX_PATH):
+        """Write the index as one .npz: JSON metadata plus a float16 embedding matrix"""
+        if np is None:
+            raise RuntimeError("numpy is required to save the template index")
+
+        entries = list(self._by_name.values())
+        embedded = [entry for entry in entries if entry.embedding is not None]
+        rows = {entry.content_hash: row for row, entry in enumerate(embedded)}
+        meta = {
+            'format_version': INDEX_FORMAT_VERSION,
+            'model_name': self.model_name,
+            'entries': [
+                {
+                    'name': entry.name,
+                    'text': entry.text,
+                    'requirements': entry.requirements,
+                    'embedding_row': rows.get(entry.content_hash),
+                }
+                for entry in entries
+            ],
+        }
+        if embedded:
+            matrix = np.stack([entry.embedding for entry in embedded]).astype(np.float16)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float16)
+
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, meta=np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8),
+                            embeddings=matrix)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path=TEMPLATE_INDEX_PATH):
+        """Load an index written by save()"""
+        if np is None:
+            raise RuntimeError("numpy is required to load the template index")
+
+        with np.load(path) as data:
+            meta = json.loads(data['meta'].tobytes().decode('utf-8'))
+            matrix = data['embeddings'].astype(np.float32)
+
+        if meta.get('format_version') != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported template index format: {meta.get('format_version')}")
+
+        entries = []
+        for item in meta['entries']:
+            row = item['embedding_row']
+            entries.append(TemplateEntry(
+                name=item['name'],
+                text=item['text'],
+                requirements=item['requirements'],
+                embedding=matrix[row] if row is not None else None,
+            ))
+        return cls(entries, model_name=meta.get('model_name', EMBEDDING_MODEL_NAME))
+
+
+def _as_vector(vector):
+    if hasattr(vector, 'detach'):
+        vector = vector.detach().cpu().numpy()
+    return np.asarray(vector, dtype=np.float32) if np is not None else vector
+
+
+def collect_templates(directory=TEMPLATES_DIR):
+    """Built-in templates plus any loaded from the templates directory"""
+    templates = dict(JOB_TEMPLATES)
+    templates.update(load_templates_from_dir(directory))
+    return templates
+
+
+def build_template_index(templates=None, encoder=None, previous=None):
+    """Build an index, reusing embeddings from a previous index for unchanged templates"""
+    if templates is None:
+        templates = collect_templates()
+
+    entries = []
+    for name, text in templates.items():
+        entry = TemplateEntry.from_text(name, text)
+        if previous is not None:
+            cached = previous.lookup(text)
+            if cached is not None and cached.embedding is not None:
+                entry.embedding = cached.embedding
+        entries.append(entry)
+
+    index = TemplateIndex(entries, model_name=previous.model_name if previous else EMBEDDING_MODEL_NAME)
+    if encoder is not None:
+        index.ensure_embeddings(encoder)
+    return index
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_template_index():
+    """Return the process-wide template index, loading the built index file if it is current"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                previous = None
+                if np is not None and os.path.exists(TEMPLATE_INDEX_PATH):
+                    try:
+                        previous = TemplateIndex.load(TEMPLATE_INDEX_PATH)
+                    except (OSError, ValueError, KeyError):
+                        previous = None
+                # Skill parsing is cheap; only embeddings are worth carrying over
+                _index = build_template_index(previous=previous)
+    return _index
+
+
+def _sentence_transformer_encoder(model_name=EMBEDDING_MODEL_NAME):
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(model_name)
+    return lambda texts: model.encode(texts, convert_to_numpy=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or inspect the job template index")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="Parse and embed all templates")
+    build_parser.add_argument('--templates-dir', default=TEMPLATES_DIR)
+    build_parser.add_argument('--output', default=TEMPLATE_INDEX_PATH)
+    build_parser.add_argument('--no-embeddings', action='store_true',
+                              help="Skip embedding (no sentence-transformers needed)")
+
+    show_parser = subparsers.add_parser('show', help="List the templates in an index file")
+    show_parser.add_argument('--index', default=TEMPLATE_INDEX_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        previous = TemplateIndex.load(args.output) if os.path.exists(args.output) else None
+        encoder = None if args.no_embeddings else _sentence_transformer_encoder()
+        index = build_template_index(collect_templates(args.templates_dir), encoder, previous)
+        index.save(args.output)
+        print(f"Indexed {len(index)} templates into {args.output}")
+        return 0
+
+    index = TemplateIndex.load(args.index)
+    for entry in index:
+        dims = len(entry.embedding) if entry.embedding is not None else 0
+        print(f"{entry.name}: {len(entry.required_skills)} required, "
+              f"{len(entry.preferred_skills)} preferred, embedding dims={dims}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
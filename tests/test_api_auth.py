@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api_server
+
+
+@pytest.fixture
+def client():
+    return TestClient(api_server.app)
+
+
+def test_refuses_requests_without_a_configured_key(client, monkeypatch):
+    monkeypatch.setattr(api_server, 'API_KEY', '')
+    monkeypatch.setattr(api_server, 'INSECURE_DEV', False)
+    assert client.get('/usage', params={'user_email': 'someone@example.com'}).status_code == 503
+    assert client.get('/health').status_code == 200
+
+
+def test_requires_the_configured_key(client, monkeypatch):
+    monkeypatch.setattr(api_server, 'API_KEY', 'secret')
+    assert client.get('/jobs/missing').status_code == 401
+    assert client.get('/jobs/missing', headers={'X-API-Key': 'wrong'}).status_code == 401
+
+
+def test_insecure_dev_allows_requests_without_a_key(client, monkeypatch):
+    monkeypatch.setattr(api_server, 'API_KEY', '')
+    monkeypatch.setattr(api_server, 'INSECURE_DEV', True)
+    monkeypatch.setattr(api_server, 'get_job_queue', lambda: SimpleNamespace(get=lambda job_id: None))
+    assert client.get('/jobs/missing').status_code == 404
+
+
+def test_server_will_not_start_without_a_key(monkeypatch):
+    monkeypatch.setattr(api_server, 'API_KEY', '')
+    monkeypatch.setattr(api_server, 'INSECURE_DEV', False)
+    with pytest.raises(SystemExit):
+        api_server.main([])
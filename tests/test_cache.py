@@ -0,0 +1,108 @@
+import pytest
+
+from core import cache
+from core.cache import FakeRedis, NullCache, RedisCache, SQLiteCache
+
+
+class _Clock:
+    """Stands in for the time module inside core.cache"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache, 'time', clock)
+    return clock
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def backend(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteCache(str(tmp_path / 'cache.db'))
+    return RedisCache(client=FakeRedis())
+
+
+def test_get_set_delete(backend):
+    assert backend.get('missing') is None
+    backend.set('key', b'value')
+    assert backend.get('key') == b'value'
+    backend.set('key', b'other')
+    assert backend.get('key') == b'other'
+    backend.delete('key')
+    assert backend.get('key') is None
+
+
+def test_ttl_expiry(backend, clock):
+    backend.set('short', b'1', ttl=60)
+    backend.set('forever', b'2')
+    clock.now += 59
+    assert backend.get('short') == b'1'
+    clock.now += 2
+    assert backend.get('short') is None
+    assert backend.get('forever') == b'2'
+
+
+def test_sub_second_ttl_still_expires(backend, clock):
+    backend.set('key', b'1', ttl=0.5)
+    clock.now += 2
+    assert backend.get('key') is None
+
+
+def test_clear(backend):
+    backend.set('a', b'1')
+    backend.set('b', b'2')
+    backend.clear()
+    assert backend.get('a') is None and backend.get('b') is None
+
+
+def test_sqlite_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    SQLiteCache(path).set('key', b'value')
+    assert SQLiteCache(path).get('key') == b'value'
+
+
+def test_sqlite_trim_keeps_newest(tmp_path, clock):
+    backend = SQLiteCache(str(tmp_path / 'cache.db'), max_entries=2)
+    for i in range(3):
+        clock.now += 1
+        backend.set(f'k{i}', b'x')
+    backend.trim()
+    assert [backend.get(f'k{i}') for i in range(3)] == [None, b'x', b'x']
+
+
+def test_null_cache_stores_nothing():
+    backend = NullCache()
+    backend.set('key', b'value')
+    assert backend.get('key') is None
+
+
+def test_create_cache_backends():
+    assert isinstance(cache.create_cache('none'), NullCache)
+    memory = cache.create_cache('memory')
+    assert isinstance(memory, RedisCache) and isinstance(memory.client, FakeRedis)
+
+
+def test_json_helpers_and_backend_errors(monkeypatch):
+    monkeypatch.setattr(cache, '_cache', RedisCache(client=FakeRedis()))
+    cache.cache_set_json('ns', 'key', {'a': [1, 2]})
+    assert cache.cache_get_json('ns', 'key') == {'a': [1, 2]}
+
+    class Broken:
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def set(self, key, value, ttl=None):
+            raise ConnectionError("down")
+
+    monkeypatch.setattr(cache, '_cache', Broken())
+    cache.cache_set('ns', 'key', b'value')
+    assert cache.cache_get('ns', 'key') is None
@@ -0,0 +1,73 @@
+import pytest
+
+import api_server
+import cascade
+from cascade import run_cascade
+
+JOB = "**Position:** Backend Developer\n\n**Required Skills:**\n- Python\n- Django\n- PostgreSQL\n- Docker\n"
+STRONG = "Backend developer. Python, Django, PostgreSQL and Docker in production."
+MEDIUM = "Developer with Python and Django."
+WEAK = "Graphic designer with Photoshop experience."
+
+
+def _usage(prompt_tokens=1000, completion_tokens=200, **extra):
+    return {'model': 'gpt-4o', 'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+            'cost_usd': 0.01, 'latency_ms': 2000.0, **extra}
+
+
+def test_report_counts_only_paid_calls():
+    outcomes = {
+        'paid': {'ats_score': 90, 'llm_usage': _usage()},
+        'cached': {'ats_score': 80, 'llm_usage': _usage(0, 0, cost_usd=0.0, cached=True)},
+        'coalesced': {'ats_score': 70, 'llm_usage': _usage(0, 0, cost_usd=0.0)},
+        'fallback': {'ats_score': 60, 'analysis_source': 'local', 'llm_skipped': "quota"},
+    }
+    resumes = [(name, f"{STRONG} ({name})") for name in outcomes] + [('weak', WEAK)]
+    by_text = {text: outcomes[name] for name, text in resumes if name in outcomes}
+
+    report = run_cascade(resumes, JOB, top_k=4, min_local_score=None,
+                         analyze_fn=lambda resume, job: dict(by_text[resume]))['report']
+
+    assert report['shortlisted'] == 4
+    assert report['llm_calls'] == 1
+    assert (report['llm_cache_hits'], report['llm_coalesced'], report['llm_fallbacks']) == (1, 1, 1)
+    assert report['llm_calls_avoided'] == 4
+    assert report['estimated_cost_usd'] == 0.01
+    assert report['avg_llm_call_seconds'] == 2.0
+
+
+def test_top_k_zero_ranks_locally_only():
+    called = []
+    outcome = run_cascade([('a', STRONG), ('b', MEDIUM)], JOB, top_k=0, min_local_score=None,
+                          analyze_fn=lambda resume, job: called.append(resume))
+    assert called == []
+    assert [c['stage'] for c in outcome['results']] == ['local', 'local']
+
+
+@pytest.mark.parametrize('flag, expected_top_k', [('0', 0), ('-1', None), ('3', 3)])
+def test_cli_top_k(tmp_path, monkeypatch, flag, expected_top_k):
+    job = tmp_path / 'job.txt'
+    job.write_text(JOB)
+    resume = tmp_path / 'resume.txt'
+    resume.write_text(STRONG)
+    seen = {}
+
+    def fake_run_cascade(resumes, job_description, top_k, min_local_score, max_workers):
+        seen['top_k'] = top_k
+        return {'results': [], 'report': {}}
+
+    monkeypatch.setattr(cascade, 'run_cascade', fake_run_cascade)
+    assert cascade.main([str(job), str(resume), '--top-k', flag]) == 0
+    assert seen['top_k'] == expected_top_k
+
+
+def test_api_batch_defaults_to_the_cascade_settings():
+    request = api_server.BatchAnalyzeRequest.model_validate(
+        {'job_text': JOB, 'resumes': [{'id': 'a', 'resume_text': STRONG}]}
+    )
+    assert request.top_k == cascade.CASCADE_TOP_K
+    assert request.min_local_score == cascade.CASCADE_MIN_LOCAL_SCORE
+    unlimited = api_server.BatchAnalyzeRequest.model_validate(
+        {'job_text': JOB, 'resumes': [], 'top_k': None, 'min_local_score': None}
+    )
+    assert unlimited.top_k is None and unlimited.min_local_score is None
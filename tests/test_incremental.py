@@ -0,0 +1,40 @@
+from core import incremental
+from core.incremental import LLM, UNCHANGED, ReanalysisStore, analyze_incrementally
+
+RESUME = "Jane Doe\n\nSkills\nPython, Django, PostgreSQL, Docker\n\nExperience\nBackend developer, 4 years\n"
+JOB = "**Position:** Backend Developer\n\n**Required Skills:**\n- Python\n- Django\n- Docker\n"
+
+
+def _patch(monkeypatch, tmp_path, outcomes):
+    calls = []
+
+    def analyze(resume_text, job_description, user_email=None):
+        calls.append(resume_text)
+        source = outcomes.pop(0)
+        return {'ats_score': 80 if source == 'openai' else 55, 'analysis_source': source,
+                'matched_skills': [], 'missing_skills': [], 'summary': source}
+
+    monkeypatch.setattr(incremental, '_store', ReanalysisStore(str(tmp_path / 'reanalysis.db')))
+    monkeypatch.setattr(incremental, 'analyze_resume_job_match', analyze)
+    monkeypatch.setattr(incremental, 'llm_configured', lambda: True)
+    return calls
+
+
+def test_fallback_anchor_is_retried(monkeypatch, tmp_path):
+    calls = _patch(monkeypatch, tmp_path, ['local', 'openai'])
+    assert analyze_incrementally(RESUME, JOB, 'a@example.com')['analysis_source'] == 'local'
+
+    results = analyze_incrementally(RESUME, JOB, 'a@example.com')
+    assert len(calls) == 2
+    assert results['reanalysis']['mode'] == LLM
+    assert results['analysis_source'] == 'openai'
+
+
+def test_llm_anchor_is_reused(monkeypatch, tmp_path):
+    calls = _patch(monkeypatch, tmp_path, ['openai'])
+    analyze_incrementally(RESUME, JOB, 'a@example.com')
+
+    results = analyze_incrementally(RESUME, JOB, 'a@example.com')
+    assert len(calls) == 1
+    assert results['reanalysis']['mode'] == UNCHANGED
+    assert results['ats_score'] == 80
@@ -0,0 +1,16 @@
+from job_parser import content_hash, parse_job_requirements
+from template_index import TemplateIndex, TemplateEntry
+
+# Smart quotes, an en dash and a bullet glyph, all rewritten by normalize_text()
+POSTING = "**Position:** Backend Developer\n\n**Required Skills:**\n• Python – Django “expert”\n"
+
+
+def test_content_hash_is_of_the_raw_text():
+    assert parse_job_requirements(POSTING)['content_hash'] == content_hash(POSTING)
+
+
+def test_template_lookup_with_non_ascii_punctuation():
+    entry = TemplateEntry.from_text("Backend Developer", POSTING)
+    index = TemplateIndex([entry])
+    assert index.lookup(POSTING) is entry
+    assert 'python' in [skill.lower() for skill in entry.required_skills]
@@ -0,0 +1,76 @@
+import functools
+import json
+import socket
+import subprocess
+import sys
+import time
+import uuid
+
+import pytest
+
+import job_queue
+from job_queue import QUEUED, RUNNING, SUCCEEDED, JobQueue
+
+
+def _insert_job(path, status=QUEUED, owner=None):
+    job_id = uuid.uuid4().hex
+    conn = JobQueue(path)._connect()
+    try:
+        conn.execute(
+            "INSERT INTO jobs (id, kind, status, payload, created_at, started_at, owner) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, 'echo', status, json.dumps({'value': 42}), time.time(),
+             time.time() if status == RUNNING else None, owner)
+        )
+    finally:
+        conn.close()
+    return job_id
+
+
+def _echo_queue(path):
+    queue = JobQueue(path, max_workers=1)
+    queue.register('echo', lambda payload: payload['value'])
+    return queue
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'jobs.db')
+
+
+def test_get_job_queue_starts_workers(monkeypatch, db_path):
+    monkeypatch.setattr(job_queue, '_queue', None)
+    monkeypatch.setattr(job_queue, 'JobQueue', functools.partial(JobQueue, db_path, max_workers=1))
+    queue = job_queue.get_job_queue()
+    try:
+        queue.register('echo', lambda payload: payload['value'])
+        # Queued by another process, or before a restart: nothing here submits
+        job_id = _insert_job(db_path)
+        job = queue.wait(job_id, timeout=10)
+        assert job['status'] == SUCCEEDED and job['result'] == 42
+    finally:
+        queue.stop(timeout=5)
+
+
+def test_jobs_of_exited_processes_are_requeued_on_start(db_path):
+    exited = subprocess.Popen([sys.executable, '-c', 'pass'])
+    exited.wait()
+    job_id = _insert_job(db_path, RUNNING, owner=f"{socket.gethostname()}:{exited.pid}:old")
+
+    queue = _echo_queue(db_path)
+    queue.start()
+    try:
+        assert queue.wait(job_id, timeout=10)['status'] == SUCCEEDED
+    finally:
+        queue.stop(timeout=5)
+
+
+def test_jobs_of_live_processes_are_left_alone(db_path):
+    alive = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        job_id = _insert_job(db_path, RUNNING, owner=f"{socket.gethostname()}:{alive.pid}:other")
+        queue = _echo_queue(db_path)
+        assert queue.requeue_orphaned_jobs() == 0
+        assert queue.get(job_id)['status'] == RUNNING
+    finally:
+        alive.kill()
+        alive.wait()
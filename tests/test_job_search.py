@@ -0,0 +1,42 @@
+from core.job_search import SAVED, TEMPLATE, JobSearchIndex
+
+BACKEND = "**Position:** Backend Developer\n\n**Required Skills:**\n- Python\n- Django\n- PostgreSQL\n"
+FRONTEND = "**Position:** Frontend Developer\n\n**Required Skills:**\n- JavaScript\n- React\n- CSS\n"
+RESUME = "Backend engineer: Python, Django and PostgreSQL services."
+
+
+def test_search_ranks_matching_postings_first(tmp_path):
+    index = JobSearchIndex(str(tmp_path / 'job_search.db'))
+    index.add(FRONTEND)
+    backend_hash = index.add(BACKEND)
+    hits = index.search(RESUME)
+    assert [hit['hash'] for hit in hits] == [backend_hash]
+    assert hits[0]['title'] == "Backend Developer"
+
+
+def test_removing_a_saved_posting_keeps_the_same_template(tmp_path):
+    index = JobSearchIndex(str(tmp_path / 'job_search.db'))
+    content_hash = index.add(BACKEND, source=SAVED)
+    index.add(BACKEND, source=TEMPLATE, title="Backend Developer")
+    assert len(index.search(RESUME)) == 1
+
+    assert index.remove(content_hash, source=SAVED)
+    assert [(hit['hash'], hit['source']) for hit in index.search(RESUME)] == [(content_hash, TEMPLATE)]
+    assert not index.remove(content_hash, source=SAVED)
+
+
+def test_removing_a_template_keeps_the_saved_posting(tmp_path):
+    index = JobSearchIndex(str(tmp_path / 'job_search.db'))
+    content_hash = index.add(BACKEND, source=SAVED)
+    index.add(BACKEND, source=TEMPLATE)
+
+    index.remove(content_hash, source=TEMPLATE)
+    assert [hit['source'] for hit in index.search(RESUME)] == [SAVED]
+
+
+def test_other_instances_see_new_postings(tmp_path):
+    path = str(tmp_path / 'job_search.db')
+    reader = JobSearchIndex(path)
+    assert reader.search(RESUME) == []
+    content_hash = JobSearchIndex(path).add(BACKEND)
+    assert [hit['hash'] for hit in reader.search(RESUME)] == [content_hash]
@@ -0,0 +1,16 @@
+import pytest
+
+from core.analysis import get_demo_analysis_results
+
+JOB = "**Position:** Research Scientist\n\n**Requirements:**\n- Python\n- PhD in Computer Science\n"
+
+
+@pytest.mark.parametrize('resume, expected', [
+    ("Python developer. Education: Master's degree in Computer Science.",
+     "The role asks for a PhD; the resume lists a Master's degree."),
+    ("Python developer with a PhD in Computer Science.",
+     "The resume lists a PhD, meeting the requirement of a PhD."),
+    ("Python developer.", "The role asks for a PhD or higher, but no degree was found in the resume."),
+])
+def test_education_match_names_degrees(resume, expected):
+    assert get_demo_analysis_results(resume, JOB)['education_match'] == expected
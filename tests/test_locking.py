@@ -0,0 +1,31 @@
+import multiprocessing
+
+from core.locking import file_lock
+
+INCREMENTS = 200
+
+
+def _increment(path, times):
+    # Unlocked, concurrent read-modify-write cycles would lose updates
+    for _ in range(times):
+        with file_lock(path):
+            with open(path) as f:
+                value = int(f.read())
+            with open(path, 'w') as f:
+                f.write(str(value + 1))
+
+
+def test_file_lock_serializes_processes(tmp_path):
+    path = str(tmp_path / 'counter')
+    with open(path, 'w') as f:
+        f.write('0')
+
+    processes = [multiprocessing.Process(target=_increment, args=(path, INCREMENTS)) for _ in range(2)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    with open(path) as f:
+        assert int(f.read()) == 2 * INCREMENTS
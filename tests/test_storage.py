@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from core import storage
+
+
+@pytest.fixture
+def saved_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'SAVED_ANALYSES_DIR', str(tmp_path))
+    return tmp_path
+
+
+def _write_record(directory, analysis_id, record):
+    (directory / f"{analysis_id}.json").write_text(json.dumps(record), encoding='utf-8')
+
+
+def test_invalid_records_of_other_users_are_skipped(saved_dir):
+    _write_record(saved_dir, 'analysis_a', {'ats_score': 72, 'user_email': 'a@x', 'timestamp': '2024-01-02'})
+    # Legacy record saved from unvalidated LLM output
+    _write_record(saved_dir, 'analysis_b', {'ats_score': 'N/A', 'user_email': 'b@x'})
+    (saved_dir / 'analysis_c.json').write_text('{not json', encoding='utf-8')
+
+    analyses = storage.load_user_analyses('a@x')
+    assert [analysis.id for analysis in analyses] == ['analysis_a']
+    assert analyses[0].ats_score == 72
+
+
+def test_listing_reads_only_the_users_records(saved_dir, monkeypatch):
+    for i in range(20):
+        _write_record(saved_dir, f'analysis_b{i}', {'ats_score': 50, 'user_email': 'b@x'})
+    _write_record(saved_dir, 'analysis_a', {'ats_score': 72, 'user_email': 'a@x'})
+    # The first use of the index scans the records saved before it existed
+    assert len(storage.load_user_analyses('b@x')) == 20
+
+    reads = []
+    read_record = storage._read_record
+    monkeypatch.setattr(storage, '_read_record', lambda path, analysis_id: reads.append(analysis_id)
+                        or read_record(path, analysis_id))
+    assert [analysis.id for analysis in storage.load_user_analyses('a@x')] == ['analysis_a']
+    assert reads == ['analysis_a']
+
+
+def test_save_list_delete(saved_dir, monkeypatch):
+    from core.document_store import DocumentStore
+
+    monkeypatch.setattr(storage, 'get_document_store', lambda: DocumentStore(str(saved_dir / 'documents')))
+    first = storage.save_analysis_result({'ats_score': 60, 'resume_text': 'Resume one'}, 'a@x')
+    second = storage.save_analysis_result({'ats_score': 80, 'resume_text': 'Resume two'}, 'a@x')
+    storage.save_analysis_result({'ats_score': 70}, 'b@x')
+
+    assert [analysis.id for analysis in storage.load_user_analyses('a@x')] == [second, first]
+    assert storage.delete_analysis(first, 'a@x')
+    assert [analysis.id for analysis in storage.load_user_analyses('a@x')] == [second]
+    assert storage.get_analysis(second, 'a@x')['resume_text'] == 'Resume two'
@@ -0,0 +1,185 @@
+import os
+import threading
+import time
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.singleflight import SingleFlight
+
+# Shared YouTube Data API v3 client used by every part of the app.
+# One pooled HTTP session, a token bucket measured in quota units and
+# coalescing of identical in-flight searches.
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY", "your-youtube-api-key")
+YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+
+# search.list costs 100 units; the default project quota is 10,000 units/day
+SEARCH_QUOTA_COST = 100
+DAILY_QUOTA_UNITS = int(os.environ.get("YOUTUBE_DAILY_QUOTA", "10000"))
+QUOTA_BURST_UNITS = int(os.environ.get("YOUTUBE_QUOTA_BURST", "1000"))
+REQUEST_TIMEOUT = float(os.environ.get("YOUTUBE_REQUEST_TIMEOUT", "5"))
+
+
+class YouTubeError(Exception):
+    """Raised when the YouTube API call fails"""
+
+
+class YouTubeQuotaError(YouTubeError):
+    """Raised when the local quota budget or the API quota is exhausted"""
+
+
+class QuotaTokenBucket:
+    """Token bucket measured in YouTube quota units"""
+
+    def __init__(self, capacity, refill_per_second):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def try_consume(self, units):
+        """Take units from the bucket, returning False if not enough are left"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= units:
+                self._tokens -= units
+                return True
+            return False
+
+    def drain(self):
+        """Empty the bucket, e.g. after the API reports quotaExceeded"""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+    @property
+    def available(self):
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class YouTubeClient:
+    """Pooled, rate-limited client for YouTube video searches"""
+
+    def __init__(self, api_key=None, bucket=None, timeout=REQUEST_TIMEOUT):
+        self.api_key = api_key if api_key is not None else YOUTUBE_API_KEY
+        self.timeout = timeout
+        self.bucket = bucket or QuotaTokenBucket(
+            capacity=QUOTA_BURST_UNITS,
+            refill_per_second=DAILY_QUOTA_UNITS / 86400.0
+        )
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1)
+        self.session.mount("https://", adapter)
+
+        self._searches = SingleFlight('youtube_search')
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "requests": 0,
+            "quota_units_spent": 0,
+            "coalesced": 0,
+            "throttled": 0,
+            "errors": 0,
+        }
+
+    @property
+    def configured(self):
+        return bool(self.api_key) and self.api_key != "your-youtube-api-key"
+
+    def _count(self, name, amount=1):
+        with self._metrics_lock:
+            self._metrics[name] += amount
+
+    def get_metrics(self):
+        """Return a snapshot of request and quota counters"""
+        with self._metrics_lock:
+            snapshot = dict(self._metrics)
+        snapshot["quota_units_available"] = round(self.bucket.available, 1)
+        return snapshot
+
+    def search_videos(self, query, max_results=6, **params):
+        """Search videos, sharing one API call between identical concurrent queries"""
+        key = (query.strip().lower(), max_results, tuple(sorted(params.items())))
+        videos, shared = self._searches.do(key, self._search, query, max_results, params)
+        if shared:
+            self._count("coalesced")
+        return list(videos)
+
+    def _search(self, query, max_results, params):
+        if not self.configured:
+            raise YouTubeError("YouTube API key is not configured")
+
+        if not self.bucket.try_consume(SEARCH_QUOTA_COST):
+            self._count("throttled")
+            raise YouTubeQuotaError("Local YouTube quota budget exhausted")
+
+        search_params = {
+            "part": "snippet",
+            "q": query,
+            "type": "video",
+            "maxResults": max_results,
+            "key": self.api_key,
+        }
+        search_params.update(params)
+
+        self._count("requests")
+        self._count("quota_units_spent", SEARCH_QUOTA_COST)
+        try:
+            response = self.session.get(YOUTUBE_SEARCH_URL, params=search_params, timeout=self.timeout)
+        except requests.RequestException as e:
+            self._count("errors")
+            raise YouTubeError(f"YouTube request failed: {e}") from e
+
+        if response.status_code == 403 and "quotaExceeded" in response.text:
+            self._count("errors")
+            self.bucket.drain()
+            raise YouTubeQuotaError("YouTube API quota exceeded")
+        if response.status_code != 200:
+            self._count("errors")
+            raise YouTubeError(f"YouTube API returned HTTP {response.status_code}")
+
+        try:
+            items = response.json().get("items", [])
+        except ValueError as e:
+            self._count("errors")
+            raise YouTubeError("YouTube API returned invalid JSON") from e
+
+        videos = []
+        for item in items:
+            video_id = item.get("id", {}).get("videoId")
+            if not video_id:
+                continue
+            snippet = item.get("snippet", {})
+            videos.append({
+                "title": snippet.get("title", ""),
+                "channel": snippet.get("channelTitle", ""),
+                "video_id": video_id,
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+                "thumbnail": snippet.get("thumbnails", {}).get("medium", {}).get("url", ""),
+            })
+        return videos
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_youtube_client():
+    """Return the process-wide YouTube client"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = YouTubeClient()
+    return _client